@@ -25,6 +25,13 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata 
 
+
+def include_name(name, type_, parent_names):
+    # Full-text search objects are created by raw DDL, not from the metadata
+    if name and (name.startswith(app.core.models.FTS_TABLE) or name == app.core.models.PG_INDEX):
+        return False
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -47,6 +54,7 @@ def run_migrations_offline() -> None:
     context.configure(
     url=config.get_main_option("sqlalchemy.url"),
     target_metadata=Base.metadata,
+    include_name=include_name,
     literal_binds=True,
     dialect_opts={"paramstyle": "named"},
 )
@@ -70,7 +78,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=Base.metadata
+            connection=connection, target_metadata=Base.metadata, include_name=include_name
         )
 
         with context.begin_transaction():
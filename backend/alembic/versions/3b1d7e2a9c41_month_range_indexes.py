@@ -0,0 +1,30 @@
+"""month range indexes
+
+Revision ID: 3b1d7e2a9c41
+Revises: 0f8ca4a5eced
+Create Date: 2026-10-18 15:02:11.408213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b1d7e2a9c41'
+down_revision: Union[str, Sequence[str], None] = '0f8ca4a5eced'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_transactions_date_type', 'transactions', ['date', 'type'], unique=False)
+    op.create_index('ix_transactions_date_type_amount', 'transactions', ['date', 'type', 'amount'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_transactions_date_type_amount', table_name='transactions')
+    op.drop_index('ix_transactions_date_type', table_name='transactions')
@@ -0,0 +1,33 @@
+"""month versions
+
+Revision ID: 5d7e3f9a1c62
+Revises: c52a9d1f7e08
+Create Date: 2026-10-18 17:05:48.630271
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d7e3f9a1c62'
+down_revision: Union[str, Sequence[str], None] = 'c52a9d1f7e08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('month_versions',
+    sa.Column('month', sa.String(length=7), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('month')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('month_versions')
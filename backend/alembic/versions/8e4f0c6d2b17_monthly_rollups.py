@@ -0,0 +1,45 @@
+"""monthly rollups
+
+Revision ID: 8e4f0c6d2b17
+Revises: 3b1d7e2a9c41
+Create Date: 2026-10-18 15:40:52.117904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4f0c6d2b17'
+down_revision: Union[str, Sequence[str], None] = '3b1d7e2a9c41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('monthly_rollups',
+    sa.Column('month', sa.String(length=7), nullable=False),
+    sa.Column('type', sa.Enum('income', 'expense', name='transaction_type', native_enum=False), nullable=False),
+    sa.Column('category', sa.Enum('salary', 'carryover', 'groceries', 'eating_out', name='transaction_category', native_enum=False), nullable=False),
+    sa.Column('total', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('month', 'type', 'category')
+    )
+    # Backfill from existing rows
+    if op.get_bind().dialect.name == 'postgresql':
+        month = "to_char(date, 'YYYY-MM')"
+    else:
+        month = "strftime('%Y-%m', date)"
+    op.execute(
+        "INSERT INTO monthly_rollups (month, type, category, total, count) "
+        f"SELECT {month}, type, category, SUM(amount), COUNT(*) FROM transactions "
+        f"GROUP BY {month}, type, category"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('monthly_rollups')
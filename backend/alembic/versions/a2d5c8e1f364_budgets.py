@@ -0,0 +1,36 @@
+"""budgets
+
+Revision ID: a2d5c8e1f364
+Revises: f3a9c6e2d184
+Create Date: 2026-10-18 21:14:52.306718
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2d5c8e1f364'
+down_revision: Union[str, Sequence[str], None] = 'f3a9c6e2d184'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('budgets',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('account_id', sa.Integer(), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('limit_cents', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('account_id', 'category_id', name='uq_budgets_account_category')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('budgets')
@@ -0,0 +1,56 @@
+"""amount cents
+
+Revision ID: a7c3e91b4d25
+Revises: 5d7e3f9a1c62
+Create Date: 2026-10-18 18:12:09.417730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e91b4d25'
+down_revision: Union[str, Sequence[str], None] = '5d7e3f9a1c62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_transactions_date_type_amount', table_name='transactions')
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.add_column(sa.Column('amount_cents', sa.Integer(), nullable=True))
+    op.execute("UPDATE transactions SET amount_cents = CAST(ROUND(amount * 100) AS INTEGER)")
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.alter_column('amount_cents', existing_type=sa.Integer(), nullable=False)
+        batch_op.drop_column('amount')
+    op.create_index('ix_transactions_date_type_amount', 'transactions', ['date', 'type', 'amount_cents'], unique=False)
+
+    with op.batch_alter_table('monthly_rollups') as batch_op:
+        batch_op.add_column(sa.Column('total_cents', sa.BigInteger(), nullable=True))
+    op.execute("UPDATE monthly_rollups SET total_cents = CAST(ROUND(total * 100) AS BIGINT)")
+    with op.batch_alter_table('monthly_rollups') as batch_op:
+        batch_op.alter_column('total_cents', existing_type=sa.BigInteger(), nullable=False)
+        batch_op.drop_column('total')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('monthly_rollups') as batch_op:
+        batch_op.add_column(sa.Column('total', sa.Numeric(precision=14, scale=2), nullable=True))
+    op.execute("UPDATE monthly_rollups SET total = total_cents / 100.0")
+    with op.batch_alter_table('monthly_rollups') as batch_op:
+        batch_op.alter_column('total', existing_type=sa.Numeric(precision=14, scale=2), nullable=False)
+        batch_op.drop_column('total_cents')
+
+    op.drop_index('ix_transactions_date_type_amount', table_name='transactions')
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.add_column(sa.Column('amount', sa.Numeric(precision=12, scale=2), nullable=True))
+    op.execute("UPDATE transactions SET amount = amount_cents / 100.0")
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.alter_column('amount', existing_type=sa.Numeric(precision=12, scale=2), nullable=False)
+        batch_op.drop_column('amount_cents')
+    op.create_index('ix_transactions_date_type_amount', 'transactions', ['date', 'type', 'amount'], unique=False)
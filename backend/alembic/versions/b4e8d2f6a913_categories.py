@@ -0,0 +1,110 @@
+"""categories
+
+Revision ID: b4e8d2f6a913
+Revises: a7c3e91b4d25
+Create Date: 2026-10-18 19:03:41.208815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e8d2f6a913'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e91b4d25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DEFAULT_CATEGORIES = (
+    ("salary", "income"),
+    ("carryover", "income"),
+    ("groceries", "expense"),
+    ("eating_out", "expense"),
+)
+TYPE = sa.Enum('income', 'expense', name='transaction_type', native_enum=False)
+CATEGORY = sa.Enum('salary', 'carryover', 'groceries', 'eating_out', name='transaction_category', native_enum=False)
+
+
+def _month() -> str:
+    if op.get_bind().dialect.name == 'postgresql':
+        return "to_char(date, 'YYYY-MM')"
+    return "strftime('%Y-%m', date)"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    categories = op.create_table('categories',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('type', TYPE, nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.bulk_insert(categories, [{"name": n, "type": t} for n, t in DEFAULT_CATEGORIES])
+
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.add_column(sa.Column('category_id', sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE transactions SET category_id = "
+        "(SELECT id FROM categories WHERE categories.name = transactions.category)"
+    )
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.alter_column('category_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_foreign_key('fk_transactions_category_id', 'categories', ['category_id'], ['id'])
+        batch_op.drop_column('category')
+
+    # Rollups are derived data: recreate keyed by category id and refill
+    op.drop_table('monthly_rollups')
+    op.create_table('monthly_rollups',
+    sa.Column('month', sa.String(length=7), nullable=False),
+    sa.Column('type', TYPE, nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('total_cents', sa.BigInteger(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+    sa.PrimaryKeyConstraint('month', 'type', 'category_id')
+    )
+    op.execute(
+        "INSERT INTO monthly_rollups (month, type, category_id, total_cents, count) "
+        f"SELECT {_month()}, type, category_id, SUM(amount_cents), COUNT(*) FROM transactions "
+        f"GROUP BY {_month()}, type, category_id"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Transactions in categories added since cannot be represented by the old enum
+    custom = op.get_bind().execute(sa.text(
+        "SELECT COUNT(*) FROM transactions WHERE category_id NOT IN "
+        "(SELECT id FROM categories WHERE name IN ('salary', 'carryover', 'groceries', 'eating_out'))"
+    )).scalar()
+    if custom:
+        raise RuntimeError(f"{custom} transactions use custom categories; move or delete them first")
+    op.drop_table('monthly_rollups')
+    op.create_table('monthly_rollups',
+    sa.Column('month', sa.String(length=7), nullable=False),
+    sa.Column('type', TYPE, nullable=False),
+    sa.Column('category', CATEGORY, nullable=False),
+    sa.Column('total_cents', sa.BigInteger(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('month', 'type', 'category')
+    )
+
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.add_column(sa.Column('category', CATEGORY, nullable=True))
+    op.execute(
+        "UPDATE transactions SET category = "
+        "(SELECT name FROM categories WHERE categories.id = transactions.category_id)"
+    )
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.alter_column('category', existing_type=CATEGORY, nullable=False)
+        batch_op.drop_constraint('fk_transactions_category_id', type_='foreignkey')
+        batch_op.drop_column('category_id')
+    op.execute(
+        "INSERT INTO monthly_rollups (month, type, category, total_cents, count) "
+        f"SELECT {_month()}, type, category, SUM(amount_cents), COUNT(*) FROM transactions "
+        f"GROUP BY {_month()}, type, category"
+    )
+    op.drop_table('categories')
@@ -0,0 +1,44 @@
+"""recurring rules
+
+Revision ID: b7e2f4a9d130
+Revises: a2d5c8e1f364
+Create Date: 2026-10-18 22:03:41.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2f4a9d130'
+down_revision: Union[str, Sequence[str], None] = 'a2d5c8e1f364'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('recurring_rules',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('account_id', sa.Integer(), nullable=False),
+    sa.Column('type', sa.Enum('income', 'expense', name='transaction_type', native_enum=False), nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('amount_cents', sa.Integer(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('frequency', sa.Enum('monthly', 'weekly', 'custom', name='recurring_frequency', native_enum=False), nullable=False),
+    sa.Column('every', sa.Integer(), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=True),
+    sa.Column('materialized_through', sa.Date(), nullable=True),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_recurring_rules_account_id'), 'recurring_rules', ['account_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_recurring_rules_account_id'), table_name='recurring_rules')
+    op.drop_table('recurring_rules')
@@ -0,0 +1,32 @@
+"""transaction content hash
+
+Revision ID: c52a9d1f7e08
+Revises: 8e4f0c6d2b17
+Create Date: 2026-10-18 16:21:37.552019
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c52a9d1f7e08'
+down_revision: Union[str, Sequence[str], None] = '8e4f0c6d2b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_index('ix_transactions_content_hash', 'transactions', ['content_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_transactions_content_hash', table_name='transactions')
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.drop_column('content_hash')
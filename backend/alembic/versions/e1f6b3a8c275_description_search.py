@@ -0,0 +1,58 @@
+"""description search
+
+Revision ID: e1f6b3a8c275
+Revises: b4e8d2f6a913
+Create Date: 2026-10-18 19:48:22.563104
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f6b3a8c275'
+down_revision: Union[str, Sequence[str], None] = 'b4e8d2f6a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_UPGRADE = (
+    "CREATE VIRTUAL TABLE transactions_fts USING fts5("
+    "description, content='transactions', content_rowid='id', tokenize='porter unicode61')",
+    "CREATE TRIGGER transactions_fts_ai AFTER INSERT ON transactions BEGIN "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); END",
+    "CREATE TRIGGER transactions_fts_ad AFTER DELETE ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) VALUES ('delete', old.id, old.description); END",
+    "CREATE TRIGGER transactions_fts_au AFTER UPDATE OF description ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) VALUES ('delete', old.id, old.description); "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); END",
+    # Index the rows that already exist
+    "INSERT INTO transactions_fts(transactions_fts) VALUES ('rebuild')",
+)
+SQLITE_DOWNGRADE = (
+    "DROP TRIGGER transactions_fts_au",
+    "DROP TRIGGER transactions_fts_ad",
+    "DROP TRIGGER transactions_fts_ai",
+    "DROP TABLE transactions_fts",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "CREATE INDEX ix_transactions_description_tsv ON transactions "
+            "USING gin (to_tsvector('english', coalesce(description, '')))"
+        )
+        return
+    for statement in SQLITE_UPGRADE:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_transactions_description_tsv', table_name='transactions')
+        return
+    for statement in SQLITE_DOWNGRADE:
+        op.execute(statement)
@@ -0,0 +1,166 @@
+"""accounts
+
+Revision ID: f3a9c6e2d184
+Revises: e1f6b3a8c275
+Create Date: 2026-10-18 20:31:07.482916
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c6e2d184'
+down_revision: Union[str, Sequence[str], None] = 'e1f6b3a8c275'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TYPE = sa.Enum('income', 'expense', name='transaction_type', native_enum=False)
+# Names the unnamed unique constraint on categories.name when SQLite batch mode reflects it
+NAMING = {"uq": "uq_%(table_name)s_%(column_0_name)s"}
+# Rebuilding `transactions` on SQLite drops its triggers, including the search index's
+SQLITE_TRIGGERS = (
+    "CREATE TRIGGER transactions_fts_ai AFTER INSERT ON transactions BEGIN "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); END",
+    "CREATE TRIGGER transactions_fts_ad AFTER DELETE ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) VALUES ('delete', old.id, old.description); END",
+    "CREATE TRIGGER transactions_fts_au AFTER UPDATE OF description ON transactions BEGIN "
+    "INSERT INTO transactions_fts(transactions_fts, rowid, description) VALUES ('delete', old.id, old.description); "
+    "INSERT INTO transactions_fts(rowid, description) VALUES (new.id, new.description); END",
+)
+OLD_INDEXES = (
+    ('ix_transactions_date_type', ['date', 'type'], False),
+    ('ix_transactions_date_type_amount', ['date', 'type', 'amount_cents'], False),
+    ('ix_transactions_content_hash', ['content_hash'], True),
+)
+NEW_INDEXES = (
+    ('ix_transactions_account_date_type', ['account_id', 'date', 'type'], False),
+    ('ix_transactions_account_date_type_amount', ['account_id', 'date', 'type', 'amount_cents'], False),
+    ('ix_transactions_account_content_hash', ['account_id', 'content_hash'], True),
+)
+
+
+def _is_sqlite() -> bool:
+    return op.get_bind().dialect.name == 'sqlite'
+
+
+def _month() -> str:
+    if op.get_bind().dialect.name == 'postgresql':
+        return "to_char(date, 'YYYY-MM')"
+    return "strftime('%Y-%m', date)"
+
+
+def _name_unique() -> str:
+    return 'uq_categories_name' if _is_sqlite() else 'categories_name_key'
+
+
+def _add_account_id(table: str) -> None:
+    with op.batch_alter_table(table) as batch_op:
+        batch_op.add_column(sa.Column('account_id', sa.Integer(), nullable=True))
+    op.execute(f"UPDATE {table} SET account_id = 1")
+
+
+def _rollups_table(with_account: bool) -> None:
+    op.create_table('monthly_rollups',
+    *([sa.Column('account_id', sa.Integer(), nullable=False)] if with_account else []),
+    sa.Column('month', sa.String(length=7), nullable=False),
+    sa.Column('type', TYPE, nullable=False),
+    sa.Column('category_id', sa.Integer(), nullable=False),
+    sa.Column('total_cents', sa.BigInteger(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id']),
+    sa.PrimaryKeyConstraint(*(['account_id'] if with_account else []), 'month', 'type', 'category_id')
+    )
+    account = "account_id, " if with_account else ""
+    op.execute(
+        f"INSERT INTO monthly_rollups ({account}month, type, category_id, total_cents, count) "
+        f"SELECT {account}{_month()}, type, category_id, SUM(amount_cents), COUNT(*) FROM transactions "
+        f"GROUP BY {account}{_month()}, type, category_id"
+    )
+
+
+def _versions_table(with_account: bool) -> None:
+    op.rename_table('month_versions', 'month_versions_old')
+    op.create_table('month_versions',
+    *([sa.Column('account_id', sa.Integer(), nullable=False)] if with_account else []),
+    sa.Column('month', sa.String(length=7), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint(*(['account_id'] if with_account else []), 'month')
+    )
+    account = "1, " if with_account else ""
+    op.execute(
+        f"INSERT INTO month_versions ({'account_id, ' if with_account else ''}month, version, updated_at) "
+        f"SELECT {account}month, version, updated_at FROM month_versions_old"
+    )
+    op.drop_table('month_versions_old')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    accounts = op.create_table('accounts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('key_hash', sa.String(length=64), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_accounts_key_hash', 'accounts', ['key_hash'], unique=True)
+    # The first row gets id 1: everything that exists belongs to the default account
+    op.bulk_insert(accounts, [{"name": "default"}])
+
+    _add_account_id('categories')
+    with op.batch_alter_table('categories', naming_convention=NAMING) as batch_op:
+        batch_op.alter_column('account_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.drop_constraint(_name_unique(), type_='unique')
+        batch_op.create_unique_constraint('uq_categories_account_name', ['account_id', 'name'])
+
+    for name, _, _ in OLD_INDEXES:
+        op.drop_index(name, table_name='transactions')
+    _add_account_id('transactions')
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.alter_column('account_id', existing_type=sa.Integer(), nullable=False)
+    for name, columns, unique in NEW_INDEXES:
+        op.create_index(name, 'transactions', columns, unique=unique)
+    if _is_sqlite():
+        for statement in SQLITE_TRIGGERS:
+            op.execute(statement)
+
+    # Rollups are derived data: recreate keyed by account and refill
+    op.drop_table('monthly_rollups')
+    _rollups_table(with_account=True)
+    _versions_table(with_account=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Without the column, other accounts' rows would silently merge into one household
+    others = op.get_bind().execute(sa.text(
+        "SELECT (SELECT COUNT(*) FROM transactions WHERE account_id != 1)"
+        " + (SELECT COUNT(*) FROM categories WHERE account_id != 1)"
+    )).scalar()
+    if others:
+        raise RuntimeError(f"{others} transactions/categories belong to other accounts; remove them first")
+    _versions_table(with_account=False)
+    op.drop_table('monthly_rollups')
+    _rollups_table(with_account=False)
+
+    for name, _, _ in NEW_INDEXES:
+        op.drop_index(name, table_name='transactions')
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.drop_column('account_id')
+    for name, columns, unique in OLD_INDEXES:
+        op.create_index(name, 'transactions', columns, unique=unique)
+    if _is_sqlite():
+        for statement in SQLITE_TRIGGERS:
+            op.execute(statement)
+
+    with op.batch_alter_table('categories') as batch_op:
+        batch_op.drop_constraint('uq_categories_account_name', type_='unique')
+        batch_op.drop_column('account_id')
+        batch_op.create_unique_constraint(_name_unique(), ['name'])
+
+    op.drop_index('ix_accounts_key_hash', table_name='accounts')
+    op.drop_table('accounts')
@@ -0,0 +1,26 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core import analytics, schemas, utils
+from app.core.dependencies import get_month_range, get_session, require_api_key, run_db
+
+router = APIRouter(
+    prefix="/api/v1/analytics",
+    tags=["analytics"],
+    dependencies=[Depends(require_api_key)],
+    responses={401: {"description": "Invalid API key"}}
+)
+
+
+@router.get("/", response_model=schemas.Analytics)
+async def trends(
+    months: tuple[date, date] = Depends(get_month_range),
+    top: int = Query(5, ge=1, le=50, description="How many top expense categories to name"),
+    db: AsyncSession | Session = Depends(get_session),
+):
+    first, last = months
+    if first < analytics.EARLIEST:
+        raise HTTPException(status_code=400, detail=f"`from` must not be before {utils.month_str(analytics.EARLIEST)}")
+    return await run_db(db, analytics.trends, first, last, top)
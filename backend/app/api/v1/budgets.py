@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core import accounts, budgets, categories, crud, live, schemas, utils
+from app.core.dependencies import get_session, require_api_key, run_db
+
+router = APIRouter(
+    prefix="/api/v1/budgets",
+    tags=["budgets"],
+    dependencies=[Depends(require_api_key)],
+    responses={401: {"description": "Invalid API key"}}
+)
+
+
+@router.get("/", response_model=list[schemas.BudgetRead])
+async def list_budgets(db: AsyncSession | Session = Depends(get_session)):
+    return await run_db(db, crud.list_budgets)
+
+
+@router.get("/status", response_model=list[schemas.BudgetStatus])
+async def budget_status(month: str | None = Query(None), db: AsyncSession | Session = Depends(get_session)):
+    """Spent and remaining per budget for a month; reads the running totals, not the transactions."""
+    return await run_db(db, budgets.status, utils.parse_month(month))
+
+
+@router.post("/", response_model=schemas.BudgetRead, status_code=status.HTTP_201_CREATED)
+async def create_budget(payload: schemas.BudgetCreate, db: AsyncSession | Session = Depends(get_session)):
+    try:
+        obj = await run_db(db, crud.create_budget, payload.to_row())
+    except (categories.UnknownCategory, categories.NotAnExpense) as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    # Open dashboards list the budgets; a new, changed or removed one needs them rendered again
+    live.publish_account(accounts.current(db), live.RELOAD)
+    return obj
+
+
+@router.put("/{budget_id}", response_model=schemas.BudgetRead)
+async def update_budget(
+    budget_id: int, payload: schemas.BudgetUpdate, db: AsyncSession | Session = Depends(get_session)
+):
+    obj = await run_db(db, crud.update_budget, budget_id, utils.to_cents(payload.limit))
+    if not obj:
+        raise HTTPException(status_code=404, detail="Budget not found")
+    live.publish_account(accounts.current(db), live.RELOAD)
+    return obj
+
+
+@router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_budget(budget_id: int, db: AsyncSession | Session = Depends(get_session)):
+    if not await run_db(db, crud.delete_budget, budget_id):
+        raise HTTPException(status_code=404, detail="Budget not found")
+    live.publish_account(accounts.current(db), live.RELOAD)
+    return None
@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core import accounts, categories, crud, live, schemas
+from app.core.dependencies import get_session, require_api_key, run_db
+
+router = APIRouter(
+    prefix="/api/v1/categories",
+    tags=["categories"],
+    dependencies=[Depends(require_api_key)],
+    responses={401: {"description": "Invalid API key"}}
+)
+
+
+@router.get("/", response_model=list[schemas.CategoryRead])
+async def list_categories(db: AsyncSession | Session = Depends(get_session)):
+    return await run_db(db, categories.get_all)
+
+
+@router.post("/", response_model=schemas.CategoryRead, status_code=status.HTTP_201_CREATED)
+async def create_category(payload: schemas.CategoryCreate, db: AsyncSession | Session = Depends(get_session)):
+    try:
+        obj = await run_db(db, crud.create_category, payload.model_dump())
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    return obj
+
+
+@router.put("/{category_id}", response_model=schemas.CategoryRead)
+async def update_category(
+    category_id: int, payload: schemas.CategoryUpdate, db: AsyncSession | Session = Depends(get_session)
+):
+    data = payload.model_dump(exclude_unset=True)
+    try:
+        obj = await run_db(db, crud.update_category, category_id, data)
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    if not obj:
+        raise HTTPException(status_code=404, detail="Category not found")
+    if "name" in data:
+        # Every open month may show the old name
+        live.publish_account(accounts.current(db), live.RELOAD)
+    return obj
+
+
+@router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_category(category_id: int, db: AsyncSession | Session = Depends(get_session)):
+    try:
+        deleted = await run_db(db, crud.delete_category, category_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Category not found")
+    return None
@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core import accounts, categories, crud, live, recurring, schemas, utils
+from app.core.dependencies import get_session, require_api_key, run_db
+
+router = APIRouter(
+    prefix="/api/v1/recurring",
+    tags=["recurring"],
+    dependencies=[Depends(require_api_key)],
+    responses={401: {"description": "Invalid API key"}}
+)
+
+
+@router.get("/", response_model=list[schemas.RecurringRead])
+async def list_rules(db: AsyncSession | Session = Depends(get_session)):
+    return await run_db(db, crud.list_rules)
+
+
+@router.post("/", response_model=schemas.RecurringRead, status_code=status.HTTP_201_CREATED)
+async def create_rule(payload: schemas.RecurringCreate, db: AsyncSession | Session = Depends(get_session)):
+    try:
+        return await run_db(db, crud.create_rule, payload.to_row())
+    except categories.UnknownCategory as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+
+@router.post("/materialize")
+async def materialize(
+    through: str = Query(..., description="Create occurrences up to the end of this month, YYYY-MM"),
+    db: AsyncSession | Session = Depends(get_session),
+):
+    _, end = utils.month_bounds(utils.parse_month(through))
+    inserted = await run_db(db, recurring.materialize, end)
+    if inserted:
+        live.publish_account(accounts.current(db), live.RELOAD)
+    return {"inserted": inserted}
+
+
+@router.put("/{rule_id}", response_model=schemas.RecurringRead)
+async def update_rule(rule_id: int, payload: schemas.RecurringUpdate, db: AsyncSession | Session = Depends(get_session)):
+    try:
+        obj = await run_db(db, crud.update_rule, rule_id, payload.to_row())
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    if not obj:
+        raise HTTPException(status_code=404, detail="Recurring rule not found")
+    return obj
+
+
+@router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_rule(rule_id: int, db: AsyncSession | Session = Depends(get_session)):
+    if not await run_db(db, crud.delete_rule, rule_id):
+        raise HTTPException(status_code=404, detail="Recurring rule not found")
+    return None
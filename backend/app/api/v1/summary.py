@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Query, Depends
+from datetime import date
+
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.core import utils, models, schemas
-from app.core.dependencies import get_db, require_api_key
+from app.core import utils, schemas, versions
+from app.core.dependencies import get_month_range, get_session, require_api_key, run_db
+from app.core.summary import cached_month_totals, range_totals
 
 router = APIRouter(
     prefix="/api/v1/summary", 
@@ -13,27 +16,41 @@ router = APIRouter(
 
 
 @router.get("/", response_model=schemas.Summary, dependencies=[Depends(require_api_key)])
-def month_summary(month: str | None = Query(None), db: Session = Depends(get_db)):
+async def month_summary(
+    request: Request,
+    response: Response,
+    month: str | None = Query(None),
+    db: AsyncSession | Session = Depends(get_session),
+):
     first = utils.parse_month(month)
-    start, end = utils.month_bounds(first)
-    income = (
-        db.query(func.coalesce(func.sum(models.Transaction.amount), 0))
-        .filter(
-            models.Transaction.type == "income",
-            models.Transaction.date.between(start, end),
-        )
-        .scalar()
-        or 0
-    )
-    expenses = (
-        db.query(func.coalesce(func.sum(models.Transaction.amount), 0))
-        .filter(
-            models.Transaction.type == "expense",
-            models.Transaction.date.between(start, end),
-        )
-        .scalar()
-        or 0
-    )
-    return schemas.Summary(
-        income=float(income), expenses=float(expenses), net=float(income) - float(expenses)
-    )
+    version = await run_db(db, versions.get, utils.month_str(first))
+    headers = versions.headers(request, version)
+    if versions.not_modified(request, version):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return (await run_db(db, cached_month_totals, first, version)).to_schema()
+
+
+@router.get("/range", response_model=list[schemas.MonthSummary], dependencies=[Depends(require_api_key)])
+async def range_summary(
+    months: tuple[date, date] = Depends(get_month_range),
+    by_category: bool = Query(False, description="Include per-category totals"),
+    yoy: bool = Query(False, description="Attach the same month one year earlier"),
+    db: AsyncSession | Session = Depends(get_session),
+):
+    first, last = months
+    if yoy and first.year == 1:
+        raise HTTPException(status_code=400, detail="`from` must not be before 0002-01 with `yoy`")
+    query_first = date(first.year - 1, first.month, 1) if yoy else first
+    series = await run_db(db, range_totals, query_first, last)
+
+    result = []
+    for key, totals in series.items():
+        if key < utils.month_str(first):
+            continue
+        point = schemas.MonthSummary(month=key, **totals.to_schema(by_category).model_dump())
+        if yoy:
+            y, m = (int(x) for x in key.split("-"))
+            point.previous_year = series[f"{y - 1:04d}-{m:02d}"].to_schema(by_category)
+        result.append(point)
+    return result
@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import base64
+import json
+from datetime import date
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.dependencies import get_db, require_api_key
-from app.core import models, schemas, utils
+from app.core.dependencies import get_db, get_session, require_api_key, run_db
+from app.core import accounts, budgets, bulk, categories, crud, export, live, recurring, schemas, search, utils, versions
 
 router = APIRouter(
     prefix="/api/v1/transactions", 
@@ -11,47 +18,235 @@ router = APIRouter(
 )
 
 
+def _encode_cursor(tx_date: date, tx_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{tx_date.isoformat()}|{tx_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[date, int]:
+    try:
+        raw_date, raw_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return date.fromisoformat(raw_date), int(raw_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _field(row, name: str, account_id: int):
+    if name == "amount":
+        return str(utils.from_cents(row.amount_cents))
+    if name == "category":
+        return categories.name(row.category_id, account_id=account_id)
+    value = getattr(row, name)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
 @router.get("/", response_model=list[schemas.TransactionRead], dependencies=[Depends(require_api_key)])
-def list_transactions(month: str | None = Query(None), db: Session = Depends(get_db)):
+async def list_transactions(
+    request: Request,
+    response: Response,
+    month: str | None = Query(None),
+    limit: int = Query(500, ge=1, le=1000),
+    cursor: str | None = Query(None, description="Value of X-Next-Cursor from the previous page"),
+    fields: str | None = Query(None, description="Comma-separated columns to return, e.g. id,date,amount"),
+    db: AsyncSession | Session = Depends(get_session),
+):
     first = utils.parse_month(month)
     start, end = utils.month_bounds(first)
-    rows = (
-        db.query(models.Transaction)
-        .filter(models.Transaction.date.between(start, end))
-        .order_by(models.Transaction.date.desc())
-        .all()
-    )
+    # Recurring rules fill in the month the first time it is listed; a no-op query afterwards.
+    # Months past the horizon are listed without creating anything.
+    if end <= recurring.horizon() and await run_db(db, recurring.materialize, end):
+        live.publish_account(accounts.current(db), live.RELOAD)
+    # Read the version before the rows, so a concurrent write can never be labelled as unchanged
+    version = await run_db(db, versions.get, utils.month_str(first))
+    headers = versions.headers(request, version)
+    if versions.not_modified(request, version):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    columns = names = None
+    if fields:
+        names = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [n for n in names if n not in schemas.TransactionRead.model_fields]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+        # date and id are always needed to build the next cursor
+        columns = list(dict.fromkeys(["date", "id", *names]))
+    after = _decode_cursor(cursor) if cursor else None
+    rows = await run_db(db, crud.list_month, start, end, limit, after, columns)
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        headers["X-Next-Cursor"] = _encode_cursor(rows[-1].date, rows[-1].id)
+
+    if columns:
+        account_id = accounts.current(db)
+        body = [{n: _field(row, n, account_id) for n in names} for row in rows]
+        return JSONResponse(body, headers=headers)
+    response.headers.update(headers)
+    return rows
+
+
+@router.get("/search", response_model=list[schemas.TransactionRead], dependencies=[Depends(require_api_key)])
+async def search_transactions(
+    response: Response,
+    q: str = Query(..., min_length=1, description="Words to find in descriptions; each matches as a prefix"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession | Session = Depends(get_session),
+):
+    """Transactions whose description contains every word of `q`, best match first.
+
+    Matches are found through the full-text index, so the cost grows with the number of
+    matches rather than the length of the history.
+    """
+    rows = await run_db(db, search.search, q, limit, offset)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Offset"] = str(offset + limit)
     return rows
 
 
+@router.get("/export", dependencies=[Depends(require_api_key)], response_class=StreamingResponse)
+def export_transactions(
+    from_: str | None = Query(None, alias="from", description="First month, YYYY-MM (default: earliest)"),
+    to: str | None = Query(None, description="Last month, YYYY-MM (default: latest)"),
+    format: Literal["csv", "ndjson"] = Query("csv"),
+    db: Session = Depends(get_db),
+):
+    """Stream transactions in a month range without loading them into memory.
+
+    Always runs on the sync engine: rows are pulled from a server-side cursor while the
+    response is being sent, which the threadpool handles for sync generators.
+    """
+    start = utils.parse_month(from_) if from_ else None
+    end = utils.month_bounds(utils.parse_month(to))[1] if to else None
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail="`from` must not be after `to`")
+    generate, media_type = export.FORMATS[format]
+    filename = f"transactions.{format}"
+    return StreamingResponse(
+        generate(db, start, end),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.post("/", response_model=schemas.TransactionRead, status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_api_key)])
-def create_transaction(payload: schemas.TransactionCreate, db: Session = Depends(get_db)):
-    obj = models.Transaction(**payload.model_dump())
-    db.add(obj)
-    db.commit()
-    db.refresh(obj)
+async def create_transaction(
+    payload: schemas.TransactionCreate, response: Response, db: AsyncSession | Session = Depends(get_session)
+):
+    try:
+        obj = await run_db(db, crud.create_transaction, payload.to_row())
+    except categories.UnknownCategory as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+    await _budget_alert(db, obj, response)
+    await _push(db, obj.date, "upsert", row=obj)
     return obj
 
 
+async def _push(db, day: date, op: str, **data) -> None:
+    """Send a row change and the month's new totals to the pages showing the month of `day`."""
+    key = accounts.scoped(db, utils.month_str(day))
+    if live.watching(key):
+        live.publish(key, await run_db(db, live.month_event, day, op, **data))
+
+
+async def _date_before(db, tx_id: int) -> date | None:
+    """A row's date ahead of changing it, when pages of the account are open to tell."""
+    if live.watching_account(accounts.current(db)):
+        return await run_db(db, live.date_of, tx_id)
+    return None
+
+
+async def _budget_alert(db, obj, response: Response, previous: tuple | None = None) -> None:
+    """Name the category in X-Budget-Alert if this write pushed it over its monthly budget."""
+    over = await run_db(db, budgets.alerts, obj, previous)
+    if over:
+        response.headers["X-Budget-Alert"] = ", ".join(over)
+
+
+async def _ndjson_lines(request: Request):
+    buffer = b""
+    async for part in request.stream():
+        buffer += part
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+
+@router.post(
+    "/bulk",
+    response_model=schemas.BulkResult,
+    dependencies=[Depends(require_api_key)],
+    openapi_extra={"requestBody": {"content": {
+        "application/json": {"schema": {"type": "array", "items": schemas.TransactionCreate.model_json_schema()}},
+        "application/x-ndjson": {"schema": {"type": "string"}},
+    }}},
+)
+async def bulk_create_transactions(request: Request, db: AsyncSession | Session = Depends(get_session)):
+    """Insert many transactions from a JSON array or an NDJSON stream (`application/x-ndjson`).
+
+    Rows are written in chunked transactions; invalid rows are reported by index and skipped.
+    """
+    if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+        result = schemas.BulkResult()
+        items, offset, index = [], 0, 0
+        async for line in _ndjson_lines(request):
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                # Keep the index aligned with the line number; validation reports the bad row
+                items.append(None)
+            index += 1
+            if len(items) >= bulk.CHUNK_SIZE:
+                part = await run_db(db, bulk.import_rows, items, start=offset)
+                result.inserted += part.inserted
+                result.errors.extend(part.errors)
+                items, offset = [], index
+        part = await run_db(db, bulk.import_rows, items, start=offset)
+        result.inserted += part.inserted
+        result.errors.extend(part.errors)
+    else:
+        try:
+            items = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Body must be a JSON array")
+        if not isinstance(items, list):
+            raise HTTPException(status_code=400, detail="Body must be a JSON array")
+        result = await run_db(db, bulk.import_rows, items)
+    if result.inserted:
+        # Too many rows to send one by one; open pages fetch the month again
+        live.publish_account(accounts.current(db), live.RELOAD)
+    return result
+
+
 @router.put("/{tx_id}", response_model=schemas.TransactionRead, dependencies=[Depends(require_api_key)])
-def update_transaction(tx_id: int, payload: schemas.TransactionUpdate, db: Session = Depends(get_db)):
-    obj = db.get(models.Transaction, tx_id)
+async def update_transaction(
+    tx_id: int, payload: schemas.TransactionUpdate, response: Response, db: AsyncSession | Session = Depends(get_session)
+):
+    before = await _date_before(db, tx_id)
+    previous = await run_db(db, budgets.counted, tx_id)
+    try:
+        obj = await run_db(db, crud.update_transaction, tx_id, payload.to_row())
+    except categories.UnknownCategory as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
     if not obj:
         raise HTTPException(status_code=404, detail="Transaction not found")
-    update_data = payload.model_dump(exclude_unset=True)
-    for k, v in update_data.items():
-        setattr(obj, k, v)
-    db.add(obj)
-    db.commit()
-    db.refresh(obj)
+    await _budget_alert(db, obj, response, previous)
+    if before and utils.month_str(before) != utils.month_str(obj.date):
+        await _push(db, before, "delete", id=tx_id)
+    await _push(db, obj.date, "upsert", row=obj)
     return obj
 
 
 @router.delete("/{tx_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(require_api_key)])
-def delete_transaction(tx_id: int, db: Session = Depends(get_db)):
-    obj = db.get(models.Transaction, tx_id)
-    if not obj:
+async def delete_transaction(tx_id: int, db: AsyncSession | Session = Depends(get_session)):
+    before = await _date_before(db, tx_id)
+    if not await run_db(db, crud.delete_transaction, tx_id):
         raise HTTPException(status_code=404, detail="Transaction not found")
-    db.delete(obj)
-    db.commit()
+    if before:
+        await _push(db, before, "delete", id=tx_id)
     return None
@@ -0,0 +1,98 @@
+"""Accounts and the per-request account scope.
+
+A session belongs to one account, recorded in `Session.info` (see `bind`). Everything
+in `app.core` that reads or writes data filters on `current(db)`, and per-month state
+shared across accounts (the result cache, change notices) is keyed with `scoped`.
+Sessions that were never bound act for DEFAULT_ACCOUNT, which keeps scripts and a
+single-household install working unchanged.
+"""
+import hashlib
+import secrets
+import threading
+import time
+
+from sqlalchemy.orm import Session
+
+from app.core import config, database, models
+
+DEFAULT_ACCOUNT = models.DEFAULT_ACCOUNT
+_KEY = "account_id"
+
+_lock = threading.Lock()
+# sha256 of a key -> (account id, monotonic time it was verified)
+_keys: dict[str, tuple[int, float]] = {}
+
+
+def bind(db, account_id: int):
+    """Scope a session (sync or async) to an account; returns it for chaining."""
+    db.info[_KEY] = account_id
+    return db
+
+
+def current(db) -> int:
+    return db.info.get(_KEY, DEFAULT_ACCOUNT)
+
+
+def scoped(db, month: str) -> str:
+    """Key for a month of the session's account, e.g. `3:2025-09`."""
+    return f"{current(db)}:{month}"
+
+
+def session(account_id: int = DEFAULT_ACCOUNT) -> Session:
+    """A new session on the account's storage (its own file with ACCOUNT_DB_DIR), bound to it."""
+    if config.ACCOUNT_DB_DIR:
+        return bind(database.AccountSessionLocal(account_id), account_id)
+    return bind(database.SessionLocal(), account_id)
+
+
+def hash_key(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def authenticate(key: str) -> int | None:
+    """The account owning an API key, or None.
+
+    Verified keys are remembered for ACCOUNT_KEY_TTL seconds; unknown keys are looked up
+    every time, with a single indexed query against DATABASE_URL.
+    """
+    digest = hash_key(key)
+    hit = _keys.get(digest)
+    now = time.monotonic()
+    if hit is not None and now - hit[1] < config.ACCOUNT_KEY_TTL:
+        return hit[0]
+    with database.SessionLocal() as db:
+        account_id = db.query(models.Account.id).filter(models.Account.key_hash == digest).scalar()
+    with _lock:
+        if account_id is None:
+            _keys.pop(digest, None)
+        else:
+            _keys[digest] = (account_id, now)
+    return account_id
+
+
+def forget_keys() -> None:
+    with _lock:
+        _keys.clear()
+
+
+def issue_key(db: Session, account: models.Account) -> str:
+    """Give an account a new API key, replacing its old one. Commits; returns the key."""
+    key = secrets.token_urlsafe(32)
+    account.key_hash = hash_key(key)
+    db.commit()
+    # Other workers stop accepting the old key within ACCOUNT_KEY_TTL
+    forget_keys()
+    return key
+
+
+def create_account(db: Session, name: str) -> tuple[models.Account, str]:
+    """Add an account with its default categories. Returns it with its API key."""
+    account = models.Account(name=name)
+    db.add(account)
+    db.flush()
+    if not config.ACCOUNT_DB_DIR:
+        # Partitioned accounts get theirs when their file is created
+        db.execute(models.Category.__table__.insert(), models.default_categories(account.id))
+    key = issue_key(db, account)
+    db.refresh(account)
+    return account, key
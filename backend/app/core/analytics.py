@@ -0,0 +1,169 @@
+"""Trend statistics over a range of months, computed column-wise with NumPy.
+
+The input is the account's `monthly_rollups` rows for the range, loaded with one
+projected query into a `Snapshot` of parallel arrays (month index, category id, type,
+cents). Rollups are already one row per month, type and category, so the arrays stay
+small however many transactions the range holds. Snapshots are kept in-process and
+reused until the range's data version changes: the sum of its month versions, which
+every write to a month bumps.
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core import accounts, categories, config, models, schemas, utils
+
+R = models.MonthlyRollup
+V = models.MonthVersion
+WINDOWS = (3, 12)
+# Months loaded ahead of the range so rolling means are complete from its first month
+LEAD = max(WINDOWS) - 1
+
+_snapshots: "OrderedDict[tuple[int, str, str], tuple[tuple[int, int], Snapshot]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    months: list[str]  # oldest first; `month` holds indexes into it
+    month: Any  # int32 array
+    category: Any  # int64 array of category ids
+    expense: Any  # bool array
+    cents: Any  # int64 array
+
+
+def _shift(first: date, months: int) -> date:
+    index = first.year * 12 + first.month - 1 - months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+# First month whose lead months are all valid dates
+EARLIEST = _shift(date(1, 1, 1), -LEAD)
+
+
+def data_version(db: Session, start: str, stop: str) -> tuple[int, int]:
+    """Changes whenever a month from `start` to `stop` is written."""
+    number, count = (
+        db.query(func.coalesce(func.sum(V.version), 0), func.count())
+        .filter(V.account_id == accounts.current(db), V.month.between(start, stop))
+        .one()
+    )
+    return int(number), count
+
+
+def load(db: Session, start: str, stop: str) -> Snapshot:
+    import numpy as np  # imported on first use, like Jinja, to keep worker startup lean
+
+    months = utils.month_range(start, stop)
+    index = {month: i for i, month in enumerate(months)}
+    rows = (
+        db.query(R.month, R.category_id, R.type, R.total_cents)
+        .filter(R.account_id == accounts.current(db), R.month.between(start, stop))
+        .all()
+    )
+    month, category, tx_type, cents = zip(*rows) if rows else ((), (), (), ())
+    return Snapshot(
+        months=months,
+        month=np.fromiter((index[m] for m in month), dtype=np.int32, count=len(rows)),
+        category=np.array(category, dtype=np.int64),
+        expense=np.array([t == "expense" for t in tx_type], dtype=bool),
+        cents=np.array(cents, dtype=np.int64),
+    )
+
+
+def snapshot(db: Session, start: str, stop: str) -> Snapshot:
+    """The cached snapshot for the range if its data version still matches, else a fresh one."""
+    key = (accounts.current(db), start, stop)
+    version = data_version(db, start, stop)
+    with _lock:
+        cached = _snapshots.get(key)
+        if cached and cached[0] == version:
+            _snapshots.move_to_end(key)
+            return cached[1]
+    snap = load(db, start, stop)
+    with _lock:
+        _snapshots[key] = (version, snap)
+        _snapshots.move_to_end(key)
+        while len(_snapshots) > config.ANALYTICS_CACHE_SIZE:
+            _snapshots.popitem(last=False)
+    return snap
+
+
+def clear() -> None:
+    with _lock:
+        _snapshots.clear()
+
+
+def _trends(grid, lead: int) -> dict[str, Any]:
+    """Statistics for every row of a (series x month) cents matrix whose first `lead` months precede the range."""
+    import numpy as np
+
+    shown = grid[:, lead:]
+    padded = np.cumsum(np.pad(grid, ((0, 0), (1, 0))), axis=1)
+    result = {
+        "series": shown / 100,
+        "average": shown.mean(axis=1) / 100,
+        "total": shown.sum(axis=1) / 100,
+    }
+    for w in WINDOWS:
+        # Mean of the w months ending at each month of the range
+        result[f"rolling_{w}"] = (padded[:, lead + 1:] - padded[:, lead + 1 - w:-w]) / w / 100
+    previous = grid[:, lead - 1:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result["change_pct"] = np.where(previous != 0, (shown - previous) / previous * 100, np.nan)
+    return result
+
+
+def _round(values, digits: int = 2) -> list[float | None]:
+    return [None if v != v else round(float(v), digits) for v in values]
+
+
+def _trend(stats: dict[str, Any], row: int) -> dict:
+    return {
+        "series": _round(stats["series"][row]),
+        "average": round(float(stats["average"][row]), 2),
+        "change_pct": _round(stats["change_pct"][row], 1),
+        **{f"rolling_{w}": _round(stats[f"rolling_{w}"][row]) for w in WINDOWS},
+    }
+
+
+def trends(db: Session, first: date, last: date, top: int = 5) -> schemas.Analytics:
+    """Monthly totals, averages, rolling means and month-over-month change for the range
+    and for each category in it, plus the `top` expense categories by total."""
+    import numpy as np
+
+    snap = snapshot(db, utils.month_str(_shift(first, LEAD)), utils.month_str(last))
+    n = len(snap.months)
+
+    # One row per (category, type) that has data, then income and expense totals
+    keys, row = np.unique(snap.category * 2 + snap.expense, return_inverse=True)
+    grid = np.zeros((len(keys) + 2, n), dtype=np.int64)
+    np.add.at(grid, (row, snap.month), snap.cents)
+    np.add.at(grid, (len(keys) + snap.expense, snap.month), snap.cents)
+    stats = _trends(grid, LEAD)
+
+    category_ids = (keys // 2).tolist()
+    categories.ensure(db, set(category_ids))
+    by_category = [
+        schemas.CategoryTrend(
+            category=categories.name(category_id, db),
+            type="expense" if key % 2 else "income",
+            total=round(float(stats["total"][i]), 2),
+            **_trend(stats, i),
+        )
+        for i, (category_id, key) in enumerate(zip(category_ids, keys.tolist()))
+    ]
+    order = np.argsort(-stats["total"][:len(keys)], kind="stable")
+    ranked = [by_category[i] for i in order.tolist()]
+    return schemas.Analytics(
+        months=snap.months[LEAD:],
+        income=schemas.Trend(**_trend(stats, len(keys))),
+        expenses=schemas.Trend(**_trend(stats, len(keys) + 1)),
+        categories=sorted(by_category, key=lambda t: (t.type, t.category)),
+        top_categories=[t.category for t in ranked if t.type == "expense" and t.total > 0][:top],
+    )
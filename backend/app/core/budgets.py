@@ -0,0 +1,73 @@
+"""Monthly category budgets.
+
+The spend a budget is measured against is the expense total of its category in
+`monthly_rollups`, which every write already updates incrementally. Evaluating budgets
+is therefore a primary-key lookup per budget, however many transactions the month has.
+"""
+from datetime import date
+from typing import Iterable
+
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session
+
+from app.core import accounts, categories, models, schemas, utils
+
+B = models.Budget
+R = models.MonthlyRollup
+T = models.Transaction
+
+
+def status(db: Session, first: date, category_ids: Iterable[int] | None = None) -> list[schemas.BudgetStatus]:
+    """Spend against each budget of the account in the month of `first`, by category name."""
+    spent = func.coalesce(R.total_cents, 0)
+    query = (
+        db.query(B.category_id, B.limit_cents, spent)
+        .outerjoin(R, and_(
+            R.account_id == B.account_id,
+            R.month == utils.month_str(first),
+            R.type == "expense",
+            R.category_id == B.category_id,
+        ))
+        .filter(B.account_id == accounts.current(db))
+    )
+    if category_ids is not None:
+        query = query.filter(B.category_id.in_(list(category_ids)))
+    rows = query.all()
+    categories.ensure(db, {category_id for category_id, _, _ in rows})
+    result = [
+        schemas.BudgetStatus(
+            category=categories.name(category_id, db),
+            limit=utils.from_cents(limit_cents),
+            spent=utils.from_cents(spent_cents),
+            remaining=utils.from_cents(limit_cents - spent_cents),
+            over=spent_cents > limit_cents,
+        )
+        for category_id, limit_cents, spent_cents in rows
+    ]
+    return sorted(result, key=lambda s: s.category)
+
+
+def counted(db: Session, tx_id: int) -> tuple | None:
+    """What a transaction adds to the rollups, (date, type, category_id, amount_cents), read
+    ahead of updating it so `alerts` can tell what the update changed."""
+    return (
+        db.query(T.date, T.type, T.category_id, T.amount_cents)
+        .filter(T.id == tx_id, T.account_id == accounts.current(db))
+        .first()
+    )
+
+
+def alerts(db: Session, tx: models.Transaction, previous: tuple | None = None) -> list[str]:
+    """Categories a just-written transaction pushed over budget (at most its own): over
+    now, but not without this write. `previous` is `counted` ahead of an update."""
+    if tx.type != "expense":
+        return []
+    added = tx.amount_cents
+    if previous is not None:
+        day, tx_type, category_id, cents = previous
+        if (tx_type, category_id, utils.month_str(day)) == ("expense", tx.category_id, utils.month_str(tx.date)):
+            added -= cents
+    return [
+        s.category for s in status(db, tx.date, [tx.category_id])
+        if s.over and s.spent - utils.from_cents(added) <= s.limit
+    ]
@@ -0,0 +1,161 @@
+import csv
+import hashlib
+from collections import Counter
+from typing import IO, Iterable, Iterator
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core import accounts, categories, models, rollups, schemas, utils
+from app.core.database import dialect_insert
+
+CHUNK_SIZE = 1000
+
+
+def validate_rows(items: Iterable, start: int = 0) -> Iterator[tuple[int, dict | None, list | None]]:
+    """Yield (index, row, errors) for each raw item, validated with `TransactionCreate`.
+
+    Rows are column values ready to insert, with the amount in cents; the category is
+    still a name, see `resolve_category`.
+    """
+    for i, item in enumerate(items, start):
+        try:
+            yield i, schemas.TransactionCreate.model_validate(item).to_row(), None
+        except ValidationError as exc:
+            yield i, None, exc.errors(include_url=False, include_context=False)
+
+
+def resolve_category(db: Session, row: dict) -> list | None:
+    """Swap the row's category name for its id; errors shaped like validation errors if unknown."""
+    try:
+        categories.resolve(db, row)
+    except categories.UnknownCategory as exc:
+        return [{"type": "unknown_category", "loc": ["category"], "msg": str(exc), "input": row["category"]}]
+    return None
+
+
+def insert_chunk(db: Session, rows: list[tuple[int, dict]]) -> list[dict]:
+    """Insert validated (index, row) pairs in one transaction. Returns per-row errors."""
+    if not rows:
+        return []
+    account_id = accounts.current(db)
+    values = [{**row, "account_id": account_id} for _, row in rows]
+    try:
+        db.execute(insert(models.Transaction), values)
+        rollups.add_many(db, values)
+        db.commit()
+    except SQLAlchemyError as exc:
+        db.rollback()
+        detail = str(exc.orig) if getattr(exc, "orig", None) else str(exc)
+        return [{"index": i, "detail": detail} for i, _ in rows]
+    return []
+
+
+def import_rows(
+    db: Session, items: Iterable, chunk_size: int = CHUNK_SIZE, start: int = 0
+) -> schemas.BulkResult:
+    """Validate and insert raw items in chunked transactions, collecting errors instead of aborting.
+
+    `start` offsets the row indexes reported in errors, for callers feeding a stream piecewise.
+    """
+    result = schemas.BulkResult()
+    chunk: list[tuple[int, dict]] = []
+
+    def flush():
+        errors = insert_chunk(db, chunk)
+        result.inserted += len(chunk) - len(errors)
+        result.errors.extend(errors)
+        chunk.clear()
+
+    for i, row, errors in validate_rows(items, start):
+        errors = errors or resolve_category(db, row)
+        if errors:
+            result.errors.append({"index": i, "detail": errors})
+            continue
+        chunk.append((i, row))
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+    return result
+
+
+def content_hash(row: dict, occurrence: int = 0) -> str:
+    """Identity of a row's content; `occurrence` separates identical rows within one import.
+
+    Takes the category by name, so hashes survive category ids being renumbered.
+    """
+    key = "|".join((
+        row["date"].isoformat(),
+        row["type"],
+        row["category"],
+        # Formatted as the amount was before cents storage, so existing hashes still match
+        str(utils.from_cents(row["amount_cents"])),
+        row.get("description") or "",
+        str(occurrence),
+    ))
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def insert_new(db: Session, values: list[dict]) -> int:
+    """Insert rows that carry a `content_hash`, skipping hashes the account already has.
+
+    Runs in the caller's transaction and returns how many rows were actually inserted.
+    """
+    if not values:
+        return 0
+    T = models.Transaction
+    account_id = accounts.current(db)
+    values = [{**row, "account_id": account_id} for row in values]
+    stmt = (
+        dialect_insert(db)(T)
+        .on_conflict_do_nothing(index_elements=[T.account_id, T.content_hash])
+        .returning(T.date, T.type, T.category_id, T.amount_cents)
+    )
+    inserted = [row._asdict() for row in db.execute(stmt, values)]
+    rollups.add_many(db, inserted)
+    return len(inserted)
+
+
+def import_csv(db: Session, fileobj: IO[str], chunk_size: int = CHUNK_SIZE) -> schemas.BulkResult:
+    """Stream a CSV statement (date,type,category,amount,description) into `transactions`.
+
+    Each row is stored with its content hash, so importing an overlapping statement again
+    only adds the rows that are new. Errors are reported by CSV line number.
+    """
+    result = schemas.BulkResult()
+    seen: Counter = Counter()
+    chunk: list[dict] = []
+
+    def flush():
+        try:
+            inserted = insert_new(db, chunk)
+            db.commit()
+        except SQLAlchemyError as exc:
+            db.rollback()
+            result.errors.append({"index": None, "detail": str(getattr(exc, "orig", None) or exc)})
+        else:
+            result.inserted += inserted
+            result.duplicates += len(chunk) - inserted
+        chunk.clear()
+
+    reader = csv.DictReader(fileobj)
+    # Line 1 is the header
+    for line, row, errors in validate_rows(({k: v or None for k, v in r.items()} for r in reader), 2):
+        if errors:
+            result.errors.append({"index": line, "detail": errors})
+            continue
+        base = content_hash(row)
+        row_hash = content_hash(row, seen[base])
+        errors = resolve_category(db, row)
+        if errors:
+            result.errors.append({"index": line, "detail": errors})
+            continue
+        row["content_hash"] = row_hash
+        seen[base] += 1
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+    return result
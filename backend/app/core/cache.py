@@ -0,0 +1,151 @@
+"""Month-keyed cache for computed results, invalidated by the months a commit touched."""
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from app.core import changes, config
+
+_MISSING = object()
+
+
+class BaseCache:
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_set(self, month: str, name: str, compute: Callable[[], Any]) -> Any:
+        value = self.get(month, name)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = compute()
+        self.set(month, name, value)
+        return value
+
+    def stats(self) -> dict:
+        return {"backend": type(self).__name__, "hits": self.hits, "misses": self.misses}
+
+    def get(self, month: str, name: str) -> Any:
+        return _MISSING
+
+    def set(self, month: str, name: str, value: Any) -> None:
+        pass
+
+    def invalidate(self, month: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class NullCache(BaseCache):
+    pass
+
+
+class MemoryCache(BaseCache):
+    """In-process LRU bounded by `maxsize` entries, each expiring after `ttl` seconds."""
+
+    def __init__(self, ttl: int, maxsize: int):
+        super().__init__(ttl)
+        self.maxsize = maxsize
+        self._data: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._by_month: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, month, name):
+        key = (month, name)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            expires, value = entry
+            if expires < time.monotonic():
+                self._drop(key)
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, month, name, value):
+        key = (month, name)
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            self._by_month.setdefault(month, set()).add(name)
+            while len(self._data) > self.maxsize:
+                self._drop(next(iter(self._data)))
+
+    def invalidate(self, month):
+        with self._lock:
+            for name in self._by_month.pop(month, ()):
+                self._data.pop((month, name), None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._by_month.clear()
+
+    def stats(self):
+        return {**super().stats(), "entries": len(self._data), "maxsize": self.maxsize}
+
+    def _drop(self, key):
+        self._data.pop(key, None)
+        names = self._by_month.get(key[0])
+        if names is not None:
+            names.discard(key[1])
+            if not names:
+                del self._by_month[key[0]]
+
+
+class RedisCache(BaseCache):
+    """One Redis hash per month, so invalidating a month is a single DEL.
+
+    `client` only needs hget/hset/expire/delete/scan_iter, so any Redis-compatible
+    server or local stand-in works.
+    """
+
+    def __init__(self, client, ttl: int, prefix: str = "mst:cache:"):
+        super().__init__(ttl)
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, month, name):
+        raw = self.client.hget(self.prefix + month, name)
+        return _MISSING if raw is None else pickle.loads(raw)
+
+    def set(self, month, name, value):
+        key = self.prefix + month
+        self.client.hset(key, name, pickle.dumps(value))
+        self.client.expire(key, self.ttl)
+
+    def invalidate(self, month):
+        self.client.delete(self.prefix + month)
+
+    def clear(self):
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+
+def build_cache() -> BaseCache:
+    if config.CACHE_BACKEND == "none":
+        return NullCache(config.CACHE_TTL)
+    if config.CACHE_BACKEND == "redis":
+        import redis  # optional dependency
+
+        return RedisCache(redis.Redis.from_url(config.CACHE_URL), config.CACHE_TTL)
+    return MemoryCache(config.CACHE_TTL, config.CACHE_MAX_ENTRIES)
+
+
+cache = build_cache()
+
+
+@changes.on_commit
+def _invalidate(months: set[str] | None) -> None:
+    if months is None:
+        cache.clear()
+        return
+    for month in months:
+        cache.invalidate(month)
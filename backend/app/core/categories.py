@@ -0,0 +1,102 @@
+"""In-process lookup for the `categories` table.
+
+Transactions and rollups store a small integer `category_id`; the API speaks category
+names. This keeps both directions in memory, per account, so requests translate without
+a join. An account's maps are loaded on first use, dropped whenever this process changes
+one of its categories, and reloaded on a miss, which is how categories created by another
+worker show up. Renames made by another worker show up once the maps are CATEGORY_TTL
+seconds old.
+"""
+import threading
+import time
+from typing import Iterable
+
+from sqlalchemy.orm import Session
+
+from app.core import accounts, config, models, schemas
+
+_lock = threading.Lock()
+# Per account: when they were loaded, then categories by id and ids by name
+_maps: dict[int, tuple[float, tuple[dict[int, schemas.CategoryRead], dict[str, int]]]] = {}
+_EMPTY: tuple[dict, dict] = ({}, {})
+
+
+class UnknownCategory(ValueError):
+    pass
+
+
+class NotAnExpense(ValueError):
+    """Raised for an income category where only expense categories make sense (budgets)."""
+
+
+def load(db: Session) -> tuple[dict[int, schemas.CategoryRead], dict[str, int]]:
+    account_id = accounts.current(db)
+    C = models.Category
+    rows = [schemas.CategoryRead.model_validate(c) for c in db.query(C).filter(C.account_id == account_id)]
+    maps = ({c.id: c for c in rows}, {c.name: c.id for c in rows})
+    with _lock:
+        _maps[account_id] = (time.monotonic(), maps)
+    return maps
+
+
+def _cached(account_id: int, db: Session | None = None) -> tuple[dict[int, schemas.CategoryRead], dict[str, int]]:
+    """The account's maps, reloaded through `db` once they are older than CATEGORY_TTL.
+
+    Without a session, whatever is loaded, however old.
+    """
+    entry = _maps.get(account_id)
+    if entry is not None and (db is None or time.monotonic() - entry[0] < config.CATEGORY_TTL):
+        return entry[1]
+    return load(db) if db is not None else _EMPTY
+
+
+def invalidate(db: Session | None = None) -> None:
+    """Drop the session's account (or, without a session, every account)."""
+    with _lock:
+        if db is None:
+            _maps.clear()
+        else:
+            _maps.pop(accounts.current(db), None)
+
+
+def get_all(db: Session) -> list[schemas.CategoryRead]:
+    return sorted(_cached(accounts.current(db), db)[0].values(), key=lambda c: c.name)
+
+
+def name(category_id: int, db: Session | None = None, account_id: int | None = None) -> str:
+    """Name for an id in the session's account, or in `account_id`'s without a session.
+
+    Reloads through `db` if the id is not known yet.
+    """
+    by_id = _cached(accounts.current(db) if db is not None else account_id, db)[0]
+    category = by_id.get(category_id)
+    if category is None and db is not None:
+        category = load(db)[0].get(category_id)
+    if category is None:
+        raise KeyError(category_id)
+    return category.name
+
+
+def ensure(db: Session, ids: Iterable[int]) -> None:
+    """Make sure every id in `ids` can be named without touching the database again."""
+    by_id = _cached(accounts.current(db), db)[0]
+    if any(i not in by_id for i in ids):
+        load(db)
+
+
+def id_for(db: Session, category: str) -> int | None:
+    category_id = _cached(accounts.current(db), db)[1].get(category)
+    if category_id is None:
+        category_id = load(db)[1].get(category)
+    return category_id
+
+
+def resolve(db: Session, row: dict) -> dict:
+    """Replace a row's `category` name with its `category_id`, in place."""
+    if "category" in row:
+        category_id = id_for(db, row["category"])
+        if category_id is None:
+            raise UnknownCategory(f"Unknown category: {row['category']}")
+        row["category_id"] = category_id
+        del row["category"]
+    return row
@@ -0,0 +1,51 @@
+"""Track which months a session's writes touched and notify listeners once they commit.
+
+Writers call `touch(db, month)` (rollups does this for every row it accounts for);
+listeners registered with `on_commit` receive the set of months after a successful
+commit, or `None` when everything should be considered changed. Months are reported
+as `accounts.scoped` keys, e.g. `3:2025-09`.
+"""
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core import accounts
+
+_KEY = "touched_months"
+_ALL = "*"
+_listeners: list[Callable[[set[str] | None], None]] = []
+
+
+def on_commit(fn: Callable[[set[str] | None], None]):
+    _listeners.append(fn)
+    return fn
+
+
+def touch(db: Session, month: str) -> bool:
+    """Record that `month` changes in the current transaction; True the first time."""
+    touched = db.info.setdefault(_KEY, set())
+    key = accounts.scoped(db, month)
+    if key in touched:
+        return False
+    touched.add(key)
+    return True
+
+
+def touch_all(db: Session) -> None:
+    db.info.setdefault(_KEY, set()).add(_ALL)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    months = session.info.pop(_KEY, None)
+    if not months:
+        return
+    payload = None if _ALL in months else months
+    for fn in _listeners:
+        fn(payload)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_KEY, None)
@@ -1,5 +1,65 @@
 import os
+import tempfile
 
 DB_URL = os.getenv("DATABASE_URL", "sqlite:///app/app.db")
 DEBUG = os.getenv("DEBUG", "false").lower() == "true"
 APP_API_KEY = os.getenv("APP_API_KEY")
+# Run create_all at startup; otherwise the schema is managed with `alembic upgrade head`
+CREATE_SCHEMA = os.getenv("CREATE_SCHEMA", "false").lower() == "true"
+
+# Partitioned storage: each account gets its own SQLite file in this directory, and
+# DATABASE_URL only holds the `accounts` table. Unset keeps every account in DATABASE_URL.
+ACCOUNT_DB_DIR = os.getenv("ACCOUNT_DB_DIR")
+# Engines for account files kept open at once; the least recently used is disposed
+ACCOUNT_ENGINE_CACHE_SIZE = int(os.getenv("ACCOUNT_ENGINE_CACHE_SIZE", "128"))
+ACCOUNT_DB_POOL_SIZE = int(os.getenv("ACCOUNT_DB_POOL_SIZE", "2"))
+# Seconds a verified API key is trusted before it is looked up again (so revocations apply)
+ACCOUNT_KEY_TTL = int(os.getenv("ACCOUNT_KEY_TTL", "60"))
+# Seconds an account's category lookup is used before it is reloaded (so renames elsewhere apply)
+CATEGORY_TTL = int(os.getenv("CATEGORY_TTL", "60"))
+
+# Serve requests through an AsyncSession (aiosqlite / asyncpg) instead of the threadpool
+ASYNC_DB = os.getenv("ASYNC_DB", "false").lower() == "true"
+ASYNC_DB_URL = os.getenv("ASYNC_DATABASE_URL")
+
+# Connection pool (ignored for in-memory SQLite, which keeps a single connection)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds; -1 disables
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# SQLite pragmas applied to every new connection
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))  # negative = KiB, i.e. 64 MiB
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_BUSY_TIMEOUT = int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000"))  # milliseconds
+
+# Month-keyed result cache: "memory" (in-process LRU), "redis" (CACHE_URL) or "none"
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+CACHE_URL = os.getenv("CACHE_URL", "redis://localhost:6379/0")
+CACHE_TTL = int(os.getenv("CACHE_TTL", "300"))  # seconds
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+
+# Range snapshots kept by /api/v1/analytics, reused until the range's data changes
+ANALYTICS_CACHE_SIZE = int(os.getenv("ANALYTICS_CACHE_SIZE", "32"))
+
+# Listing a month creates its recurring transactions only up to this many months past the
+# current one; later months are shown as they are (scripts/recurring.py has no such limit)
+RECURRING_MONTHS_AHEAD = int(os.getenv("RECURRING_MONTHS_AHEAD", "0"))
+
+# Live page updates (/events): events buffered per open page before it is told to reload,
+# and seconds between keep-alive comments on an idle stream
+LIVE_QUEUE_SIZE = int(os.getenv("LIVE_QUEUE_SIZE", "64"))
+LIVE_KEEPALIVE = float(os.getenv("LIVE_KEEPALIVE", "15"))
+
+# Compiled Jinja templates are cached here between processes
+TEMPLATE_CACHE_DIR = os.getenv(
+    "TEMPLATE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "monthly-spending-tracker-jinja")
+)
+
+# Request timing / SQL instrumentation, served at /metrics
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+# Requests issuing more queries than this are logged as possible N+1 patterns
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "20"))
@@ -0,0 +1,247 @@
+from datetime import date
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.core import accounts, categories, changes, models, rollups, schemas, utils, versions
+from app.core.cache import cache
+from app.core.summary import MonthTotals, month_totals
+
+T = models.Transaction
+# API field names that are stored under a different column
+COLUMNS = {"amount": "amount_cents", "category": "category_id"}
+
+
+def list_month(
+    db: Session,
+    start: date,
+    end: date,
+    limit: int,
+    after: tuple[date, int] | None = None,
+    columns: list[str] | None = None,
+) -> list:
+    """Up to `limit + 1` rows between `start` and `end`, newest first, after a (date, id) key.
+
+    With `columns`, returns lightweight rows holding only those attributes instead of ORM objects.
+    Field names in `COLUMNS` select their storage column, e.g. `amount` yields `amount_cents`.
+    """
+    query = db.query(*(getattr(T, COLUMNS.get(c, c)) for c in columns)) if columns else db.query(T)
+    query = query.filter(T.account_id == accounts.current(db), T.date.between(start, end))
+    if after:
+        after_date, after_id = after
+        query = query.filter(or_(T.date < after_date, and_(T.date == after_date, T.id < after_id)))
+    # One extra row tells the caller whether another page exists
+    rows = query.order_by(T.date.desc(), T.id.desc()).limit(limit + 1).all()
+    if not columns or "category" in columns:
+        # Rows are serialized after the session is done with; names must not need a query then
+        categories.ensure(db, {row.category_id for row in rows})
+    return rows
+
+
+def month_page(
+    db: Session, first: date, version: versions.Version | None = None
+) -> tuple[list[schemas.TransactionRead], MonthTotals]:
+    """All rows of a month, newest first, with its totals. Backs the server-rendered pages.
+
+    Cached per month and version (see `cached_month_totals`) as plain schema objects.
+    """
+    month = utils.month_str(first)
+    version = version or versions.get(db, month)
+
+    def load():
+        start, end = utils.month_bounds(first)
+        rows = (
+            db.query(T)
+            .filter(T.account_id == accounts.current(db), T.date.between(start, end))
+            .order_by(T.date.desc())
+            .all()
+        )
+        return [schemas.TransactionRead.model_validate(r) for r in rows], month_totals(db, first)
+
+    return cache.get_or_set(accounts.scoped(db, month), f"page:{version.number}", load)
+
+
+def _get(db: Session, model, obj_id: int):
+    """Row by primary key, or None if it does not belong to the session's account."""
+    obj = db.get(model, obj_id)
+    if obj is None or obj.account_id != accounts.current(db):
+        return None
+    return obj
+
+
+def create_transaction(db: Session, data: dict) -> models.Transaction:
+    """Raises `categories.UnknownCategory` if the category name does not exist."""
+    obj = T(**categories.resolve(db, data), account_id=accounts.current(db))
+    db.add(obj)
+    rollups.add(db, obj)
+    db.commit()
+    db.refresh(obj)
+    return obj
+
+
+def update_transaction(db: Session, tx_id: int, data: dict) -> models.Transaction | None:
+    obj = _get(db, T, tx_id)
+    if not obj:
+        return None
+    categories.resolve(db, data)
+    rollups.remove(db, obj)
+    for k, v in data.items():
+        setattr(obj, k, v)
+    db.add(obj)
+    rollups.add(db, obj)
+    db.commit()
+    db.refresh(obj)
+    categories.ensure(db, [obj.category_id])
+    return obj
+
+
+def delete_transaction(db: Session, tx_id: int) -> bool:
+    obj = _get(db, T, tx_id)
+    if not obj:
+        return False
+    db.delete(obj)
+    rollups.remove(db, obj)
+    db.commit()
+    return True
+
+
+def create_category(db: Session, data: dict) -> models.Category:
+    """Raises ValueError if the name is taken."""
+    if categories.id_for(db, data["name"]) is not None:
+        raise ValueError(f"Category {data['name']} already exists")
+    obj = models.Category(**data, account_id=accounts.current(db))
+    db.add(obj)
+    db.commit()
+    db.refresh(obj)
+    categories.invalidate(db)
+    return obj
+
+
+def update_category(db: Session, category_id: int, data: dict) -> models.Category | None:
+    """Raises ValueError if the new name is taken."""
+    obj = _get(db, models.Category, category_id)
+    if not obj:
+        return None
+    if data.get("name", obj.name) != obj.name and categories.id_for(db, data["name"]) is not None:
+        raise ValueError(f"Category {data['name']} already exists")
+    B = models.Budget
+    if data.get("type", "expense") != "expense" and db.query(B.id).filter(B.category_id == category_id).first():
+        raise ValueError("Category has a budget; delete it before making the category income")
+    for k, v in data.items():
+        setattr(obj, k, v)
+    if "name" in data:
+        # Summaries and pages show category names, so every month using it has changed
+        R = models.MonthlyRollup
+        months = db.query(R.month).filter(R.account_id == obj.account_id, R.category_id == category_id)
+        for (month,) in months.distinct():
+            changes.touch(db, month)
+            versions.bump(db, month)
+    db.commit()
+    db.refresh(obj)
+    categories.invalidate(db)
+    return obj
+
+
+def delete_category(db: Session, category_id: int) -> bool:
+    """Raises ValueError while transactions or recurring rules still use the category."""
+    obj = _get(db, models.Category, category_id)
+    if not obj:
+        return False
+    if db.query(T.id).filter(T.account_id == obj.account_id, T.category_id == category_id).first() is not None:
+        raise ValueError("Category is used by transactions")
+    RR = models.RecurringRule
+    if db.query(RR.id).filter(RR.category_id == category_id).first() is not None:
+        raise ValueError("Category is used by recurring rules")
+    db.query(models.Budget).filter(models.Budget.category_id == category_id).delete()
+    db.delete(obj)
+    db.commit()
+    categories.invalidate(db)
+    return True
+
+
+def list_budgets(db: Session) -> list[models.Budget]:
+    B = models.Budget
+    rows = db.query(B).filter(B.account_id == accounts.current(db)).all()
+    categories.ensure(db, {b.category_id for b in rows})
+    return sorted(rows, key=lambda b: b.category)
+
+
+def create_budget(db: Session, data: dict) -> models.Budget:
+    """Raises `categories.UnknownCategory` or `categories.NotAnExpense`, or ValueError if the
+    category already has a budget."""
+    categories.resolve(db, data)
+    category = db.get(models.Category, data["category_id"])
+    if category.type != "expense":
+        raise categories.NotAnExpense(f"Budgets are for expense categories, not {category.name}")
+    B = models.Budget
+    account_id = accounts.current(db)
+    if db.query(B.id).filter(B.account_id == account_id, B.category_id == data["category_id"]).first():
+        raise ValueError("Category already has a budget")
+    obj = B(**data, account_id=account_id)
+    db.add(obj)
+    db.commit()
+    db.refresh(obj)
+    return obj
+
+
+def update_budget(db: Session, budget_id: int, limit_cents: int) -> models.Budget | None:
+    obj = _get(db, models.Budget, budget_id)
+    if not obj:
+        return None
+    obj.limit_cents = limit_cents
+    db.commit()
+    db.refresh(obj)
+    return obj
+
+
+def delete_budget(db: Session, budget_id: int) -> bool:
+    obj = _get(db, models.Budget, budget_id)
+    if not obj:
+        return False
+    db.delete(obj)
+    db.commit()
+    return True
+
+
+def list_rules(db: Session) -> list[models.RecurringRule]:
+    RR = models.RecurringRule
+    rows = db.query(RR).filter(RR.account_id == accounts.current(db)).order_by(RR.start_date, RR.id).all()
+    categories.ensure(db, {r.category_id for r in rows})
+    return rows
+
+
+def create_rule(db: Session, data: dict) -> models.RecurringRule:
+    """Raises `categories.UnknownCategory`. Occurrences are created by `recurring.materialize`."""
+    categories.resolve(db, data)
+    obj = models.RecurringRule(**data, account_id=accounts.current(db))
+    db.add(obj)
+    db.commit()
+    db.refresh(obj)
+    return obj
+
+
+def update_rule(db: Session, rule_id: int, data: dict) -> models.RecurringRule | None:
+    """Changes apply to occurrences not materialized yet; existing rows are left as they are.
+
+    Raises ValueError if the end date would precede the start date.
+    """
+    obj = _get(db, models.RecurringRule, rule_id)
+    if not obj:
+        return None
+    if data.get("end_date") and data["end_date"] < obj.start_date:
+        raise ValueError("end_date must not be before start_date")
+    for k, v in data.items():
+        setattr(obj, k, v)
+    db.commit()
+    db.refresh(obj)
+    return obj
+
+
+def delete_rule(db: Session, rule_id: int) -> bool:
+    """Stops the rule; transactions it already created are kept."""
+    obj = _get(db, models.RecurringRule, rule_id)
+    if not obj:
+        return False
+    db.delete(obj)
+    db.commit()
+    return True
@@ -1,7 +1,215 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
-from app.core.config import DB_URL
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from app.core import config
+from app.core.config import ASYNC_DB, ASYNC_DB_URL, DB_URL
+
+logger = logging.getLogger(__name__)
+
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def _is_memory_sqlite(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def engine_options(url: str) -> dict:
+    """Keyword arguments for create_engine / create_async_engine from the pool settings."""
+    parsed = make_url(url)
+    options: dict = {"pool_pre_ping": config.DB_POOL_PRE_PING}
+    if parsed.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+    if not _is_memory_sqlite(parsed):
+        options.update(
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+            pool_recycle=config.DB_POOL_RECYCLE,
+        )
+    return options
+
+
+def sqlite_pragmas() -> dict[str, object]:
+    return {
+        "journal_mode": config.SQLITE_JOURNAL_MODE,
+        "synchronous": config.SQLITE_SYNCHRONOUS,
+        "cache_size": config.SQLITE_CACHE_SIZE,
+        "mmap_size": config.SQLITE_MMAP_SIZE,
+        "busy_timeout": config.SQLITE_BUSY_TIMEOUT,
+    }
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in sqlite_pragmas().items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def configure_engine(target: Engine) -> Engine:
+    """Register the SQLite pragma hook on an engine (a no-op for other backends)."""
+    if target.dialect.name == "sqlite":
+        event.listen(target, "connect", _apply_sqlite_pragmas)
+    return target
+
+
+def log_settings(target: Engine) -> None:
+    pool = target.pool
+    logger.info(
+        "Database %s: pool=%s size=%s overflow=%s recycle=%s pre_ping=%s",
+        target.url.render_as_string(hide_password=True),
+        type(pool).__name__,
+        getattr(pool, "size", lambda: None)(),
+        getattr(pool, "_max_overflow", None),
+        pool._recycle,
+        pool._pre_ping,
+    )
+    if target.dialect.name == "sqlite":
+        with target.connect() as conn:
+            effective = {
+                name: conn.exec_driver_sql(f"PRAGMA {name}").scalar() for name in sqlite_pragmas()
+            }
+        logger.info("SQLite pragmas: %s", ", ".join(f"{k}={v}" for k, v in effective.items()))
+
 
-engine = create_engine(DB_URL, connect_args={"check_same_thread": False} if DB_URL.startswith("sqlite") else {})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
+
+# Engines are built on first use rather than at import, so importing the app stays cheap
+_lock = threading.Lock()
+_engine: Engine | None = None
+_async_engine = None
+_sessionmaker = sessionmaker(autocommit=False, autoflush=False)
+_async_sessionmaker = None
+
+
+def get_engine() -> Engine:
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                _engine = configure_engine(create_engine(DB_URL, **engine_options(DB_URL)))
+                log_settings(_engine)
+    return _engine
+
+
+def SessionLocal() -> Session:
+    """A new session on the application engine (a factory, like the sessionmaker it wraps)."""
+    return _sessionmaker(bind=get_engine())
+
+
+# With ACCOUNT_DB_DIR every account has its own SQLite file. Their engines are opened on
+# demand and kept in an LRU, so a process serving many accounts holds few connections.
+_account_lock = threading.Lock()
+_account_engines: OrderedDict[int, Engine] = OrderedDict()
+
+
+def account_path(account_id: int) -> str:
+    return os.path.join(config.ACCOUNT_DB_DIR, f"account_{account_id}.db")
+
+
+def _create_account_schema(target: Engine, account_id: int) -> None:
+    # `accounts` itself stays in DATABASE_URL
+    tables = [t for t in Base.metadata.sorted_tables if t.name != "accounts"]
+    with target.begin() as conn:
+        # Lets the default-categories hook in `models` insert them for this account
+        conn.execution_options(account_id=account_id)
+        Base.metadata.create_all(conn, tables=tables)
+
+
+def get_account_engine(account_id: int) -> Engine:
+    """Engine for an account's own database file, creating the file on first use."""
+    with _account_lock:
+        engine = _account_engines.get(account_id)
+        if engine is not None:
+            _account_engines.move_to_end(account_id)
+            return engine
+        # Creating a file takes a few ms and happens once per account; holding the lock
+        # meanwhile keeps two requests from creating the same one
+        path = account_path(account_id)
+        url = f"sqlite:///{path}"
+        options = engine_options(url)
+        options["pool_size"] = config.ACCOUNT_DB_POOL_SIZE
+        is_new = not os.path.exists(path)
+        engine = configure_engine(create_engine(url, **options))
+        if is_new:
+            os.makedirs(config.ACCOUNT_DB_DIR, exist_ok=True)
+            _create_account_schema(engine, account_id)
+        _account_engines[account_id] = engine
+        while len(_account_engines) > config.ACCOUNT_ENGINE_CACHE_SIZE:
+            # Sessions still using an evicted engine keep their connection until they close
+            _, evicted = _account_engines.popitem(last=False)
+            evicted.dispose()
+        return engine
+
+
+def AccountSessionLocal(account_id: int) -> Session:
+    return _sessionmaker(bind=get_account_engine(account_id))
+
+
+def async_url(url: str) -> str:
+    """Swap the sync driver in a database URL for its asyncio counterpart."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend!r}; set ASYNC_DATABASE_URL")
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def get_async_engine():
+    """The asyncio engine when ASYNC_DB is set, otherwise None."""
+    global _async_engine, _async_sessionmaker
+    if not ASYNC_DB:
+        return None
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        with _lock:
+            if _async_engine is None:
+                url = ASYNC_DB_URL or async_url(DB_URL)
+                engine = create_async_engine(url, **engine_options(url))
+                configure_engine(engine.sync_engine)
+                # Objects are serialized after the handler returns, outside the session's greenlet
+                _async_sessionmaker = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+                _async_engine = engine
+    return _async_engine
+
+
+def AsyncSessionLocal():
+    get_async_engine()
+    return _async_sessionmaker()
+
+
+async def dispose() -> None:
+    """Close the pools of whichever engines were created."""
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    if _engine is not None:
+        _engine.dispose()
+    with _account_lock:
+        while _account_engines:
+            _account_engines.popitem()[1].dispose()
+
+
+def __getattr__(name: str):
+    # `engine` / `async_engine` as attributes still work, creating the engine when first read
+    if name == "engine":
+        return get_engine()
+    if name == "async_engine":
+        return get_async_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def dialect_insert(db):
+    """The session's dialect-specific `insert()`, which supports ON CONFLICT clauses."""
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
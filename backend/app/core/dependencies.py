@@ -1,20 +1,70 @@
-from typing import Generator
-from app.core.database import SessionLocal
-from app.core.config import APP_API_KEY
-from fastapi import HTTPException, Depends, Header, status
+from datetime import date
+from typing import AsyncGenerator, Callable, Generator, TypeVar
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core import accounts, database, utils
+from app.core.config import ACCOUNT_DB_DIR, APP_API_KEY, ASYNC_DB
+from fastapi import HTTPException, Depends, Header, Query, status
 
-def get_db() -> Generator:
-    db = SessionLocal()
+R = TypeVar("R")
+
+async def get_account(x_api_key: str = Header(None, alias="X-API-Key")) -> int:
+    """The account a request acts for: the owner of its API key, or the default account
+    when it sends none (or the legacy APP_API_KEY)."""
+    if x_api_key is None or (APP_API_KEY and x_api_key == APP_API_KEY):
+        return accounts.DEFAULT_ACCOUNT
+    account_id = await run_in_threadpool(accounts.authenticate, x_api_key)
+    if account_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API key",
+        )
+    return account_id
+
+def get_db(account_id: int = Depends(get_account)) -> Generator:
+    db = accounts.session(account_id)
     try:
         yield db
     finally:
         db.close()
 
-def require_api_key(x_api_key: str = Header(None, alias="X-API-Key")):
-    if not APP_API_KEY: return
-    if x_api_key != APP_API_KEY:
+async def get_async_db(account_id: int = Depends(get_account)) -> AsyncGenerator:
+    async with database.AsyncSessionLocal() as db:
+        yield accounts.bind(db, account_id)
+
+# Session dependency for async handlers; the mode is fixed at startup by ASYNC_DB.
+# Per-account database files are only served through sync sessions.
+get_session = get_async_db if ASYNC_DB and not ACCOUNT_DB_DIR else get_db
+
+async def run_db(db, fn: Callable[..., R], *args, **kwargs) -> R:
+    """Run sync DB code `fn(session, ...)` without blocking the event loop.
+
+    AsyncSession runs it via `run_sync`; a plain Session runs it in the threadpool.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
+def get_month_range(
+    from_: str = Query(..., alias="from", description="First month, YYYY-MM"),
+    to: str = Query(..., description="Last month, YYYY-MM"),
+) -> tuple[date, date]:
+    """First days of the `from` and `to` months; 400 unless both parse and `from` <= `to`."""
+    try:
+        first, last = utils.parse_month(from_), utils.parse_month(to)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="`from` and `to` must be months, YYYY-MM")
+    if first > last:
+        raise HTTPException(status_code=400, detail="`from` must not be after `to`")
+    return first, last
+
+async def require_api_key(
+    x_api_key: str = Header(None, alias="X-API-Key"), account_id: int = Depends(get_account)
+) -> int:
+    # Without APP_API_KEY the default account stays open, as a single-household install was
+    if APP_API_KEY and x_api_key is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
         )
-    return x_api_key
\ No newline at end of file
+    return account_id
@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+from datetime import date
+from typing import Iterator
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core import accounts, categories, models
+from app.core.utils import from_cents
+
+COLUMNS = ("id", "date", "type", "category", "amount", "description")
+BATCH_SIZE = 1000
+
+
+def _rows(db: Session, start: date | None, end: date | None):
+    T = models.Transaction
+    stmt = (
+        select(T.id, T.date, T.type, T.category_id, T.amount_cents, T.description)
+        .where(T.account_id == accounts.current(db))
+        .order_by(T.date, T.id)
+    )
+    if start:
+        stmt = stmt.where(T.date >= start)
+    if end:
+        stmt = stmt.where(T.date <= end)
+    # yield_per streams from a server-side cursor where the driver supports it
+    result = db.execute(stmt.execution_options(yield_per=BATCH_SIZE))
+    for batch in result.partitions():
+        categories.ensure(db, {r.category_id for r in batch})
+        yield batch
+
+
+def iter_csv(db: Session, start: date | None = None, end: date | None = None) -> Iterator[str]:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(COLUMNS)
+    for batch in _rows(db, start, end):
+        writer.writerows(
+            (i, d, t, categories.name(c, db), from_cents(cents), desc) for i, d, t, c, cents, desc in batch
+        )
+        yield buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+    yield buf.getvalue()
+
+
+def iter_ndjson(db: Session, start: date | None = None, end: date | None = None) -> Iterator[str]:
+    for batch in _rows(db, start, end):
+        yield "".join(
+            json.dumps(
+                {
+                    "id": r.id,
+                    "date": r.date.isoformat(),
+                    "type": r.type,
+                    "category": categories.name(r.category_id, db),
+                    "amount": str(from_cents(r.amount_cents)),
+                    "description": r.description,
+                }
+            )
+            + "\n"
+            for r in batch
+        )
+
+
+FORMATS = {
+    "csv": (iter_csv, "text/csv"),
+    "ndjson": (iter_ndjson, "application/x-ndjson"),
+}
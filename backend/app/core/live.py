@@ -0,0 +1,134 @@
+"""Live month updates for open pages, sent as Server-Sent Events.
+
+Write handlers `publish` small events to a month key (`accounts.scoped` form, e.g.
+`1:2025-09`): `upsert` with the written row or `delete` with an id, each carrying the
+month's new totals, or `reload` when a write changed too much to describe row by row.
+Every open page holds a `Subscription` with a bounded queue; one that stops reading
+loses its backlog and gets a single `reload` instead, so a slow client never holds
+memory or slows down writers.
+
+The pub/sub is in-process: with several workers, a page hears about the writes served
+by the worker its event stream is connected to.
+"""
+import asyncio
+import json
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import AsyncIterator, Awaitable, Callable
+
+from sqlalchemy.orm import Session
+
+from app.core import accounts, budgets, config, models, schemas
+from app.core.summary import cached_month_totals
+
+RELOAD = {"op": "reload"}
+
+_lock = threading.Lock()
+_subscribers: dict[str, set["Subscription"]] = defaultdict(set)
+
+
+class Subscription:
+    def __init__(self, key: str, size: int):
+        self.key = key
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self.loop = asyncio.get_running_loop()
+
+    def offer(self, event: dict) -> None:
+        """Queue an event; must run on the subscriber's loop."""
+        if self.queue.full():
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event = RELOAD
+        self.queue.put_nowait(event)
+
+
+def key(account_id: int, month: str) -> str:
+    """`accounts.scoped` for code that has an account id rather than a session."""
+    return f"{account_id}:{month}"
+
+
+def subscribe(month_key: str) -> Subscription:
+    """Start receiving the events of a month key; call from the loop that will read them."""
+    sub = Subscription(month_key, config.LIVE_QUEUE_SIZE)
+    with _lock:
+        _subscribers[month_key].add(sub)
+    return sub
+
+
+def unsubscribe(sub: Subscription) -> None:
+    with _lock:
+        subs = _subscribers.get(sub.key)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                del _subscribers[sub.key]
+
+
+def watching(month_key: str) -> bool:
+    return month_key in _subscribers
+
+
+def watching_account(account_id: int) -> bool:
+    prefix = key(account_id, "")
+    with _lock:
+        return any(k.startswith(prefix) for k in _subscribers)
+
+
+def publish(month_key: str, event: dict) -> None:
+    """Deliver an event to every subscriber of the key. Safe to call from any thread."""
+    with _lock:
+        subs = list(_subscribers.get(month_key, ()))
+    for sub in subs:
+        sub.loop.call_soon_threadsafe(sub.offer, event)
+
+
+def publish_account(account_id: int, event: dict) -> None:
+    """Deliver an event to every month of the account that is being watched."""
+    prefix = key(account_id, "")
+    with _lock:
+        keys = [k for k in _subscribers if k.startswith(prefix)]
+    for month_key in keys:
+        publish(month_key, event)
+
+
+def date_of(db: Session, tx_id: int) -> date | None:
+    """Date of a transaction about to change, to tell its month it has left."""
+    T = models.Transaction
+    return db.query(T.date).filter(T.id == tx_id, T.account_id == accounts.current(db)).scalar()
+
+
+def month_event(db: Session, day: date, op: str, row: models.Transaction | None = None, **data) -> dict:
+    """An `op` event for the month of `day`, with the month's totals and budget status after
+    the write."""
+    first = date(day.year, day.month, 1)
+    totals = cached_month_totals(db, first)
+    if row is not None:
+        data["row"] = schemas.TransactionRead.model_validate(row).model_dump(mode="json")
+    return {
+        "op": op,
+        **data,
+        "totals": {"income": float(totals.income), "expenses": float(totals.expenses), "net": float(totals.net)},
+        "budgets": [s.model_dump(mode="json") for s in budgets.status(db, first)],
+    }
+
+
+def format_event(event: dict) -> str:
+    return f"data: {json.dumps(event, separators=(',', ':'))}\n\n"
+
+
+async def stream(month_key: str, is_disconnected: Callable[[], Awaitable[bool]]) -> AsyncIterator[str]:
+    """The text/event-stream body for one page: events as they come, and a comment line
+    every LIVE_KEEPALIVE seconds so proxies keep the connection open."""
+    sub = subscribe(month_key)
+    try:
+        yield "retry: 3000\n\n"
+        while not await is_disconnected():
+            try:
+                event = await asyncio.wait_for(sub.queue.get(), config.LIVE_KEEPALIVE)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield format_event(event)
+    finally:
+        unsubscribe(sub)
@@ -0,0 +1,182 @@
+"""Opt-in request timing and SQL instrumentation.
+
+`MetricsMiddleware` times every request and, through cursor events on the
+instrumented engines, counts the SQL statements and DB time it caused. Results
+go to Prometheus-style histograms (`render()`), a `Server-Timing` response
+header, and a warning log when a request looks like an N+1 pattern.
+"""
+import logging
+import threading
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core import config
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+enabled = False
+_stats: ContextVar[dict | None] = ContextVar("request_db_stats", default=None)
+_lock = threading.Lock()
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.sum += value
+
+    def lines(self, name: str, labels: str) -> list[str]:
+        out, running = [], 0
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            running += count
+            out.append(f'{name}_bucket{{{labels},le="{bound}"}} {running}')
+        out.append(f"{name}_sum{{{labels}}} {self.sum}")
+        out.append(f"{name}_count{{{labels}}} {running}")
+        return out
+
+
+# (method, route, status) -> histograms
+_latency: dict[tuple[str, str, int], Histogram] = {}
+_queries: dict[tuple[str, str, int], Histogram] = {}
+_db_seconds: dict[tuple[str, str, int], float] = {}
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start"].pop()
+    stats = _stats.get()
+    if stats is not None:
+        stats["queries"] += 1
+        stats["db"] += time.perf_counter() - started
+
+
+def _handle_error(context):
+    # after_cursor_execute does not fire for failed statements
+    if context.connection is not None:
+        starts = context.connection.info.get("query_start")
+        if starts:
+            starts.pop()
+
+
+def instrument(engine) -> None:
+    """Count statements and DB time on this engine, or the Engine class (idempotent)."""
+    # Asked of the engine itself: ids of disposed per-account engines get reused
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def enable(*engines: Engine) -> None:
+    """Turn metrics on for the given engines, or for every engine (including ones created
+    later) when none are given."""
+    global enabled
+    for engine in engines or (Engine,):
+        instrument(engine)
+    enabled = True
+
+
+def _record(method: str, route: str, status: int, elapsed: float, stats: dict) -> None:
+    key = (method, route, status)
+    with _lock:
+        _latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(elapsed)
+        _queries.setdefault(key, Histogram(QUERY_BUCKETS)).observe(stats["queries"])
+        _db_seconds[key] = _db_seconds.get(key, 0.0) + stats["db"]
+    if stats["queries"] > config.N_PLUS_ONE_THRESHOLD:
+        logger.warning(
+            "Possible N+1: %s %s ran %d queries (%.1f ms in DB)",
+            method, route, stats["queries"], stats["db"] * 1000,
+        )
+
+
+def _route_label(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or "<unmatched>"
+
+
+def _server_timing(stats: dict, started: float) -> bytes:
+    total = (time.perf_counter() - started) * 1000
+    return (
+        f'db;dur={stats["db"] * 1000:.2f};desc="{stats["queries"]} queries", app;dur={total:.2f}'
+    ).encode()
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if not enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = {"queries": 0, "db": 0.0}
+        token = _stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", _server_timing(stats, started)))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _stats.reset(token)
+            _record(scope["method"], _route_label(scope), status, time.perf_counter() - started, stats)
+
+
+def _labels(key: tuple[str, str, int]) -> str:
+    method, route, status = key
+    route = route.replace("\\", "\\\\").replace('"', '\\"')
+    return f'method="{method}",route="{route}",status="{status}"'
+
+
+def render(extra: dict[str, float] | None = None) -> str:
+    """All metrics in the Prometheus text exposition format."""
+    lines = [
+        "# HELP http_request_duration_seconds Request latency by route.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    with _lock:
+        for key, hist in sorted(_latency.items()):
+            lines += hist.lines("http_request_duration_seconds", _labels(key))
+        lines += [
+            "# HELP http_request_db_queries SQL statements executed per request.",
+            "# TYPE http_request_db_queries histogram",
+        ]
+        for key, hist in sorted(_queries.items()):
+            lines += hist.lines("http_request_db_queries", _labels(key))
+        lines += [
+            "# HELP http_request_db_seconds_total Time spent in SQL statements.",
+            "# TYPE http_request_db_seconds_total counter",
+        ]
+        for key, seconds in sorted(_db_seconds.items()):
+            lines.append(f"http_request_db_seconds_total{{{_labels(key)}}} {seconds}")
+    for name, value in (extra or {}).items():
+        lines += [f"# TYPE {name} counter", f"{name} {value}"]
+    return "\n".join(lines) + "\n"
@@ -1,20 +1,198 @@
-from sqlalchemy import Column, Integer, Date, String, Numeric, Text, Enum as SAEnum
+from sqlalchemy import (
+    DDL, BigInteger, Column, ForeignKey, Integer, Date, DateTime, String, Text, Index, UniqueConstraint,
+    Enum as SAEnum, event, func,
+)
+from sqlalchemy.orm import object_session
 from app.core.database import Base
+from app.core.utils import from_cents
 
 TYPE_ENUM = ("income", "expense")
-CATEGORY_ENUM = ("salary", "carryover", "groceries", "eating_out")
+FREQUENCIES = ("monthly", "weekly", "custom")
+# Owns the data of a single-household install and of requests without an API key
+DEFAULT_ACCOUNT = 1
+# Created with the table; further categories are added through the API
+DEFAULT_CATEGORIES = (
+    ("salary", "income"),
+    ("carryover", "income"),
+    ("groceries", "expense"),
+    ("eating_out", "expense"),
+)
+
+
+class Account(Base):
+    """A household. Every other table carries an `account_id` (deliberately without a
+    foreign key: with ACCOUNT_DB_DIR an account's rows live in a file of their own)."""
+    __tablename__ = "accounts"
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False)
+    # sha256 of the API key; the key itself is only shown once, when issued
+    key_hash = Column(String(64), nullable=True, unique=True, index=True)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+
+@event.listens_for(Account.__table__, "after_create")
+def _insert_default_account(target, connection, **kw):
+    # The first row of a new table, so it gets id DEFAULT_ACCOUNT (explicit ids would leave
+    # a Postgres sequence behind)
+    connection.execute(target.insert(), {"name": "default"})
+
+
+class Category(Base):
+    __tablename__ = "categories"
+    __table_args__ = (UniqueConstraint("account_id", "name", name="uq_categories_account_name"),)
+    id = Column(Integer, primary_key=True)
+    account_id = Column(Integer, nullable=False)
+    name = Column(String(50), nullable=False)
+    # Which add form offers the category; transactions of either type may use it
+    type = Column(
+        SAEnum(*TYPE_ENUM, name="transaction_type", native_enum=False),
+        nullable=False,
+    )
+
+
+def default_categories(account_id: int) -> list[dict]:
+    return [{"account_id": account_id, "name": n, "type": t} for n, t in DEFAULT_CATEGORIES]
+
+
+@event.listens_for(Category.__table__, "after_create")
+def _insert_default_categories(target, connection, **kw):
+    # An account's own database file is created on a connection tagged with its id
+    account_id = connection.get_execution_options().get("account_id", DEFAULT_ACCOUNT)
+    connection.execute(target.insert(), default_categories(account_id))
+
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Every query is for one account; month pages filter on a date range and usually on type
+        Index("ix_transactions_account_date_type", "account_id", "date", "type"),
+        # Lets SUM(amount_cents) for a month be answered from the index alone
+        Index("ix_transactions_account_date_type_amount", "account_id", "date", "type", "amount_cents"),
+        # Set only for imported rows, so re-importing a statement skips what is already there
+        Index("ix_transactions_account_content_hash", "account_id", "content_hash", unique=True),
+    )
     id = Column(Integer, primary_key=True, index=True)
+    account_id = Column(Integer, nullable=False)
     date = Column(Date, nullable=False)
     type = Column(
         SAEnum(*TYPE_ENUM, name="transaction_type", native_enum=False),
         nullable=False,
     )
-    category = Column(
-        SAEnum(*CATEGORY_ENUM, name="transaction_category", native_enum=False),
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
+    # Whole cents, so sums are exact integer arithmetic on every backend
+    amount_cents = Column(Integer, nullable=False)
+    description = Column(Text, nullable=True)
+    content_hash = Column(String(64), nullable=True)
+
+    @property
+    def amount(self):
+        return from_cents(self.amount_cents)
+
+    @property
+    def category(self) -> str:
+        from app.core import categories
+        return categories.name(self.category_id, object_session(self), self.account_id)
+
+
+# Full-text search on descriptions (see `search`). SQLite keeps an FTS5 external-content
+# table in step through triggers; Postgres only needs a GIN index on the tsvector.
+# Created with the table here and by the Alembic migration for existing databases.
+FTS_TABLE = "transactions_fts"
+PG_INDEX = "ix_transactions_description_tsv"
+
+SQLITE_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "description, content='transactions', content_rowid='id', tokenize='porter unicode61')",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON transactions BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, description) VALUES (new.id, new.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON transactions BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, description) VALUES ('delete', old.id, old.description); END",
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF description ON transactions BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, description) VALUES ('delete', old.id, old.description); "
+    f"INSERT INTO {FTS_TABLE}(rowid, description) VALUES (new.id, new.description); END",
+)
+POSTGRES_DDL = (
+    f"CREATE INDEX IF NOT EXISTS {PG_INDEX} ON transactions "
+    "USING gin (to_tsvector('english', coalesce(description, '')))",
+)
+
+for _statement in SQLITE_DDL:
+    event.listen(Transaction.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in POSTGRES_DDL:
+    event.listen(Transaction.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+
+class MonthlyRollup(Base):
+    """Per-month totals by type and category, kept in step with `transactions` on every write."""
+    __tablename__ = "monthly_rollups"
+    account_id = Column(Integer, primary_key=True)
+    month = Column(String(7), primary_key=True)  # YYYY-MM
+    type = Column(
+        SAEnum(*TYPE_ENUM, name="transaction_type", native_enum=False),
+        primary_key=True,
+    )
+    category_id = Column(Integer, ForeignKey("categories.id"), primary_key=True)
+    total_cents = Column(BigInteger, nullable=False, default=0)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class Budget(Base):
+    """Monthly spending limit for a category. What has been spent comes from `monthly_rollups`."""
+    __tablename__ = "budgets"
+    __table_args__ = (UniqueConstraint("account_id", "category_id", name="uq_budgets_account_category"),)
+    id = Column(Integer, primary_key=True)
+    account_id = Column(Integer, nullable=False)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
+    limit_cents = Column(Integer, nullable=False)
+
+    @property
+    def limit(self):
+        return from_cents(self.limit_cents)
+
+    @property
+    def category(self) -> str:
+        from app.core import categories
+        return categories.name(self.category_id, object_session(self), self.account_id)
+
+
+class RecurringRule(Base):
+    """A transaction that repeats, e.g. a salary. `recurring.materialize` turns its
+    occurrences into rows of `transactions`, up to `materialized_through`."""
+    __tablename__ = "recurring_rules"
+    id = Column(Integer, primary_key=True)
+    account_id = Column(Integer, nullable=False, index=True)
+    type = Column(
+        SAEnum(*TYPE_ENUM, name="transaction_type", native_enum=False),
         nullable=False,
     )
-    amount = Column(Numeric(12, 2), nullable=False)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
+    amount_cents = Column(Integer, nullable=False)
     description = Column(Text, nullable=True)
+    # Occurrences are `every` months / weeks / days (custom) apart, counted from start_date
+    frequency = Column(
+        SAEnum(*FREQUENCIES, name="recurring_frequency", native_enum=False),
+        nullable=False,
+    )
+    every = Column(Integer, nullable=False, default=1)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)
+    # Occurrences up to this date exist (or were deleted on purpose) and are not generated again
+    materialized_through = Column(Date, nullable=True)
+
+    @property
+    def amount(self):
+        return from_cents(self.amount_cents)
+
+    @property
+    def category(self) -> str:
+        from app.core import categories
+        return categories.name(self.category_id, object_session(self), self.account_id)
+
+
+class MonthVersion(Base):
+    """Write counter per month; bumped once by every transaction that changes the month."""
+    __tablename__ = "month_versions"
+    account_id = Column(Integer, primary_key=True)
+    month = Column(String(7), primary_key=True)  # YYYY-MM
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
@@ -0,0 +1,128 @@
+"""Recurring transactions.
+
+`materialize` writes every occurrence of the due rules up to a date as ordinary rows
+of `transactions`: one multi-row INSERT for all of them, the rollups updated once per
+touched month, and a single commit. Each occurrence carries a content hash derived
+from its rule and date, so running it again (or concurrently) inserts nothing twice,
+and each rule remembers how far it has been materialized, so rows deleted by hand
+are not brought back.
+"""
+import calendar
+import hashlib
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Iterator
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.core import accounts, config, models, rollups, utils
+from app.core.database import dialect_insert
+
+RR = models.RecurringRule
+T = models.Transaction
+
+
+def occurrences(rule: models.RecurringRule, after: date | None, until: date) -> Iterator[date]:
+    """Dates of the rule later than `after` (if given) and no later than `until` or its end date.
+
+    Monthly rules keep the day of month of their start date, falling back to the last
+    day in shorter months; a rule starting on the 31st lands on every month's last day.
+    Dates end at `date.max`, whatever `until` is.
+    """
+    stop = min(until, rule.end_date) if rule.end_date else until
+    start = rule.start_date
+    if rule.frequency == "monthly":
+        first = start.year * 12 + start.month - 1
+        # Skip straight to the occurrences around `after`
+        k = max(0, (after.year * 12 + after.month - 1 - first) // rule.every) if after else 0
+        while True:
+            year, month = divmod(first + k * rule.every, 12)
+            if year > date.max.year:
+                return
+            day = date(year, month + 1, min(start.day, calendar.monthrange(year, month + 1)[1]))
+            if day > stop:
+                return
+            if after is None or day > after:
+                yield day
+            k += 1
+    step = timedelta(days=rule.every * (7 if rule.frequency == "weekly" else 1))
+    day = start + max(0, (after - start) // step) * step if after else start
+    while day <= stop:
+        if after is None or day > after:
+            yield day
+        if date.max - day < step:
+            return
+        day += step
+
+
+def horizon() -> date:
+    """Last day that listing a month materializes: the end of the current month, plus
+    RECURRING_MONTHS_AHEAD months. Browsing far ahead must not write years of rows."""
+    today = date.today()
+    index = today.year * 12 + today.month - 1 + config.RECURRING_MONTHS_AHEAD
+    return utils.month_bounds(date(index // 12, index % 12 + 1, 1))[1]
+
+
+def occurrence_hash(rule: models.RecurringRule, day: date) -> str:
+    return hashlib.sha256(f"recurring|{rule.id}|{day.isoformat()}".encode()).hexdigest()
+
+
+def _due(db: Session, until: date, all_accounts: bool):
+    query = db.query(RR).filter(
+        RR.start_date <= until,
+        or_(RR.materialized_through.is_(None), RR.materialized_through < until),
+        or_(RR.end_date.is_(None), RR.materialized_through.is_(None), RR.materialized_through < RR.end_date),
+    )
+    if not all_accounts:
+        query = query.filter(RR.account_id == accounts.current(db))
+    return query.all()
+
+
+def materialize(db: Session, until: date, all_accounts: bool = False) -> int:
+    """Insert the occurrences due on or before `until` of the session's account's rules, or of
+    every account's with `all_accounts`, and commit. Returns how many rows were inserted.
+
+    Cheap when nothing is due: one query on `recurring_rules` and no write.
+    """
+    rules = _due(db, until, all_accounts)
+    if not rules:
+        return 0
+    values = []
+    for rule in rules:
+        for day in occurrences(rule, rule.materialized_through, until):
+            values.append({
+                "account_id": rule.account_id,
+                "date": day,
+                "type": rule.type,
+                "category_id": rule.category_id,
+                "amount_cents": rule.amount_cents,
+                "description": rule.description,
+                "content_hash": occurrence_hash(rule, day),
+            })
+        rule.materialized_through = min(until, rule.end_date) if rule.end_date else until
+
+    inserted = []
+    if values:
+        # A Core insert on the session's connection; the ORM's bulk path adds nothing here
+        table = T.__table__
+        stmt = (
+            dialect_insert(db)(table)
+            .on_conflict_do_nothing(index_elements=[table.c.account_id, table.c.content_hash])
+            .returning(table.c.account_id, table.c.date, table.c.type, table.c.category_id, table.c.amount_cents)
+        )
+        inserted = db.connection().execute(stmt, values).all()
+    by_account = defaultdict(list)
+    for account_id, day, tx_type, category_id, cents in inserted:
+        by_account[account_id].append(
+            {"date": day, "type": tx_type, "category_id": category_id, "amount_cents": cents}
+        )
+    own = accounts.current(db)
+    try:
+        for account_id, rows in by_account.items():
+            # Rollups, versions and change notices are kept per account of the session
+            rollups.add_many(accounts.bind(db, account_id), rows)
+    finally:
+        accounts.bind(db, own)
+    db.commit()
+    return len(inserted)
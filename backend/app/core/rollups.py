@@ -0,0 +1,112 @@
+from sqlalchemy import delete, func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from app.core import accounts, changes, models, utils, versions
+from app.core.database import dialect_insert
+
+R = models.MonthlyRollup
+T = models.Transaction
+
+
+def month_key(db: Session, column):
+    """SQL expression bucketing a date column to its YYYY-MM month key."""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.to_char(column, "YYYY-MM")
+    return func.strftime("%Y-%m", column)
+
+
+def _bump(db: Session, month: str, tx_type: str, category_id: int, cents: int, count: int) -> None:
+    account_id = accounts.current(db)
+    stmt = dialect_insert(db)(R).values(
+        account_id=account_id, month=month, type=tx_type, category_id=category_id, total_cents=cents, count=count
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[R.account_id, R.month, R.type, R.category_id],
+        set_={"total_cents": R.total_cents + stmt.excluded.total_cents, "count": R.count + stmt.excluded.count},
+    )
+    db.execute(stmt)
+    if changes.touch(db, month):
+        versions.bump(db, month)
+    if count < 0:
+        db.execute(
+            delete(R).where(
+                R.account_id == account_id, R.month == month, R.type == tx_type,
+                R.category_id == category_id, R.count <= 0,
+            )
+        )
+
+
+def add(db: Session, tx) -> None:
+    """Account for a new transaction. Runs inside the caller's DB transaction."""
+    _bump(db, utils.month_str(tx.date), tx.type, tx.category_id, tx.amount_cents, 1)
+
+
+def remove(db: Session, tx) -> None:
+    """Undo the contribution of a transaction that is being deleted or changed."""
+    _bump(db, utils.month_str(tx.date), tx.type, tx.category_id, -tx.amount_cents, -1)
+
+
+def _grouped_transactions(db: Session):
+    month = month_key(db, T.date)
+    return (
+        select(month.label("month"), T.type, T.category_id, func.sum(T.amount_cents), func.count())
+        .where(T.account_id == accounts.current(db))
+        .group_by(month, T.type, T.category_id)
+    )
+
+
+def _months(db: Session) -> set[str]:
+    return set(db.scalars(select(R.month).where(R.account_id == accounts.current(db)).distinct()))
+
+
+def rebuild(db: Session) -> int:
+    """Recompute the account's rollup rows from `transactions`. Returns the number of rows written.
+
+    Bumps the version of every month that had or now has rollups, so ETags and other
+    processes' caches see the change.
+    """
+    account_id = accounts.current(db)
+    months = _months(db)
+    db.execute(delete(R).where(R.account_id == account_id))
+    changes.touch_all(db)
+    grouped = _grouped_transactions(db).add_columns(literal(account_id))
+    result = db.execute(
+        insert(R).from_select([R.month, R.type, R.category_id, R.total_cents, R.count, R.account_id], grouped)
+    )
+    for month in sorted(months | _months(db)):
+        versions.bump(db, month)
+    db.commit()
+    return result.rowcount
+
+
+def check(db: Session) -> list[tuple]:
+    """Compare the account's rollups against its `transactions`.
+
+    Returns (month, type, category_id, expected, actual) for every key that differs,
+    where expected/actual are (total_cents, count) pairs or None when the row is missing.
+    """
+    expected = {
+        (m, t, c): (total, n)
+        for m, t, c, total, n in db.execute(_grouped_transactions(db))
+    }
+    actual = {
+        (r.month, r.type, r.category_id): (r.total_cents, r.count)
+        for r in db.query(R).filter(R.account_id == accounts.current(db))
+    }
+    return [
+        (*key, expected.get(key), actual.get(key))
+        for key in sorted(expected.keys() | actual.keys())
+        if expected.get(key) != actual.get(key)
+    ]
+
+
+def add_many(db: Session, rows: list[dict]) -> None:
+    """Account for a batch of inserted rows with one upsert per touched rollup key."""
+    deltas: dict[tuple, list] = {}
+    for row in rows:
+        key = (utils.month_str(row["date"]), row["type"], row["category_id"])
+        delta = deltas.setdefault(key, [0, 0])
+        delta[0] += row["amount_cents"]
+        delta[1] += 1
+    for (month, tx_type, category_id), (cents, count) in deltas.items():
+        _bump(db, month, tx_type, category_id, cents, count)
@@ -1,16 +1,24 @@
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+import datetime as dt
 from datetime import date
-from typing import Optional, Literal
+from typing import Annotated, Optional, Literal
 from decimal import Decimal
 
+from app.core.utils import to_cents
+
 TypeLiteral = Literal["income", "expense"]
-CategoryLiteral = Literal["salary", "carryover", "groceries", "eating_out"]
+FrequencyLiteral = Literal["monthly", "weekly", "custom"]
+# Names are checked against the `categories` table when a row is written
+CategoryName = Annotated[str, Field(min_length=1, max_length=50)]
+# Amounts are stored as int64 cents; the bound leaves room to sum millions of them
+MAX_AMOUNT = Decimal("10000000000")
+Amount = Annotated[Decimal, Field(ge=-MAX_AMOUNT, le=MAX_AMOUNT)]
 
 class TransactionBase(BaseModel):
     date: date
     type: TypeLiteral
-    category: CategoryLiteral
-    amount: Decimal
+    category: CategoryName
+    amount: Amount
     description: Optional[str] = None
 
     @field_validator("amount")
@@ -18,16 +26,37 @@ class TransactionBase(BaseModel):
     def validate_amount(cls, v: Decimal) -> Decimal:
         return v.quantize(Decimal("0.01"))
 
+    def to_row(self) -> dict:
+        """Column values for `transactions`, with the amount stored as integer cents."""
+        row = self.model_dump(exclude={"amount"})
+        row["amount_cents"] = to_cents(self.amount)
+        return row
+
 class TransactionCreate(TransactionBase):
     pass
 
 class TransactionUpdate(BaseModel):
-    date: Optional[date] = None
+    # `date` is shadowed by the field default inside the class body
+    date: Optional[dt.date] = None
     type: Optional[TypeLiteral] = None
-    category: Optional[CategoryLiteral] = None
-    amount: Optional[Decimal] = None
+    category: Optional[CategoryName] = None
+    amount: Optional[Amount] = None
     description: Optional[str] = None
 
+    @field_validator("date", "type", "category", "amount")
+    @classmethod
+    def not_null(cls, v):
+        # Omitted fields stay unchanged; an explicit null would clear a required column
+        if v is None:
+            raise ValueError("must not be null")
+        return v
+
+    def to_row(self) -> dict:
+        row = self.model_dump(exclude_unset=True, exclude={"amount"})
+        if self.amount is not None:
+            row["amount_cents"] = to_cents(self.amount)
+        return row
+
 class TransactionRead(TransactionBase):
     id: int
 
@@ -38,3 +67,117 @@ class Summary(BaseModel):
     income: float
     expenses: float
     net: float
+    categories: dict[str, float] = {}
+
+class MonthSummary(Summary):
+    month: str
+    previous_year: Optional[Summary] = None
+
+class BulkResult(BaseModel):
+    inserted: int = 0
+    duplicates: int = 0
+    errors: list[dict] = []
+
+class CategoryCreate(BaseModel):
+    name: CategoryName
+    type: TypeLiteral
+
+class CategoryUpdate(BaseModel):
+    name: Optional[CategoryName] = None
+    type: Optional[TypeLiteral] = None
+
+    @field_validator("name", "type")
+    @classmethod
+    def not_null(cls, v):
+        if v is None:
+            raise ValueError("must not be null")
+        return v
+
+class CategoryRead(CategoryCreate):
+    id: int
+
+    class Config:
+        from_attributes = True
+
+class BudgetCreate(BaseModel):
+    category: CategoryName
+    limit: Decimal = Field(gt=0, le=MAX_AMOUNT, description="Monthly limit for expenses in the category")
+
+    def to_row(self) -> dict:
+        return {"category": self.category, "limit_cents": to_cents(self.limit)}
+
+class BudgetUpdate(BaseModel):
+    limit: Decimal = Field(gt=0, le=MAX_AMOUNT)
+
+class BudgetRead(BaseModel):
+    id: int
+    category: str
+    limit: Decimal
+
+    class Config:
+        from_attributes = True
+
+class BudgetStatus(BaseModel):
+    category: str
+    limit: Decimal
+    spent: Decimal
+    remaining: Decimal
+    over: bool
+
+class Trend(BaseModel):
+    series: list[float] = Field(description="Total per month")
+    average: float = Field(description="Mean monthly total over the range")
+    change_pct: list[Optional[float]] = Field(description="Change from the previous month; null when that was zero")
+    rolling_3: list[float] = Field(description="Mean of the 3 months ending at each month")
+    rolling_12: list[float] = Field(description="Mean of the 12 months ending at each month")
+
+class CategoryTrend(Trend):
+    category: str
+    type: TypeLiteral
+    total: float
+
+class Analytics(BaseModel):
+    months: list[str]
+    income: Trend
+    expenses: Trend
+    categories: list[CategoryTrend]
+    top_categories: list[str] = Field(description="Expense categories with the largest totals, largest first")
+
+class RecurringCreate(BaseModel):
+    type: TypeLiteral
+    category: CategoryName
+    amount: Decimal = Field(gt=0, le=MAX_AMOUNT)
+    description: Optional[str] = None
+    frequency: FrequencyLiteral
+    every: int = Field(1, ge=1, le=366, description="Months, weeks or (custom) days between occurrences")
+    start_date: date
+    end_date: Optional[date] = None
+
+    @model_validator(mode="after")
+    def check_dates(self):
+        if self.end_date is not None and self.end_date < self.start_date:
+            raise ValueError("end_date must not be before start_date")
+        return self
+
+    def to_row(self) -> dict:
+        row = self.model_dump(exclude={"amount"})
+        row["amount_cents"] = to_cents(self.amount)
+        return row
+
+class RecurringUpdate(BaseModel):
+    amount: Optional[Decimal] = Field(None, gt=0, le=MAX_AMOUNT)
+    description: Optional[str] = None
+    end_date: Optional[date] = None
+
+    def to_row(self) -> dict:
+        row = self.model_dump(exclude_unset=True, exclude={"amount"})
+        if self.amount is not None:
+            row["amount_cents"] = to_cents(self.amount)
+        return row
+
+class RecurringRead(RecurringCreate):
+    id: int
+    materialized_through: Optional[date] = None
+
+    class Config:
+        from_attributes = True
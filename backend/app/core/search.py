@@ -0,0 +1,84 @@
+"""Full-text search over transaction descriptions.
+
+SQLite matches against the FTS5 table `transactions_fts`, Postgres against a GIN index
+on the description's tsvector; see `models` for how both are created.
+"""
+import re
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import column, func, literal_column, select, table, text
+from sqlalchemy.orm import Session
+
+from app.core import accounts, categories, models
+
+T = models.Transaction
+
+FTS_TABLE = models.FTS_TABLE
+FTS = table(FTS_TABLE, column("rowid"))
+
+
+def terms(q: str) -> list[str]:
+    """Words of a query; everything else is dropped, so user input never reaches the
+    MATCH/tsquery syntax."""
+    return re.findall(r"\w+", q)
+
+
+@contextmanager
+def bulk_load(db: Session) -> Iterator[None]:
+    """Index rows inserted inside the block in one pass at the end instead of per row.
+
+    Only changes anything on SQLite, where the insert trigger is dropped meanwhile. It is
+    restored, and the rows committed so far indexed, even if the block fails.
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        yield
+        return
+    last_id = db.query(func.max(T.id)).scalar() or 0
+    db.execute(text(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai"))
+    try:
+        yield
+    except BaseException:
+        # Whatever the block left uncommitted goes, so the session can restore the trigger
+        db.rollback()
+        raise
+    finally:
+        db.execute(
+            text(f"INSERT INTO {FTS_TABLE}(rowid, description) SELECT id, description FROM transactions WHERE id > :id"),
+            {"id": last_id},
+        )
+        db.execute(text(models.SQLITE_DDL[1]))
+        db.commit()
+
+
+def search(db: Session, q: str, limit: int, offset: int = 0) -> list[models.Transaction]:
+    """Up to `limit + 1` of the account's transactions whose description matches every word
+    of `q` as a prefix, best match first and newest first among equals.
+
+    Every match is ranked, in SQL, so a page is a stable slice of one ordering however
+    deep `offset` goes.
+    """
+    words = terms(q)
+    if not words:
+        return []
+    account_id = accounts.current(db)
+    if db.get_bind().dialect.name == "postgresql":
+        vector = func.to_tsvector(literal_column("'english'"), func.coalesce(T.description, ""))
+        query = func.to_tsquery(literal_column("'english'"), " & ".join(f"{w}:*" for w in words))
+        stmt = (
+            select(T)
+            .where(T.account_id == account_id, vector.op("@@")(query))
+            .order_by(func.ts_rank(vector, query).desc(), T.id.desc())
+        )
+    else:
+        stmt = (
+            select(T)
+            .join_from(FTS, T, T.id == FTS.c.rowid)
+            .where(text(f"{FTS_TABLE} MATCH :match").bindparams(match=" ".join(f'"{w}"*' for w in words)))
+            .where(T.account_id == account_id)
+            # bm25 is lower for better matches
+            .order_by(literal_column(f"bm25({FTS_TABLE})"), T.id.desc())
+        )
+    rows = db.scalars(stmt.limit(limit + 1).offset(offset)).all()
+    categories.ensure(db, {row.category_id for row in rows})
+    return rows
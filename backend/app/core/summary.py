@@ -0,0 +1,88 @@
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy.orm import Session
+
+from app.core import accounts, categories, models, schemas, utils, versions
+from app.core.cache import cache
+
+
+@dataclass
+class MonthTotals:
+    """Month totals in integer cents; the Decimal properties convert for display."""
+    income_cents: int = 0
+    expenses_cents: int = 0
+    categories: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def income(self) -> Decimal:
+        return utils.from_cents(self.income_cents)
+
+    @property
+    def expenses(self) -> Decimal:
+        return utils.from_cents(self.expenses_cents)
+
+    @property
+    def net(self) -> Decimal:
+        return utils.from_cents(self.income_cents - self.expenses_cents)
+
+    def to_schema(self, categories: bool = True) -> schemas.Summary:
+        return schemas.Summary(
+            income=self.income_cents / 100,
+            expenses=self.expenses_cents / 100,
+            net=(self.income_cents - self.expenses_cents) / 100,
+            categories={k: v / 100 for k, v in self.categories.items()} if categories else {},
+        )
+
+    def add(self, tx_type: str, category: str, cents: int) -> None:
+        if tx_type == "income":
+            self.income_cents += cents
+        else:
+            self.expenses_cents += cents
+        self.categories[category] = self.categories.get(category, 0) + cents
+
+
+def month_totals(db: Session, first: date) -> MonthTotals:
+    """Income, expense and per-category totals for a month, read from `monthly_rollups`."""
+    R = models.MonthlyRollup
+    rows = (
+        db.query(R.type, R.category_id, R.total_cents)
+        .filter(R.account_id == accounts.current(db), R.month == utils.month_str(first))
+        .all()
+    )
+    totals = MonthTotals()
+    for tx_type, category_id, cents in rows:
+        totals.add(tx_type, categories.name(category_id, db), cents)
+    return totals
+
+
+def cached_month_totals(db: Session, first: date, version: versions.Version | None = None) -> MonthTotals:
+    """Totals cached under the month's version, so an entry left behind by a write served
+    in another process is never returned for the newer version (and its ETag).
+
+    Pass the version the caller already read to tie the result to it.
+    """
+    month = utils.month_str(first)
+    version = version or versions.get(db, month)
+    return cache.get_or_set(
+        accounts.scoped(db, month), f"totals:{version.number}", lambda: month_totals(db, first)
+    )
+
+
+def range_totals(db: Session, first: date, last: date) -> dict[str, MonthTotals]:
+    """Totals for every month from `first` to `last` inclusive, keyed by YYYY-MM.
+
+    Months without transactions are present with zero totals.
+    """
+    R = models.MonthlyRollup
+    start, stop = utils.month_str(first), utils.month_str(last)
+    series = {key: MonthTotals() for key in utils.month_range(start, stop)}
+    rows = (
+        db.query(R.month, R.type, R.category_id, R.total_cents)
+        .filter(R.account_id == accounts.current(db), R.month.between(start, stop))
+        .all()
+    )
+    for month, tx_type, category_id, cents in rows:
+        series[month].add(tx_type, categories.name(category_id, db), cents)
+    return series
@@ -1,4 +1,5 @@
 from datetime import datetime, date
+from decimal import Decimal, ROUND_HALF_UP
 import calendar
 
 
@@ -36,3 +37,29 @@ def next_month_str(month_str_input: str) -> str:
         y += 1
         m = 1
     return f"{y:04d}-{m:02d}"
+
+
+def month_range(first_month: str, last_month: str) -> list[str]:
+    """YYYY-MM keys from `first_month` to `last_month` inclusive."""
+    keys = []
+    key = month_str(parse_month(first_month))
+    last = month_str(parse_month(last_month))
+    while key <= last:
+        keys.append(key)
+        if key == last:
+            # The month after 9999-12 is not a date
+            break
+        key = next_month_str(key)
+    return keys
+
+
+CENT = Decimal("0.01")
+
+
+def to_cents(amount) -> int:
+    """Amount in currency units (Decimal, str or number) as whole cents, rounding half up."""
+    return int((Decimal(str(amount)) / CENT).quantize(Decimal(1), ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
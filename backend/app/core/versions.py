@@ -0,0 +1,72 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+from app.core import accounts, models
+from app.core.database import dialect_insert
+
+V = models.MonthVersion
+
+
+@dataclass(frozen=True)
+class Version:
+    month: str
+    number: int = 0
+    updated_at: datetime | None = None  # naive UTC
+    account_id: int = accounts.DEFAULT_ACCOUNT
+
+
+def bump(db: Session, month: str) -> None:
+    """Increment a month's version inside the caller's transaction."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    stmt = dialect_insert(db)(V).values(account_id=accounts.current(db), month=month, version=1, updated_at=now)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[V.account_id, V.month],
+        set_={"version": V.version + 1, "updated_at": stmt.excluded.updated_at},
+    )
+    db.execute(stmt)
+
+
+def get(db: Session, month: str) -> Version:
+    account_id = accounts.current(db)
+    row = db.get(V, (account_id, month))
+    if row is None:
+        return Version(month, account_id=account_id)
+    return Version(month, row.version, row.updated_at, account_id)
+
+
+def etag(request: Request, version: Version) -> str:
+    """Strong ETag for this month version of an account and the exact URL being served."""
+    url = f"{version.account_id}|{request.url.path}?{request.url.query}"
+    variant = hashlib.sha1(url.encode()).hexdigest()[:12]
+    return f'"{version.month}.{version.number}.{variant}"'
+
+
+def headers(request: Request, version: Version) -> dict[str, str]:
+    # The same URL serves each account its own data
+    result = {"ETag": etag(request, version), "Cache-Control": "no-cache", "Vary": "X-API-Key"}
+    if version.updated_at:
+        result["Last-Modified"] = format_datetime(version.updated_at.replace(tzinfo=timezone.utc), usegmt=True)
+    return result
+
+
+def not_modified(request: Request, version: Version) -> bool:
+    """Evaluate If-None-Match (preferred) or If-Modified-Since against a month version."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {t.strip() for t in if_none_match.split(",")}
+        return "*" in tags or etag(request, version) in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and version.updated_at:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return version.updated_at.replace(tzinfo=timezone.utc) <= since
+    return False
@@ -1,4 +1,5 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
@@ -6,8 +7,14 @@ from fastapi.openapi.utils import get_openapi
 
 from app.api.v1.transactions import router as transactions_router
 from app.api.v1.summary import router as summary_router
+from app.api.v1.categories import router as categories_router
+from app.api.v1.budgets import router as budgets_router
+from app.api.v1.analytics import router as analytics_router
+from app.api.v1.recurring import router as recurring_router
 from app.web.routes import router as web_router
-from app.core.database import Base, engine
+from app.core import database, metrics
+from app.core.cache import cache
+from app.core.config import CREATE_SCHEMA, METRICS_ENABLED
 import app.core.models  # ensure models are imported
 
 app = FastAPI(title="Monthly Spending Tracker", swagger_ui_parameters={"persistAuthorization": True})
@@ -26,14 +33,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Create tables on startup (dev convenience)
+# Request timing and SQL counts; inert unless METRICS_ENABLED is set
+app.add_middleware(metrics.MetricsMiddleware)
+
+# Startup does no I/O: the engine connects on the first request, and the schema comes
+# from Alembic unless CREATE_SCHEMA asks for create_all (dev convenience)
 @app.on_event("startup")
 async def on_startup():
-    Base.metadata.create_all(bind=engine)
+    if CREATE_SCHEMA:
+        database.Base.metadata.create_all(bind=database.get_engine())
+    if METRICS_ENABLED:
+        metrics.enable()
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    await database.dispose()
 
 # API routers
 app.include_router(transactions_router)
 app.include_router(summary_router)
+app.include_router(categories_router)
+app.include_router(budgets_router)
+app.include_router(analytics_router)
+app.include_router(recurring_router)
 
 # Web routes
 app.include_router(web_router)
@@ -44,6 +67,19 @@ async def healthz():
     return {"ok": True}
 
 
+@app.get("/cache/stats", include_in_schema=False)
+async def cache_stats():
+    return cache.stats()
+
+
+@app.get("/metrics", include_in_schema=False, response_class=PlainTextResponse)
+async def prometheus_metrics():
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    stats = cache.stats()
+    return metrics.render({"cache_hits_total": stats["hits"], "cache_misses_total": stats["misses"]})
+
+
 # Add OpenAPI security scheme for API key header so Swagger shows Authorize button
 @app.get("/openapi.json")
 async def custom_openapi():
@@ -1,85 +1,92 @@
+import os
+from functools import lru_cache
+
 from fastapi import APIRouter, Request, Depends
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import StreamingResponse
+from markupsafe import Markup
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.core import utils, models
-from app.core.dependencies import get_db
-from app.core.config import APP_API_KEY, DEBUG
+from app.core import accounts, budgets, categories, crud, live, utils, versions
+from app.core.cache import cache
+from app.core.dependencies import get_account, get_session, run_db
+from app.core.config import APP_API_KEY, DEBUG, TEMPLATE_CACHE_DIR
 
-templates = Jinja2Templates(directory="app/templates")
 router = APIRouter()
 
 
-@router.get("/")
-def dashboard(request: Request, month: str | None = None, db: Session = Depends(get_db)):
-    first = utils.parse_month(month)
-    start, end = utils.month_bounds(first)
+@lru_cache(maxsize=None)
+def get_templates():
+    """The Jinja environment, built (and Jinja imported) on the first page render."""
+    from fastapi.templating import Jinja2Templates
+    from jinja2 import FileSystemBytecodeCache
 
-    income_rows = (
-        db.query(models.Transaction)
-        .filter(models.Transaction.type == "income", models.Transaction.date.between(start, end))
-        .order_by(models.Transaction.date.desc())
-        .all()
-    )
-    expense_rows = (
-        db.query(models.Transaction)
-        .filter(models.Transaction.type == "expense", models.Transaction.date.between(start, end))
-        .order_by(models.Transaction.date.desc())
-        .all()
-    )
+    os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+    templates = Jinja2Templates(directory="app/templates")
+    templates.env.bytecode_cache = FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+    # Outside development there is no need to stat template files on every render
+    templates.env.auto_reload = DEBUG
+    return templates
+
+
+def render_month_fragment(db: Session, first, template: str) -> Markup:
+    """Render the month-specific part of a page, cached per month and data version.
+
+    On a hit neither the rows nor the totals are loaded.
+    """
+    month = utils.month_str(first)
+    version = versions.get(db, month)
+
+    def render():
+        rows, totals = crud.month_page(db, first, version)
+        return get_templates().get_template(template).render(
+            incomes=[x for x in rows if x.type == "income"],
+            expenses=[x for x in rows if x.type == "expense"],
+            transactions=rows,
+            income_total=totals.income,
+            expense_total=totals.expenses,
+        )
 
-    income_total = sum(float(x.amount) for x in income_rows)
-    expense_total = sum(float(x.amount) for x in expense_rows)
+    return Markup(cache.get_or_set(accounts.scoped(db, month), f"fragment:{template}:{version.number}", render))
 
+
+def page_context(first, fragment: Markup) -> dict:
     month_iso = utils.month_str(first)
-    month_label = first.strftime("%B, %Y")
-
-    return templates.TemplateResponse(
-        "index.html",
-        {
-            "request": request,
-            "month": month_iso,
-            "month_label": month_label,
-            "prev_month": utils.prev_month_str(month_iso),
-            "next_month": utils.next_month_str(month_iso),
-            "incomes": income_rows,
-            "expenses": expense_rows,
-            "income_total": income_total,
-            "expense_total": expense_total,
-            "api_key": APP_API_KEY if DEBUG else "",  # Only expose in dev
-        },
-    )
+    return {
+        "month": month_iso,
+        "month_label": first.strftime("%B, %Y"),
+        "prev_month": utils.prev_month_str(month_iso),
+        "next_month": utils.next_month_str(month_iso),
+        "month_fragment": fragment,
+        "api_key": APP_API_KEY if DEBUG else "",  # Only expose in dev
+    }
 
 
-@router.get("/transactions")
-def transactions_page(request: Request, month: str | None = None, db: Session = Depends(get_db)):
+@router.get("/")
+async def dashboard(request: Request, month: str | None = None, db: AsyncSession | Session = Depends(get_session)):
     first = utils.parse_month(month)
-    start, end = utils.month_bounds(first)
+    fragment = await run_db(db, render_month_fragment, first, "_dashboard_month.html")
+    context = page_context(first, fragment)
+    # For the add forms
+    context["categories"] = await run_db(db, categories.get_all)
+    # Not part of the cached fragment: budgets change independently of the month's rows
+    context["budgets"] = await run_db(db, budgets.status, first)
+    return get_templates().TemplateResponse(request, "index.html", context)
 
-    txs = (
-        db.query(models.Transaction)
-        .filter(models.Transaction.date.between(start, end))
-        .order_by(models.Transaction.date.desc())
-        .all()
-    )
 
-    income_total = sum(float(x.amount) for x in txs if x.type == "income")
-    expense_total = sum(float(x.amount) for x in txs if x.type == "expense")
+@router.get("/transactions")
+async def transactions_page(request: Request, month: str | None = None, db: AsyncSession | Session = Depends(get_session)):
+    first = utils.parse_month(month)
+    fragment = await run_db(db, render_month_fragment, first, "_transactions_month.html")
+    return get_templates().TemplateResponse(request, "transactions.html", page_context(first, fragment))
 
-    month_iso = utils.month_str(first)
-    month_label = first.strftime("%B, %Y")
-
-    return templates.TemplateResponse(
-        "transactions.html",
-        {
-            "request": request,
-            "month": month_iso,
-            "month_label": month_label,
-            "prev_month": utils.prev_month_str(month_iso),
-            "next_month": utils.next_month_str(month_iso),
-            "transactions": txs,
-            "income_total": income_total,
-            "expense_total": expense_total,
-            "api_key": APP_API_KEY if DEBUG else "",  # Only expose in dev
-        },
+
+@router.get("/events")
+async def month_events(request: Request, month: str | None = None, account_id: int = Depends(get_account)):
+    """Server-Sent Events for the pages showing a month: row and totals deltas as writes land."""
+    key = live.key(account_id, utils.month_str(utils.parse_month(month)))
+    return StreamingResponse(
+        live.stream(key, request.is_disconnected),
+        media_type="text/event-stream",
+        # No buffering by proxies: each event should reach the page as soon as it is sent
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
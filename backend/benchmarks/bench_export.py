@@ -0,0 +1,86 @@
+"""Export throughput and peak memory.
+
+Loads a temporary SQLite database with synthetic rows, then streams it through
+`app.core.export` into a null sink and reports rows/sec and peak RSS.
+
+    python benchmarks/bench_export.py --rows 200000 --format csv
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core import categories, export, models
+from app.core.database import Base
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def populate(db, rows: int) -> None:
+    rng = random.Random(42)
+    first = date(2015, 1, 1)
+    ids = {c.name: c.id for c in categories.get_all(db)}
+    batch = []
+    for i in range(rows):
+        batch.append({
+            "account_id": models.DEFAULT_ACCOUNT,
+            "date": first + timedelta(days=rng.randrange(3650)),
+            "type": "expense",
+            "category_id": ids[rng.choice(("groceries", "eating_out"))],
+            "amount_cents": rng.randrange(100, 20000),
+            "description": f"row {i}",
+        })
+        if len(batch) == 10000:
+            db.execute(insert(models.Transaction), batch)
+            batch.clear()
+    if batch:
+        db.execute(insert(models.Transaction), batch)
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--format", choices=sorted(export.FORMATS), default="csv")
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    try:
+        with sessionmaker(bind=engine)() as db:
+            populate(db, args.rows)
+        rss_before = peak_rss_mb()
+
+        generate, _ = export.FORMATS[args.format]
+        out_bytes = 0
+        t0 = time.perf_counter()
+        with sessionmaker(bind=engine)() as db:
+            for chunk in generate(db):
+                out_bytes += len(chunk)
+        elapsed = time.perf_counter() - t0
+
+        print(f"format={args.format} rows={args.rows} bytes={out_bytes}")
+        print(f"elapsed={elapsed:.2f}s throughput={args.rows / elapsed:,.0f} rows/s")
+        print(f"peak_rss={peak_rss_mb():.1f}MB (after load: {rss_before:.1f}MB)")
+    finally:
+        engine.dispose()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
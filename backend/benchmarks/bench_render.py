@@ -0,0 +1,84 @@
+"""Dashboard / transactions page render time for large months.
+
+Fills one month of a temporary SQLite database with N rows and times page
+requests: the first (fragment cache miss), then repeated hits.
+
+    python benchmarks/bench_render.py --rows 5000 --repeat 50
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+from decimal import Decimal
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)  # templates are resolved relative to backend/
+
+fd, DB_PATH = tempfile.mkstemp(suffix=".db")
+os.close(fd)
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core import bulk  # noqa: E402
+from app.core.cache import cache  # noqa: E402
+from app.core.database import Base, SessionLocal, get_engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+def populate(rows: int) -> None:
+    rng = random.Random(7)
+    categories = {"income": ("salary", "carryover"), "expense": ("groceries", "eating_out")}
+    items = []
+    for i in range(rows):
+        tx_type = rng.choice(("income", "expense"))
+        items.append({
+            "date": date(2025, 9, rng.randint(1, 30)),
+            "type": tx_type,
+            "category": rng.choice(categories[tx_type]),
+            "amount": Decimal(rng.randrange(100, 50000)) / 100,
+            "description": f"row {i}",
+        })
+    with SessionLocal() as db:
+        bulk.import_rows(db, items)
+
+
+def timed(client, path: str) -> float:
+    t0 = time.perf_counter()
+    res = client.get(path, params={"month": "2025-09"})
+    elapsed = time.perf_counter() - t0
+    assert res.status_code == 200
+    return elapsed * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=get_engine())
+    try:
+        populate(args.rows)
+        with TestClient(app) as client:
+            for path in ("/", "/transactions"):
+                cache.clear()
+                cold = timed(client, path)
+                warm = [timed(client, path) for _ in range(args.repeat)]
+                print(
+                    f"{path:<14} rows={args.rows} miss={cold:.1f}ms "
+                    f"hit p50={statistics.median(warm):.2f}ms max={max(warm):.2f}ms"
+                )
+        print(f"cache: {cache.stats()}")
+    finally:
+        get_engine().dispose()
+        os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Worker cold start: importing `app.main` and serving the first request.
+
+Each run is a fresh interpreter. Reports wall time per phase and the modules with
+the largest cumulative import time (from `python -X importtime`).
+
+    python benchmarks/bench_startup.py --runs 5 --top 15
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+PROBE = """
+import time
+t0 = time.perf_counter()
+import app.main
+t1 = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app.main.app) as client:
+    t2 = time.perf_counter()
+    client.get("/healthz")
+    t3 = time.perf_counter()
+print(t1 - t0, t2 - t1, t3 - t2)
+"""
+
+
+def parse_importtime(stderr: str) -> list[tuple[int, str]]:
+    """(cumulative microseconds, module) for every line of `-X importtime` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), name.rstrip()))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    fd, db_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{db_path}", "PYTHONPATH": BACKEND_DIR}
+    try:
+        phases = []
+        for _ in range(args.runs):
+            out = subprocess.run(
+                [sys.executable, "-c", PROBE], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+            ).stdout
+            phases.append([float(x) * 1000 for x in out.split()])
+        for i, label in enumerate(("import", "startup", "first request")):
+            values = [p[i] for p in phases]
+            print(f"{label:<14} median={statistics.median(values):.1f}ms max={max(values):.1f}ms")
+
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import app.main"],
+            cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+        )
+        print("\nslowest imports (cumulative):")
+        for cumulative, name in sorted(parse_importtime(result.stderr), reverse=True)[:args.top]:
+            print(f"{cumulative / 1000:8.1f}ms  {name}")
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compare two benchmarks/run.py result files and flag regressions.
+
+    python benchmarks/compare.py base.json head.json --threshold 10
+
+Exits with status 1 when any scenario's p50 or p95 latency grew by more than
+--threshold percent.
+"""
+import argparse
+import json
+import sys
+
+METRICS = ("p50_ms", "p95_ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent")
+    args = parser.parse_args()
+
+    with open(args.base) as fh:
+        base = json.load(fh)
+    with open(args.head) as fh:
+        head = json.load(fh)
+
+    print(f"base {base['meta'].get('commit')}  head {head['meta'].get('commit')}")
+    regressions = []
+    for name in sorted(base["results"].keys() & head["results"].keys()):
+        cells = []
+        for metric in METRICS:
+            old, new = base["results"][name][metric], head["results"][name][metric]
+            change = (new - old) / old * 100 if old else 0.0
+            cells.append(f"{metric} {old:8.2f} -> {new:8.2f} ({change:+6.1f}%)")
+            if change > args.threshold:
+                regressions.append(f"{name} {metric} {change:+.1f}%")
+        print(f"{name:<18} " + "   ".join(cells))
+
+    if regressions:
+        print("Regressions over threshold: " + ", ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Synthetic transaction datasets, built on `scripts/seed.py`'s generator.
+
+Every month gets the salary and carryover income rows; the remaining rows are
+expenses spread across the seed categories. Generation is deterministic for a
+given seed.
+"""
+from typing import Iterator
+
+from sqlalchemy.orm import Session
+
+from app.core import utils
+from scripts import seed
+
+
+def month_range(first: str, months: int) -> list[str]:
+    keys = [first]
+    for _ in range(months - 1):
+        keys.append(utils.next_month_str(keys[-1]))
+    return keys
+
+
+def generate(rows: int, months: list[str], seed_value: int = 1) -> Iterator[dict]:
+    """Dataset rows shaped as API request bodies."""
+    for tx_date, tx_type, category, cents, description in seed.generate_rows(rows, months, seed_value):
+        yield {
+            "date": tx_date.isoformat(),
+            "type": tx_type,
+            "category": category,
+            "amount": str(utils.from_cents(cents)),
+            "description": description,
+        }
+
+
+def load(db: Session, rows: int, months: list[str], seed_value: int = 1) -> int:
+    """Bulk-load a dataset and rebuild the rollups once at the end."""
+    return seed.load_rows(db, seed.generate_rows(rows, months, seed_value))
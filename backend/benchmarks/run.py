@@ -0,0 +1,190 @@
+"""Latency and throughput benchmarks for the API and web routes.
+
+Loads a synthetic dataset (see benchmarks/datasets.py) into SQLite or Postgres,
+drives the app in-process with TestClient and writes JSON results that
+benchmarks/compare.py can diff between commits.
+
+    python benchmarks/run.py --rows 100000 --years 10
+    python benchmarks/run.py --database-url postgresql://localhost/mst_bench --rows 1000000
+    python benchmarks/compare.py benchmarks/results/old.json benchmarks/results/new.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+RESULTS_DIR = os.path.join(BACKEND_DIR, "benchmarks", "results")
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples_ms: list[float], wall_s: float, units: int | None = None) -> dict:
+    result = {
+        "count": len(samples_ms),
+        "mean_ms": statistics.fmean(samples_ms),
+        "p50_ms": percentile(samples_ms, 50),
+        "p95_ms": percentile(samples_ms, 95),
+        "p99_ms": percentile(samples_ms, 99),
+        "max_ms": max(samples_ms),
+        "throughput_rps": len(samples_ms) / wall_s,
+    }
+    if units is not None:
+        result["rows_per_s"] = units / wall_s
+    return result
+
+
+def timed_requests(client, method: str, make_request, n: int, check=None) -> tuple[list[float], float]:
+    samples = []
+    wall = time.perf_counter()
+    for i in range(n):
+        path, kwargs = make_request(i)
+        t0 = time.perf_counter()
+        res = client.request(method, path, **kwargs)
+        samples.append((time.perf_counter() - t0) * 1000)
+        if res.status_code >= 400:
+            raise RuntimeError(f"{method} {path} -> {res.status_code}: {res.text[:200]}")
+        if check:
+            check(res)
+    return samples, time.perf_counter() - wall
+
+
+def git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="Target database (default: a temporary SQLite file)")
+    parser.add_argument("--rows", type=int, default=10000, help="Dataset size, e.g. 10000 to 10000000")
+    parser.add_argument("--years", type=int, default=5, help="History spread over this many years")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per read scenario")
+    parser.add_argument("--bulk-batches", type=int, default=10, help="POST /bulk requests of --bulk-size rows")
+    parser.add_argument("--bulk-size", type=int, default=1000)
+    parser.add_argument("--exports", type=int, default=3, help="Export requests, one year each")
+    parser.add_argument("--cache", choices=("memory", "none"), default="memory")
+    parser.add_argument("--reuse", action="store_true", help="Keep an existing dataset instead of loading one")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", help="Results file (default: benchmarks/results/<commit>-<backend>.json)")
+    args = parser.parse_args()
+
+    temp_path = None
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    else:
+        fd, temp_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        os.environ["DATABASE_URL"] = f"sqlite:///{temp_path}"
+    os.environ["CACHE_BACKEND"] = args.cache
+    sys.path.insert(0, BACKEND_DIR)
+    os.chdir(BACKEND_DIR)  # templates are resolved relative to backend/
+
+    # Imported late so the environment above configures the app
+    import sqlalchemy
+    from fastapi.testclient import TestClient
+    from app.core.database import Base, SessionLocal, get_engine
+    from app.main import app
+    from benchmarks import datasets
+
+    engine = get_engine()
+
+    rng = random.Random(args.seed)
+    months = datasets.month_range(f"{datetime.now().year - args.years}-01", args.years * 12)
+    results = {}
+    try:
+        Base.metadata.create_all(bind=engine)
+        if not args.reuse:
+            with SessionLocal() as db:
+                t0 = time.perf_counter()
+                loaded = datasets.load(db, args.rows, months, args.seed)
+                load_s = time.perf_counter() - t0
+            print(f"loaded {loaded} rows over {len(months)} months in {load_s:.1f}s ({loaded / load_s:,.0f} rows/s)")
+
+        with TestClient(app) as client:
+            random_month = lambda i: {"params": {"month": rng.choice(months)}}
+            read_scenarios = {
+                "list_transactions": "/api/v1/transactions/",
+                "month_summary": "/api/v1/summary/",
+                "dashboard": "/",
+                "transactions_page": "/transactions",
+            }
+            for name, path in read_scenarios.items():
+                samples, wall = timed_requests(client, "GET", lambda i: (path, random_month(i)), args.requests)
+                results[name] = summarize(samples, wall)
+
+            whole_range = {"params": {"from": months[0], "to": months[-1]}}
+            samples, wall = timed_requests(client, "GET", lambda i: ("/api/v1/analytics/", whole_range), args.requests)
+            results["analytics"] = summarize(samples, wall)
+
+            # Writes land in a month after the dataset so reads above are unaffected on reruns
+            bulk_month = datasets.month_range(months[-1], 2)[-1]
+            batch = list(datasets.generate(args.bulk_size, [bulk_month], args.seed))
+            samples, wall = timed_requests(
+                client, "POST", lambda i: ("/api/v1/transactions/bulk", {"json": batch}), args.bulk_batches
+            )
+            results["bulk_write"] = summarize(samples, wall, units=args.bulk_size * args.bulk_batches)
+
+            exported = 0
+
+            def count_rows(res):
+                nonlocal exported
+                exported += res.text.count("\n") - 1  # minus the CSV header
+
+            years = sorted({m[:4] for m in months})
+            samples, wall = timed_requests(
+                client,
+                "GET",
+                lambda i: ("/api/v1/transactions/export", {"params": {"from": f"{years[i % len(years)]}-01", "to": f"{years[i % len(years)]}-12"}}),
+                args.exports,
+                check=count_rows,
+            )
+            results["export"] = summarize(samples, wall, units=exported)
+    finally:
+        engine.dispose()
+        if temp_path:
+            os.remove(temp_path)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "backend": engine.dialect.name,
+            "rows": args.rows,
+            "years": args.years,
+            "cache": args.cache,
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+        },
+        "results": results,
+    }
+    for name, r in results.items():
+        extra = f" {r['rows_per_s']:,.0f} rows/s" if "rows_per_s" in r else ""
+        print(f"{name:<18} p50={r['p50_ms']:.2f}ms p95={r['p95_ms']:.2f}ms p99={r['p99_ms']:.2f}ms "
+              f"{r['throughput_rps']:.1f} req/s{extra}")
+
+    out = args.out or os.path.join(RESULTS_DIR, f"{report['meta']['commit'] or 'local'}-{engine.dialect.name}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"wrote {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import argparse
+import sys
+
+from app.core.database import SessionLocal
+from app.core import accounts, models
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage accounts and their API keys")
+    sub = parser.add_subparsers(dest="command", required=True)
+    create = sub.add_parser("create", help="Add an account and print its API key")
+    create.add_argument("name")
+    rotate = sub.add_parser("rotate-key", help="Replace an account's API key and print the new one")
+    rotate.add_argument("id", type=int)
+    sub.add_parser("list", help="List accounts")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        if args.command == "create":
+            account, key = accounts.create_account(db, args.name)
+            print(f"Created account {account.id} ({account.name})\nAPI key: {key}")
+        elif args.command == "rotate-key":
+            account = db.get(models.Account, args.id)
+            if account is None:
+                print(f"No account {args.id}", file=sys.stderr)
+                sys.exit(1)
+            print(f"API key: {accounts.issue_key(db, account)}")
+        else:
+            for account in db.query(models.Account).order_by(models.Account.id):
+                key = "key set" if account.key_hash else "no key"
+                print(f"{account.id}\t{account.name}\t{key}\t{account.created_at:%Y-%m-%d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import argparse
+import sys
+
+from app.core import accounts, export
+from app.core.utils import parse_month, month_bounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export transactions as CSV or NDJSON")
+    parser.add_argument("--from", dest="from_month", help="First month YYYY-MM (default: earliest)")
+    parser.add_argument("--to", dest="to_month", help="Last month YYYY-MM (default: latest)")
+    parser.add_argument("--format", choices=sorted(export.FORMATS), default="csv")
+    parser.add_argument("--output", "-o", help="Output file (default: stdout)")
+    parser.add_argument("--account", type=int, default=accounts.DEFAULT_ACCOUNT, help="Account id (default: 1)")
+    args = parser.parse_args()
+
+    start = parse_month(args.from_month) if args.from_month else None
+    end = month_bounds(parse_month(args.to_month))[1] if args.to_month else None
+    generate, _ = export.FORMATS[args.format]
+
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        with accounts.session(args.account) as db:
+            for chunk in generate(db, start, end):
+                out.write(chunk)
+    finally:
+        if args.output:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
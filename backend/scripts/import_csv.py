@@ -0,0 +1,30 @@
+import argparse
+import sys
+
+from app.core import accounts, bulk
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import a CSV bank statement (date,type,category,amount,description)")
+    parser.add_argument("path", help="CSV file, or - for stdin")
+    parser.add_argument("--chunk-size", type=int, default=bulk.CHUNK_SIZE, help="Rows per transaction")
+    parser.add_argument("--account", type=int, default=accounts.DEFAULT_ACCOUNT, help="Account id (default: 1)")
+    args = parser.parse_args()
+
+    src = sys.stdin if args.path == "-" else open(args.path, newline="", encoding="utf-8")
+    try:
+        with accounts.session(args.account) as db:
+            result = bulk.import_csv(db, src, chunk_size=args.chunk_size)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+
+    for err in result.errors:
+        print(f"line {err['index']}: {err['detail']}", file=sys.stderr)
+    print(f"Inserted {result.inserted} rows, skipped {result.duplicates} duplicates, {len(result.errors)} errors")
+    if result.errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import argparse
+import time
+
+from app.core import accounts, config, models, recurring
+from app.core.database import SessionLocal
+from app.core.utils import month_bounds, parse_month
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create the transactions due from recurring rules")
+    parser.add_argument("--through", help="Last month to fill, YYYY-MM (default: the current month)")
+    parser.add_argument("--account", type=int, help="Only this account (default: every account)")
+    args = parser.parse_args()
+    _, until = month_bounds(parse_month(args.through))
+
+    started = time.perf_counter()
+    if args.account is not None:
+        with accounts.session(args.account) as db:
+            inserted = recurring.materialize(db, until)
+    elif config.ACCOUNT_DB_DIR:
+        # Each account's rules live in its own file
+        with SessionLocal() as db:
+            ids = [account_id for (account_id,) in db.query(models.Account.id).order_by(models.Account.id)]
+        inserted = 0
+        for account_id in ids:
+            with accounts.session(account_id) as db:
+                inserted += recurring.materialize(db, until)
+    else:
+        # One INSERT and one commit for every account's rules
+        with SessionLocal() as db:
+            inserted = recurring.materialize(db, until, all_accounts=True)
+    elapsed = time.perf_counter() - started
+    print(f"Inserted {inserted} transactions through {until:%Y-%m} in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import argparse
+import sys
+
+from app.core import accounts, rollups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the monthly_rollups summary table")
+    parser.add_argument("--account", type=int, default=accounts.DEFAULT_ACCOUNT, help="Account id (default: 1)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("rebuild", help="Recompute the account's rollups from transactions")
+    sub.add_parser("check", help="Report rollups that disagree with transactions")
+    args = parser.parse_args()
+
+    with accounts.session(args.account) as db:
+        if args.command == "rebuild":
+            written = rollups.rebuild(db)
+            print(f"Rebuilt {written} rollup rows")
+            return
+        mismatches = rollups.check(db)
+        for month, tx_type, category, expected, actual in mismatches:
+            print(f"{month} {tx_type}/{category}: expected {expected}, found {actual}")
+        if mismatches:
+            print(f"{len(mismatches)} mismatched rollup rows; run `rebuild` to fix")
+            sys.exit(1)
+        print("Rollups are consistent")
+
+
+if __name__ == "__main__":
+    main()
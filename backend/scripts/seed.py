@@ -1,13 +1,19 @@
 import argparse
+import math
+import random
+import time
+from collections import Counter
 from datetime import date, datetime
 from decimal import Decimal
+from itertools import repeat
+from typing import Iterable, Iterator
 
-from app.core.database import SessionLocal, engine
-from app.core import models
-from app.core.utils import parse_month, month_bounds
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
-# Ensure tables exist (in case seed is run before server startup)
-models.Base.metadata.create_all(bind=engine)
+from app.core.database import get_engine
+from app.core import accounts, bulk, categories, models, rollups, search
+from app.core.utils import parse_month, month_bounds, month_range, to_cents
 
 SAMPLE_DATA = {
     "income": [
@@ -21,68 +27,147 @@ SAMPLE_DATA = {
     ],
 }
 
+# Synthetic expenses: category -> (share of rows, median amount, log spread, descriptions)
+EXPENSE_PROFILES = {
+    "groceries": (0.7, 38.0, 0.7, ("Groceries", "Snacks", "Market", "Supermarket")),
+    "eating_out": (0.3, 22.0, 0.6, ("Dining", "Lunch", "Coffee", "Takeaway")),
+}
+CHUNK_SIZE = 50000
+COLUMNS = ("account_id", "date", "type", "category_id", "amount_cents", "description")
 
-def seed_month(month_str: str | None):
-    first = parse_month(month_str)
-    start, end = month_bounds(first)
-    mid = date(first.year, first.month, min(24, end.day))
 
-    with SessionLocal() as db:
-        inserted = 0
-        # Income: place entries on first and last day
-        income_dates = [end, first]
-        for i, item in enumerate(SAMPLE_DATA["income"]):
-            tx_date = income_dates[i % len(income_dates)]
-            exists = (
-                db.query(models.Transaction)
-                .filter(
-                    models.Transaction.date == tx_date,
-                    models.Transaction.type == "income",
-                    models.Transaction.category == item["category"],
-                    models.Transaction.amount == item["amount"],
-                )
-                .first()
-            )
-            if exists:
-                continue
-            db.add(
-                models.Transaction(
-                    date=tx_date,
-                    type="income",
-                    category=item["category"],
-                    amount=item["amount"],
-                    description=item["description"],
-                )
+def _amount_tables(rng: random.Random, size: int = 8192) -> dict[str, list[int]]:
+    """Pre-drawn log-normal amounts in cents per category; sampling from these is far cheaper
+    than drawing a fresh variate for every row."""
+    return {
+        category: [max(1, round(median * 100 * math.exp(spread * rng.gauss(0.0, 1.0)))) for _ in range(size)]
+        for category, (_, median, spread, _) in EXPENSE_PROFILES.items()
+    }
+
+
+def generate_rows(rows: int, months: list[str], seed: int = 1) -> Iterator[tuple]:
+    """Deterministic synthetic rows as (date, type, category, amount_cents, description) tuples.
+
+    Every month gets its salary (last day) and carryover (first day) from SAMPLE_DATA;
+    the rest are expenses split across EXPENSE_PROFILES with log-normal amounts.
+    Values are drawn a month and a category at a time, which keeps this fast enough
+    for millions of rows.
+    """
+    rng = random.Random(seed)
+    amounts = _amount_tables(rng)
+    categories = list(EXPENSE_PROFILES)
+    weights = [EXPENSE_PROFILES[c][0] for c in categories]
+    salary, carryover = SAMPLE_DATA["income"]
+    base, extra = divmod(rows, len(months))
+
+    for i, key in enumerate(months):
+        count = base + (1 if i < extra else 0)
+        first = parse_month(key)
+        last = month_bounds(first)[1]
+        income = [
+            (last, "income", salary["category"], to_cents(salary["amount"]), salary["description"]),
+            (first, "income", carryover["category"], to_cents(carryover["amount"]), carryover["description"]),
+        ]
+        yield from income[:count]
+
+        n = count - len(income)
+        if n <= 0:
+            continue
+        days = [date(first.year, first.month, d) for d in range(1, last.day + 1)]
+        per_category = Counter(rng.choices(categories, weights=weights, k=n))
+        for category in categories:
+            k = per_category[category]
+            yield from zip(
+                rng.choices(days, k=k),
+                repeat("expense", k),
+                repeat(category, k),
+                rng.choices(amounts[category], k=k),
+                rng.choices(EXPENSE_PROFILES[category][3], k=k),
             )
-            inserted += 1
-
-        # Expenses: scatter
-        expense_dates = [mid, end, first]
-        for i, item in enumerate(SAMPLE_DATA["expense"]):
-            tx_date = expense_dates[i % len(expense_dates)]
-            exists = (
-                db.query(models.Transaction)
-                .filter(
-                    models.Transaction.date == tx_date,
-                    models.Transaction.type == "expense",
-                    models.Transaction.category == item["category"],
-                    models.Transaction.amount == item["amount"],
-                )
-                .first()
+
+
+def load_rows(db: Session, rows: Iterable[tuple], chunk_size: int = CHUNK_SIZE) -> int:
+    """Bulk-load tuples from `generate_rows` in large transactions, then refresh rollups once.
+
+    SQLite goes straight to the driver's executemany, and when the table starts out empty
+    its secondary indexes are dropped during the load and rebuilt once at the end; the
+    search index is likewise filled once at the end. Other backends use a Core insert.
+    """
+    T = models.Transaction
+    bind = db.get_bind()
+    is_sqlite = bind.dialect.name == "sqlite"
+    sql = f"INSERT INTO transactions ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+    rebuild_indexes = is_sqlite and db.query(T.id).first() is None
+    if rebuild_indexes:
+        for index in T.__table__.indexes:
+            index.drop(db.connection(), checkfirst=True)
+
+    account_id = accounts.current(db)
+    ids = {c.name: c.id for c in categories.get_all(db)}
+    iso: dict[date, str] = {}
+    total, chunk = 0, []
+
+    def flush():
+        dates = {row[0] for row in chunk}
+        for d in dates - iso.keys():
+            iso[d] = d.isoformat()
+        if is_sqlite:
+            # ISO strings are what SQLAlchemy's SQLite Date type would bind
+            db.connection().exec_driver_sql(
+                sql, [(account_id, iso[d], t, ids[c], *rest) for d, t, c, *rest in chunk]
             )
-            if exists:
-                continue
-            db.add(
-                models.Transaction(
-                    date=tx_date,
-                    type="expense",
-                    category=item["category"],
-                    amount=item["amount"],
-                    description=item["description"],
-                )
+        else:
+            db.execute(
+                insert(T), [dict(zip(COLUMNS, (account_id, d, t, ids[c], *rest))) for d, t, c, *rest in chunk]
             )
-            inserted += 1
+        db.commit()
+        chunk.clear()
+
+    try:
+        with search.bulk_load(db):
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    total += len(chunk)
+                    flush()
+            if chunk:
+                total += len(chunk)
+                flush()
+    finally:
+        # Also after a failed load, for the chunks it committed: the table must not be left
+        # without its unique index, nor rollups that miss rows
+        if rebuild_indexes:
+            for index in T.__table__.indexes:
+                index.create(db.connection(), checkfirst=True)
+            db.commit()
+        # Also bumps the version of every loaded month
+        rollups.rebuild(db)
+    return total
 
+
+def seed_month(month_str: str | None, account_id: int = accounts.DEFAULT_ACCOUNT):
+    first = parse_month(month_str)
+    start, end = month_bounds(first)
+    mid = date(first.year, first.month, min(24, end.day))
+
+    rows = []
+    # Income: place entries on first and last day
+    income_dates = [end, first]
+    for i, item in enumerate(SAMPLE_DATA["income"]):
+        rows.append({"date": income_dates[i % len(income_dates)], "type": "income", **item})
+
+    # Expenses: scatter
+    expense_dates = [mid, end, first]
+    for i, item in enumerate(SAMPLE_DATA["expense"]):
+        rows.append({"date": expense_dates[i % len(expense_dates)], "type": "expense", **item})
+
+    # Content hashes make re-seeding a month a no-op without a lookup per row
+    with accounts.session(account_id) as db:
+        for row in rows:
+            row["amount_cents"] = to_cents(row.pop("amount"))
+            row["content_hash"] = bulk.content_hash(row)
+            categories.resolve(db, row)
+        inserted = bulk.insert_new(db, rows)
         db.commit()
         return inserted
 
@@ -90,8 +175,36 @@ def seed_month(month_str: str | None):
 def main():
     parser = argparse.ArgumentParser(description="Seed demo transactions for a month")
     parser.add_argument("--month", help="Target month YYYY-MM (default: current month)", default=None)
+    parser.add_argument("--rows", type=int, help="Generate this many synthetic rows instead of the demo month")
+    parser.add_argument("--months", help="Month range for --rows, YYYY-MM:YYYY-MM (default: the last 12 months)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for --rows (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Rows per transaction for --rows")
+    parser.add_argument("--account", type=int, default=accounts.DEFAULT_ACCOUNT, help="Account to seed (default: 1)")
     args = parser.parse_args()
-    inserted = seed_month(args.month)
+    # Ensure tables exist (in case seed is run before server startup)
+    models.Base.metadata.create_all(bind=get_engine())
+
+    if args.rows:
+        if args.months:
+            first, last = args.months.split(":")
+        else:
+            today = datetime.today()
+            first = f"{today.year - 1:04d}-{today.month:02d}"
+            last = today.strftime("%Y-%m")
+        months = month_range(first, last)
+        if not months:
+            parser.error("--months range is empty")
+        started = time.perf_counter()
+        with accounts.session(args.account) as db:
+            inserted = load_rows(db, generate_rows(args.rows, months, args.seed), args.chunk_size)
+        elapsed = time.perf_counter() - started
+        print(
+            f"Inserted {inserted} rows over {len(months)} months in {elapsed:.1f}s "
+            f"({inserted / elapsed:,.0f} rows/s)"
+        )
+        return
+
+    inserted = seed_month(args.month, args.account)
     print(f"Inserted {inserted} rows for month {args.month or datetime.today().strftime('%Y-%m')}")
 
 
@@ -2,6 +2,7 @@ import os
 import sys
 import tempfile
 import pytest
+from fastapi import Depends
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
@@ -13,8 +14,10 @@ if BACKEND_DIR not in sys.path:
     sys.path.insert(0, BACKEND_DIR)
 
 from app.main import app
+from app.core import accounts, analytics, categories
+from app.core.cache import cache
 from app.core.database import Base
-from app.core.dependencies import get_db
+from app.core.dependencies import get_account, get_db
 
 
 @pytest.fixture()
@@ -53,13 +56,28 @@ def db_session(engine):
 
 @pytest.fixture()
 def client(db_session):
-    def override_get_db():
+    def override_get_db(account_id: int = Depends(get_account)):
         try:
-            yield db_session
+            yield accounts.bind(db_session, account_id)
         finally:
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    # Each test gets a fresh database, so results cached by an earlier test are stale
+    cache.clear()
+    analytics.clear()
     with TestClient(app) as c:
+        # The category maps are module-global, so drop what earlier tests loaded for account 1
+        categories.invalidate()
         yield c
     app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def add_tx(client):
+    """Post a transaction: a 10.00 groceries expense on 2025-09-10, unless `fields` say otherwise."""
+    def add(headers=None, **fields):
+        return client.post("/api/v1/transactions/", headers=headers, json={
+            "date": "2025-09-10", "type": "expense", "category": "groceries", "amount": 10, **fields,
+        })
+    return add
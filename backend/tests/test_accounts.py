@@ -0,0 +1,68 @@
+import os
+from datetime import date
+
+import pytest
+
+from app.core import accounts, categories, config, crud, database, models
+
+
+@pytest.fixture()
+def other_key(engine, db_session, monkeypatch):
+    # API keys are checked against DATABASE_URL; point it at the test database
+    monkeypatch.setattr(database, "_engine", engine)
+    accounts.forget_keys()
+    _, key = accounts.create_account(db_session, "Other household")
+    yield key
+    accounts.forget_keys()
+
+
+def test_accounts_only_see_their_own_data(client, other_key, add_tx):
+    other = {"X-API-Key": other_key}
+    mine = add_tx(amount=10, description="Market").json()
+    theirs = add_tx(amount=99, headers=other, description="Market").json()
+    assert client.get("/api/v1/summary", params={"month": "2025-09"}, headers={"X-API-Key": "nope"}).status_code == 401
+
+    assert client.get("/api/v1/summary", params={"month": "2025-09"}).json()["expenses"] == 10.0
+    assert client.get("/api/v1/summary", params={"month": "2025-09"}, headers=other).json()["expenses"] == 99.0
+    listed = client.get("/api/v1/transactions/", params={"month": "2025-09"}, headers=other).json()
+    assert [t["id"] for t in listed] == [theirs["id"]]
+    assert [t["id"] for t in client.get("/api/v1/transactions/search", params={"q": "market"}).json()] == [mine["id"]]
+
+    # Rows of another account do not exist as far as this one is concerned
+    assert client.put(f"/api/v1/transactions/{theirs['id']}", json={"amount": 1}).status_code == 404
+    assert client.delete(f"/api/v1/transactions/{theirs['id']}").status_code == 404
+
+    # Each account has its own categories and its own ETags
+    pets = client.post("/api/v1/categories/", json={"name": "pets", "type": "expense"}, headers=other)
+    assert pets.status_code == 201
+    assert add_tx(category="pets").status_code == 422
+    assert "pets" not in [c["name"] for c in client.get("/api/v1/categories").json()]
+    first = client.get("/api/v1/summary", params={"month": "2025-09"})
+    second = client.get("/api/v1/summary", params={"month": "2025-09"}, headers=other)
+    assert first.headers["ETag"] != second.headers["ETag"]
+
+
+def test_partitioned_accounts_get_their_own_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "ACCOUNT_DB_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "ACCOUNT_ENGINE_CACHE_SIZE", 1)
+    categories.invalidate()
+    try:
+        with accounts.session(5) as db:
+            tx = crud.create_transaction(db, {
+                "date": date(2025, 9, 1), "type": "expense", "category": "groceries", "amount_cents": 500,
+            })
+            assert (tx.account_id, tx.category) == (5, "groceries")
+        assert os.path.exists(database.account_path(5))
+
+        with accounts.session(6) as db:
+            assert db.query(models.Transaction).count() == 0
+            assert {c.account_id for c in db.query(models.Category)} == {6}
+        # The LRU holds one engine, so account 5's was disposed
+        assert list(database._account_engines) == [6]
+
+        with accounts.session(5) as db:
+            assert crud.month_page(db, tx.date)[1].expenses_cents == 500
+    finally:
+        while database._account_engines:
+            database._account_engines.popitem()[1].dispose()
+        categories.invalidate()
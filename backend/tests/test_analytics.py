@@ -0,0 +1,54 @@
+from app.core import analytics
+
+
+def _get(client, **params):
+    return client.get("/api/v1/analytics/", params={"from": "2025-01", "to": "2025-04", **params})
+
+
+def test_trends(client, add_tx):
+    add_tx(date="2024-12-05", amount=40)
+    for month, amount in (("01", 10), ("02", 20), ("04", 60)):
+        add_tx(date=f"2025-{month}-05", amount=amount)
+    add_tx(date="2025-02-10", amount=5, category="eating_out")
+    add_tx(date="2025-03-01", amount=1000, category="salary", type="income")
+
+    body = _get(client).json()
+    assert body["months"] == ["2025-01", "2025-02", "2025-03", "2025-04"]
+    assert body["expenses"]["series"] == [10.0, 25.0, 0.0, 60.0]
+    assert body["expenses"]["average"] == 23.75
+    # December, loaded ahead of the range, counts toward January's rolling means
+    assert body["expenses"]["rolling_3"] == [16.67, 25.0, 11.67, 28.33]
+    assert body["expenses"]["change_pct"] == [-75.0, 150.0, -100.0, None]
+    assert body["income"]["series"] == [0.0, 0.0, 1000.0, 0.0]
+
+    groceries, = [c for c in body["categories"] if c["category"] == "groceries"]
+    assert (groceries["type"], groceries["total"], groceries["average"]) == ("expense", 90.0, 22.5)
+    assert groceries["rolling_12"][-1] == 10.83
+    assert body["top_categories"] == ["groceries", "eating_out"]
+    assert _get(client, top=1).json()["top_categories"] == ["groceries"]
+    assert _get(client, **{"from": "2025-05", "to": "2025-01"}).status_code == 400
+    assert _get(client, **{"from": "2025-5-x", "to": "2025-09"}).status_code == 400
+    assert _get(client, **{"from": "2025-01", "to": "2025-13"}).status_code == 400
+    # Rolling means look 11 months back, which must still be a date
+    assert _get(client, **{"from": "0001-01", "to": "0001-03"}).status_code == 400
+    assert _get(client, **{"from": "0001-12", "to": "0002-01"}).status_code == 200
+
+
+def test_snapshot_is_reused_until_the_range_changes(client, monkeypatch, add_tx):
+    add_tx(date="2025-02-05", amount=20)
+    loads = []
+    original = analytics.load
+    monkeypatch.setattr(analytics, "load", lambda *a: loads.append(a) or original(*a))
+
+    _get(client)
+    _get(client)
+    assert len(loads) == 1
+
+    # A write outside the loaded months leaves the snapshot valid
+    add_tx(date="2025-06-05", amount=5)
+    _get(client)
+    assert len(loads) == 1
+
+    add_tx(date="2025-03-05", amount=7)
+    assert _get(client).json()["expenses"]["series"] == [0.0, 20.0, 7.0, 0.0]
+    assert len(loads) == 2
@@ -1,5 +1,9 @@
+import csv
+import io
+import json
 from datetime import date
 
+from app.core import bulk
 from app.core.utils import month_str
 
 
@@ -65,6 +69,9 @@ def test_update_and_delete(client):
     assert upd.status_code == 200
     # response may serialize Decimal as string; cast for comparison
     assert float(upd.json()["amount"]) == 15.25
+    # Required fields can be left out of an update, not cleared
+    assert client.put(f"/api/v1/transactions/{tx['id']}", json={"date": None}).status_code == 422
+    assert client.put(f"/api/v1/transactions/{tx['id']}", json={"description": None}).status_code == 200
 
     dele = client.delete(f"/api/v1/transactions/{tx['id']}")
     assert dele.status_code == 204
@@ -86,3 +93,186 @@ def test_validation_errors(client):
         "amount": 5,
     })
     assert bad_cat.status_code == 422
+
+
+def test_amount_out_of_range(client):
+    row = {"date": "2025-09-01", "type": "expense", "category": "groceries", "amount": 1e20}
+    assert client.post("/api/v1/transactions/", json=row).status_code == 422
+
+    ok = client.post("/api/v1/transactions/", json={**row, "amount": 5}).json()
+    assert client.put(f"/api/v1/transactions/{ok['id']}", json={"amount": "1e30"}).status_code == 422
+
+    res = client.post("/api/v1/transactions/bulk", json=[{**row, "amount": 1}, row])
+    assert res.status_code == 200
+    body = res.json()
+    assert body["inserted"] == 1
+    assert [e["index"] for e in body["errors"]] == [1]
+
+
+def test_summary_category_totals_are_exact(client):
+    for amount in ("0.10", "0.20", "0.70"):
+        client.post("/api/v1/transactions/", json={
+            "date": "2025-09-03",
+            "type": "expense",
+            "category": "groceries",
+            "amount": amount,
+        })
+    client.post("/api/v1/transactions/", json={
+        "date": "2025-09-01",
+        "type": "income",
+        "category": "salary",
+        "amount": 10,
+    })
+
+    s = client.get("/api/v1/summary", params={"month": "2025-09"}).json()
+    assert s["expenses"] == 1.0
+    assert s["net"] == 9.0
+    assert s["categories"] == {"groceries": 1.0, "salary": 10.0}
+
+
+def test_summary_range(client):
+    for day, tx_type, category, amount in [
+        ("2024-10-05", "expense", "groceries", 30),
+        ("2025-09-05", "income", "salary", 1000),
+        ("2025-09-06", "expense", "groceries", 100),
+        ("2025-11-01", "expense", "eating_out", 50),
+    ]:
+        client.post("/api/v1/transactions/", json={
+            "date": day, "type": tx_type, "category": category, "amount": amount,
+        })
+
+    res = client.get("/api/v1/summary/range", params={"from": "2025-09", "to": "2025-11"})
+    assert res.status_code == 200
+    data = res.json()
+    assert [p["month"] for p in data] == ["2025-09", "2025-10", "2025-11"]
+    assert data[0]["net"] == 900.0
+    assert data[0]["categories"] == {}
+    assert data[1]["income"] == 0.0 and data[1]["expenses"] == 0.0
+
+    res = client.get("/api/v1/summary/range", params={
+        "from": "2025-10", "to": "2025-10", "by_category": True, "yoy": True,
+    })
+    [october] = res.json()
+    assert october["previous_year"]["expenses"] == 30.0
+    assert october["previous_year"]["categories"] == {"groceries": 30.0}
+
+    bad = client.get("/api/v1/summary/range", params={"from": "2025-11", "to": "2025-09"})
+    assert bad.status_code == 400
+    for months in ({"from": "x", "to": "2025-09"}, {"from": "2025-09", "to": "2025-13"}):
+        assert client.get("/api/v1/summary/range", params=months).status_code == 400
+    # The year before year 1 is not a date; the last representable month is fine
+    bad = client.get("/api/v1/summary/range", params={"from": "0001-01", "to": "0001-03", "yoy": True})
+    assert bad.status_code == 400
+    res = client.get("/api/v1/summary/range", params={"from": "9999-11", "to": "9999-12", "yoy": True})
+    assert [p["month"] for p in res.json()] == ["9999-11", "9999-12"]
+
+
+def test_list_transactions_pagination(client):
+    for day in (3, 3, 7, 12, 20):
+        client.post("/api/v1/transactions/", json={
+            "date": f"2025-09-{day:02d}",
+            "type": "expense",
+            "category": "groceries",
+            "amount": day,
+        })
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"month": "2025-09", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        res = client.get("/api/v1/transactions", params=params)
+        assert res.status_code == 200
+        page = res.json()
+        assert len(page) <= 2
+        seen.extend(page)
+        cursor = res.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert len(seen) == 5
+    assert len({tx["id"] for tx in seen}) == 5
+    keys = [(tx["date"], tx["id"]) for tx in seen]
+    assert keys == sorted(keys, reverse=True)
+
+    bad = client.get("/api/v1/transactions", params={"month": "2025-09", "cursor": "not-a-cursor"})
+    assert bad.status_code == 400
+
+
+def test_list_transactions_fields(client):
+    client.post("/api/v1/transactions/", json={
+        "date": "2025-09-03",
+        "type": "expense",
+        "category": "groceries",
+        "amount": 12.5,
+        "description": "Market",
+    })
+
+    res = client.get("/api/v1/transactions", params={"month": "2025-09", "fields": "date,amount"})
+    assert res.status_code == 200
+    assert res.json() == [{"date": "2025-09-03", "amount": "12.50"}]
+
+    bad = client.get("/api/v1/transactions", params={"month": "2025-09", "fields": "date,secret"})
+    assert bad.status_code == 400
+
+
+def test_bulk_create_json(client):
+    rows = [
+        {"date": "2025-09-01", "type": "income", "category": "salary", "amount": 100},
+        {"date": "2025-09-02", "type": "expense", "category": "bogus", "amount": 5},
+        {"date": "2025-09-03", "type": "expense", "category": "groceries", "amount": 20},
+    ]
+    res = client.post("/api/v1/transactions/bulk", json=rows)
+    assert res.status_code == 200
+    body = res.json()
+    assert body["inserted"] == 2
+    assert [e["index"] for e in body["errors"]] == [1]
+
+    s = client.get("/api/v1/summary", params={"month": "2025-09"}).json()
+    assert s["income"] == 100.0 and s["expenses"] == 20.0
+
+
+def test_bulk_create_ndjson(client, monkeypatch):
+    # Small chunks so the stream is split across several transactions
+    monkeypatch.setattr(bulk, "CHUNK_SIZE", 2)
+    lines = [
+        '{"date": "2025-09-01", "type": "expense", "category": "groceries", "amount": 1}',
+        "not json",
+        '{"date": "2025-09-02", "type": "expense", "category": "groceries", "amount": 2}',
+        '{"date": "2025-09-02", "type": "expense"}',
+        '{"date": "2025-09-04", "type": "expense", "category": "groceries", "amount": 4}',
+    ]
+    res = client.post(
+        "/api/v1/transactions/bulk",
+        content="\n".join(lines) + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert res.status_code == 200
+    body = res.json()
+    assert body["inserted"] == 3
+    assert [e["index"] for e in body["errors"]] == [1, 3]
+    assert len(client.get("/api/v1/transactions", params={"month": "2025-09"}).json()) == 3
+
+
+def test_export_streams_csv_and_ndjson(client):
+    for day in ("2025-08-31", "2025-09-01", "2025-10-15"):
+        client.post("/api/v1/transactions/", json={
+            "date": day,
+            "type": "expense",
+            "category": "groceries",
+            "amount": 3.5,
+            "description": "a, \"quoted\" note",
+        })
+
+    res = client.get("/api/v1/transactions/export", params={"from": "2025-09", "to": "2025-10"})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(res.text)))
+    assert [r["date"] for r in rows] == ["2025-09-01", "2025-10-15"]
+    assert rows[0]["description"] == 'a, "quoted" note'
+
+    res = client.get("/api/v1/transactions/export", params={"format": "ndjson"})
+    lines = [json.loads(line) for line in res.text.splitlines()]
+    assert len(lines) == 3
+    assert lines[0]["amount"] == "3.50"
@@ -0,0 +1,55 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import categories
+from app.core.cache import cache
+from app.core.database import async_url
+from app.core.dependencies import get_db
+from app.main import app
+
+pytest.importorskip("aiosqlite")
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+
+@pytest.fixture()
+def async_client(db_url, engine):
+    # `engine` has created the schema; serve the same file through aiosqlite
+    aengine = create_async_engine(async_url(db_url))
+    factory = async_sessionmaker(aengine, autoflush=False, expire_on_commit=False)
+
+    async def override_get_db():
+        async with factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    cache.clear()
+    with TestClient(app) as c:
+        # The category maps are module-global, so drop what earlier tests loaded for account 1
+        categories.invalidate()
+        yield c
+    app.dependency_overrides.clear()
+    aengine.sync_engine.dispose()
+
+
+def test_async_url():
+    assert async_url("sqlite:///app/app.db") == "sqlite+aiosqlite:///app/app.db"
+    assert async_url("postgresql://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+
+
+def test_handlers_run_on_async_session(async_client):
+    created = async_client.post("/api/v1/transactions/", json={
+        "date": "2025-09-10",
+        "type": "expense",
+        "category": "groceries",
+        "amount": 25,
+    })
+    assert created.status_code == 201
+    tx_id = created.json()["id"]
+
+    assert async_client.put(f"/api/v1/transactions/{tx_id}", json={"amount": 30}).status_code == 200
+    assert async_client.get("/api/v1/summary", params={"month": "2025-09"}).json()["expenses"] == 30.0
+    assert len(async_client.get("/api/v1/transactions", params={"month": "2025-09"}).json()) == 1
+    assert async_client.get("/", params={"month": "2025-09"}).status_code == 200
+
+    assert async_client.delete(f"/api/v1/transactions/{tx_id}").status_code == 204
+    assert async_client.delete(f"/api/v1/transactions/{tx_id}").status_code == 404
@@ -0,0 +1,78 @@
+def _status(client, month="2025-09"):
+    return {s["category"]: s for s in client.get("/api/v1/budgets/status", params={"month": month}).json()}
+
+
+def test_budget_crud(client):
+    created = client.post("/api/v1/budgets/", json={"category": "groceries", "limit": 100})
+    assert created.status_code == 201
+    budget = created.json()
+    assert budget == {"id": budget["id"], "category": "groceries", "limit": "100.00"}
+    assert client.post("/api/v1/budgets/", json={"category": "groceries", "limit": 5}).status_code == 409
+    assert client.post("/api/v1/budgets/", json={"category": "holidays", "limit": 5}).status_code == 422
+    assert client.post("/api/v1/budgets/", json={"category": "eating_out", "limit": 0}).status_code == 422
+    # Only expenses count against a budget
+    income = client.post("/api/v1/budgets/", json={"category": "salary", "limit": 5})
+    assert income.status_code == 422
+    assert "expense" in income.json()["detail"]
+    groceries = next(c for c in client.get("/api/v1/categories").json() if c["name"] == "groceries")
+    assert client.put(f"/api/v1/categories/{groceries['id']}", json={"type": "income"}).status_code == 409
+
+    updated = client.put(f"/api/v1/budgets/{budget['id']}", json={"limit": 80})
+    assert updated.json()["limit"] == "80.00"
+    assert [b["limit"] for b in client.get("/api/v1/budgets/").json()] == ["80.00"]
+
+    assert client.delete(f"/api/v1/budgets/{budget['id']}").status_code == 204
+    assert client.delete(f"/api/v1/budgets/{budget['id']}").status_code == 404
+    assert client.put(f"/api/v1/budgets/{budget['id']}", json={"limit": 1}).status_code == 404
+    assert client.get("/api/v1/budgets/").json() == []
+
+
+def test_spend_follows_writes_and_alerts(client, add_tx):
+    client.post("/api/v1/budgets/", json={"category": "groceries", "limit": 50})
+    client.post("/api/v1/budgets/", json={"category": "eating_out", "limit": 20})
+
+    first = add_tx(amount=30)
+    assert "X-Budget-Alert" not in first.headers
+    raised = client.put(f"/api/v1/transactions/{first.json()['id']}", json={"amount": 55})
+    assert raised.headers["X-Budget-Alert"] == "groceries"
+    client.put(f"/api/v1/transactions/{first.json()['id']}", json={"amount": 30})
+    add_tx(amount=99, date="2025-10-01")
+    add_tx(amount=500, category="salary", type="income")
+    groceries = _status(client)["groceries"]
+    assert (groceries["spent"], groceries["remaining"], groceries["over"]) == ("30.00", "20.00", False)
+    assert _status(client)["eating_out"]["spent"] == "0.00"
+
+    second = add_tx(amount=25)
+    assert second.headers["X-Budget-Alert"] == "groceries"
+    assert _status(client)["groceries"]["over"] is True
+    # Only the write that crosses the limit alerts, not every one while it stays over
+    third = add_tx(amount=5)
+    assert "X-Budget-Alert" not in third.headers
+    assert "X-Budget-Alert" not in client.put(
+        f"/api/v1/transactions/{third.json()['id']}", json={"amount": 6}).headers
+    client.delete(f"/api/v1/transactions/{third.json()['id']}")
+
+    # Moving spend out of the month brings the budget back under its limit
+    assert client.put(f"/api/v1/transactions/{second.json()['id']}", json={"date": "2025-08-31"}).headers.get(
+        "X-Budget-Alert") is None
+    assert _status(client)["groceries"]["remaining"] == "20.00"
+    client.delete(f"/api/v1/transactions/{first.json()['id']}")
+    assert _status(client)["groceries"]["spent"] == "0.00"
+    assert _status(client, "2025-10")["groceries"]["over"] is True
+
+
+def test_dashboard_shows_budgets(client, add_tx):
+    assert "Budgets" not in client.get("/", params={"month": "2025-09"}).text
+    client.post("/api/v1/budgets/", json={"category": "groceries", "limit": 10})
+    add_tx(amount=12)
+    page = client.get("/", params={"month": "2025-09"}).text
+    assert "Budgets" in page
+    assert "table-danger" in page
+    assert "-2.00" in page
+
+
+def test_deleting_a_category_drops_its_budget(client):
+    travel = client.post("/api/v1/categories/", json={"name": "travel", "type": "expense"}).json()
+    client.post("/api/v1/budgets/", json={"category": "travel", "limit": 10})
+    assert client.delete(f"/api/v1/categories/{travel['id']}").status_code == 204
+    assert client.get("/api/v1/budgets/").json() == []
@@ -0,0 +1,71 @@
+import fnmatch
+
+from app.core import cache as cache_module
+from app.core.cache import MemoryCache, RedisCache
+
+
+def test_memory_cache_lru_and_ttl(monkeypatch):
+    c = MemoryCache(ttl=60, maxsize=2)
+    c.set("2025-09", "a", 1)
+    c.set("2025-10", "a", 2)
+    c.get("2025-09", "a")  # touch, so 2025-10 becomes least recent
+    c.set("2025-11", "a", 3)
+    assert c.get_or_set("2025-09", "a", lambda: "recomputed") == 1
+    assert c.get_or_set("2025-10", "a", lambda: "recomputed") == "recomputed"
+
+    now = cache_module.time.monotonic()
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now + 61)
+    assert c.get_or_set("2025-09", "a", lambda: "expired") == "expired"
+
+
+def test_writes_invalidate_only_their_months(client):
+    cache = cache_module.cache
+    client.post("/api/v1/transactions/", json={
+        "date": "2025-09-05", "type": "income", "category": "salary", "amount": 100,
+    })
+    before = client.get("/cache/stats").json()
+    for month in ("2025-09", "2025-10", "2025-09", "2025-10"):
+        client.get("/api/v1/summary", params={"month": month})
+    stats = client.get("/cache/stats").json()
+    assert stats["hits"] - before["hits"] == 2
+    assert stats["misses"] - before["misses"] == 2
+
+    client.post("/api/v1/transactions/", json={
+        "date": "2025-09-06", "type": "expense", "category": "groceries", "amount": 40,
+    })
+    assert client.get("/api/v1/summary", params={"month": "2025-09"}).json()["net"] == 60.0
+    client.get("/api/v1/summary", params={"month": "2025-10"})
+    # 2025-09 was recomputed; 2025-10 was untouched by the write and still hits
+    assert cache.hits - before["hits"] == 3
+    assert cache.misses - before["misses"] == 3
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self.data.setdefault(key, {})[field] = value
+
+    def expire(self, key, ttl):
+        pass
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        return [k for k in list(self.data) if fnmatch.fnmatch(k, match)]
+
+
+def test_redis_cache_roundtrip_and_invalidate():
+    c = RedisCache(FakeRedis(), ttl=60)
+    assert c.get_or_set("2025-09", "totals", lambda: {"net": 1}) == {"net": 1}
+    assert c.get_or_set("2025-09", "totals", lambda: None) == {"net": 1}
+    c.invalidate("2025-09")
+    assert c.get_or_set("2025-09", "totals", lambda: "fresh") == "fresh"
+    c.clear()
+    assert c.client.data == {}
+    assert (c.hits, c.misses) == (1, 2)
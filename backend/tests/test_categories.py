@@ -0,0 +1,64 @@
+from app.core import categories, models
+
+
+def test_category_crud_and_use(client, db_session, add_tx):
+    names = [c["name"] for c in client.get("/api/v1/categories").json()]
+    assert names == ["carryover", "eating_out", "groceries", "salary"]
+
+    created = client.post("/api/v1/categories/", json={"name": "travel", "type": "expense"})
+    assert created.status_code == 201
+    travel = created.json()
+    assert client.post("/api/v1/categories/", json={"name": "travel", "type": "expense"}).status_code == 409
+
+    assert add_tx(category="travel", amount=42).status_code == 201
+    assert db_session.query(models.Transaction.category_id).scalar() == travel["id"]
+    assert add_tx(category="holidays").status_code == 422
+
+    summary = client.get("/api/v1/summary", params={"month": "2025-09"})
+    assert summary.json()["categories"] == {"travel": 42.0}
+    assert "travel" in client.get("/", params={"month": "2025-09"}).text
+
+    # Renaming changes what every month using the category shows
+    renamed = client.put(f"/api/v1/categories/{travel['id']}", json={"name": "trips"})
+    assert renamed.json() == {"id": travel["id"], "name": "trips", "type": "expense"}
+    assert client.put(f"/api/v1/categories/{travel['id']}", json={"name": None}).status_code == 422
+    again = client.get(
+        "/api/v1/summary", params={"month": "2025-09"}, headers={"If-None-Match": summary.headers["ETag"]}
+    )
+    assert again.status_code == 200
+    assert again.json()["categories"] == {"trips": 42.0}
+    listed = client.get("/api/v1/transactions", params={"month": "2025-09", "fields": "category,amount"})
+    assert listed.json() == [{"category": "trips", "amount": "42.00"}]
+
+    assert client.delete(f"/api/v1/categories/{travel['id']}").status_code == 409
+    unused = client.post("/api/v1/categories/", json={"name": "gifts", "type": "expense"}).json()
+    assert client.delete(f"/api/v1/categories/{unused['id']}").status_code == 204
+    assert client.delete(f"/api/v1/categories/{unused['id']}").status_code == 404
+
+
+def test_lookup_reloads_on_miss(client, db_session):
+    categories.get_all(db_session)
+    # Added behind the cache's back, as another worker would
+    db_session.add(models.Category(account_id=models.DEFAULT_ACCOUNT, name="pets", type="expense"))
+    db_session.commit()
+
+    res = client.post("/api/v1/transactions/bulk", json=[
+        {"date": "2025-09-01", "type": "expense", "category": "pets", "amount": 5},
+        {"date": "2025-09-01", "type": "expense", "category": "nope", "amount": 5},
+    ])
+    body = res.json()
+    assert body["inserted"] == 1
+    assert [e["index"] for e in body["errors"]] == [1]
+    assert body["errors"][0]["detail"][0]["loc"] == ["category"]
+
+
+def test_lookup_reloads_when_stale(client, db_session, monkeypatch):
+    groceries = categories.id_for(db_session, "groceries")
+    # Renamed behind the cache's back, as another worker would
+    db_session.get(models.Category, groceries).name = "food"
+    db_session.commit()
+    assert categories.name(groceries, db_session) == "groceries"
+
+    monkeypatch.setattr(categories.config, "CATEGORY_TTL", 0)
+    assert categories.name(groceries, db_session) == "food"
+    assert categories.id_for(db_session, "groceries") is None
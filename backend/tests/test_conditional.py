@@ -0,0 +1,58 @@
+from sqlalchemy import event
+
+
+def test_etag_revalidation_skips_transactions_table(client, engine, add_tx):
+    add_tx(date="2025-09-02", amount=10)
+    first = client.get("/api/v1/transactions", params={"month": "2025-09"})
+    etag = first.headers["ETag"]
+    assert first.headers["Last-Modified"].endswith("GMT")
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    again = client.get("/api/v1/transactions", params={"month": "2025-09"}, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert not any("FROM transactions" in sql for sql in statements)
+
+    # A different representation of the same month has its own tag
+    page = client.get("/api/v1/transactions", params={"month": "2025-09", "limit": 1})
+    assert page.headers["ETag"] != etag
+
+    add_tx(date="2025-09-03", amount=5)
+    changed = client.get("/api/v1/transactions", params={"month": "2025-09"}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert len(changed.json()) == 2
+
+
+def test_summary_conditional_requests(client, add_tx):
+    add_tx(date="2025-09-02", amount=10)
+    res = client.get("/api/v1/summary", params={"month": "2025-09"})
+    etag, last_modified = res.headers["ETag"], res.headers["Last-Modified"]
+
+    assert client.get("/api/v1/summary", params={"month": "2025-09"}, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/api/v1/summary", params={"month": "2025-09"}, headers={"If-Modified-Since": last_modified}).status_code == 304
+
+    # Writes to another month leave this one's tag alone
+    add_tx(date="2025-10-01", amount=1)
+    assert client.get("/api/v1/summary", params={"month": "2025-09"}, headers={"If-None-Match": etag}).status_code == 304
+
+    add_tx(date="2025-09-04", amount=1)
+    assert client.get("/api/v1/summary", params={"month": "2025-09"}, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_summary_body_matches_etag_after_write_elsewhere(client, engine, db_session, add_tx):
+    add_tx(date="2025-09-02", amount=10)
+    stale = client.get("/api/v1/summary", params={"month": "2025-09"})
+
+    # Another worker's write: this process's cache never hears of it
+    with engine.begin() as conn:
+        conn.exec_driver_sql("UPDATE monthly_rollups SET total_cents = 2500 WHERE month = '2025-09'")
+        conn.exec_driver_sql("UPDATE month_versions SET version = version + 1 WHERE month = '2025-09'")
+    db_session.expire_all()
+
+    res = client.get("/api/v1/summary", params={"month": "2025-09"}, headers={"If-None-Match": stale.headers["ETag"]})
+    assert res.status_code == 200
+    assert res.headers["ETag"] != stale.headers["ETag"]
+    assert res.json()["expenses"] == 25
+    page = client.get("/", params={"month": "2025-09"})
+    assert "25.00" in page.text
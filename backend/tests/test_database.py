@@ -0,0 +1,27 @@
+from sqlalchemy import create_engine
+
+from app.core import config
+from app.core.database import configure_engine, engine_options
+
+
+def test_sqlite_pragmas_applied_on_connect(db_url):
+    eng = configure_engine(create_engine(db_url, **engine_options(db_url)))
+    try:
+        with eng.connect() as conn:
+            pragma = lambda name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+            assert pragma("journal_mode") == "wal"
+            assert pragma("synchronous") == 1  # NORMAL
+            assert pragma("cache_size") == config.SQLITE_CACHE_SIZE
+            assert pragma("busy_timeout") == config.SQLITE_BUSY_TIMEOUT
+        assert eng.pool.size() == config.DB_POOL_SIZE
+    finally:
+        eng.dispose()
+
+
+def test_memory_sqlite_skips_pool_sizing():
+    options = engine_options("sqlite://")
+    assert "pool_size" not in options
+    eng = configure_engine(create_engine("sqlite://", **options))
+    with eng.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "memory"
+    eng.dispose()
@@ -0,0 +1,26 @@
+import io
+
+from app.core import bulk, models, rollups
+
+STATEMENT = """date,type,category,amount,description
+2025-09-01,income,salary,5000,Salary
+2025-09-03,expense,groceries,12.40,Market
+2025-09-03,expense,groceries,12.40,Market
+2025-09-04,expense,nope,1,Bad category
+"""
+
+
+def test_import_csv_is_idempotent(db_session):
+    first = bulk.import_csv(db_session, io.StringIO(STATEMENT), chunk_size=2)
+    assert first.inserted == 3
+    assert first.duplicates == 0
+    assert [e["index"] for e in first.errors] == [5]
+
+    # An overlapping statement only adds the new row
+    overlap = STATEMENT.splitlines()[:4] + ["2025-09-08,expense,eating_out,30,Dinner"]
+    second = bulk.import_csv(db_session, io.StringIO("\n".join(overlap)))
+    assert second.inserted == 1
+    assert second.duplicates == 3
+
+    assert db_session.query(models.Transaction).count() == 4
+    assert rollups.check(db_session) == []
@@ -0,0 +1,35 @@
+from datetime import date
+
+from sqlalchemy import func, text
+
+from app.core import models
+
+
+def explain(db, query):
+    sql = query.statement.compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+    rows = db.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return " | ".join(row[-1] for row in rows)
+
+
+def test_month_list_uses_date_index(db_session):
+    q = (
+        db_session.query(models.Transaction)
+        .filter(
+            models.Transaction.account_id == models.DEFAULT_ACCOUNT,
+            models.Transaction.date.between(date(2025, 9, 1), date(2025, 9, 30)),
+        )
+        .order_by(models.Transaction.date.desc())
+    )
+    plan = explain(db_session, q)
+    assert "ix_transactions_account_date_type" in plan
+    assert "SCAN transactions" not in plan
+
+
+def test_month_sum_uses_covering_index(db_session):
+    q = db_session.query(func.coalesce(func.sum(models.Transaction.amount_cents), 0)).filter(
+        models.Transaction.account_id == models.DEFAULT_ACCOUNT,
+        models.Transaction.type == "expense",
+        models.Transaction.date.between(date(2025, 9, 1), date(2025, 9, 30)),
+    )
+    plan = explain(db_session, q)
+    assert "USING COVERING INDEX ix_transactions_account_date_type_amount" in plan
@@ -0,0 +1,113 @@
+import asyncio
+
+from app.core import config, live
+
+
+def _run(scenario):
+    return asyncio.run(asyncio.wait_for(scenario(), 5))
+
+
+def test_slow_subscriber_gets_one_reload(monkeypatch):
+    monkeypatch.setattr(config, "LIVE_QUEUE_SIZE", 2)
+
+    async def scenario():
+        sub = live.subscribe("1:2025-09")
+        try:
+            for i in range(5):
+                live.publish("1:2025-09", {"op": "delete", "id": i})
+            live.publish("1:2025-10", {"op": "delete", "id": 99})
+            await asyncio.sleep(0)
+            events = [sub.queue.get_nowait() for _ in range(sub.queue.qsize())]
+            assert events == [live.RELOAD]
+        finally:
+            live.unsubscribe(sub)
+        assert not live.watching("1:2025-09")
+
+    _run(scenario)
+
+
+def test_stream_formats_events_and_keeps_alive(monkeypatch):
+    monkeypatch.setattr(config, "LIVE_KEEPALIVE", 0.01)
+
+    async def scenario():
+        async def connected():
+            return False
+
+        body = live.stream("1:2025-09", connected)
+        assert await body.__anext__() == "retry: 3000\n\n"
+        live.publish("1:2025-09", {"op": "reload"})
+        assert await body.__anext__() == 'data: {"op":"reload"}\n\n'
+        assert await body.__anext__() == ": keepalive\n\n"
+        await body.aclose()
+        assert not live.watching("1:2025-09")
+
+    _run(scenario)
+
+
+def test_writes_push_row_deltas_and_totals(client):
+    def tx(**extra):
+        return client.post("/api/v1/transactions/", json={
+            "date": "2025-09-10", "type": "expense", "category": "groceries", "amount": 12.5, **extra,
+        })
+
+    async def scenario():
+        september, october = live.subscribe("1:2025-09"), live.subscribe("1:2025-10")
+        nxt = lambda sub: asyncio.wait_for(sub.queue.get(), 1)
+        try:
+            created = (await asyncio.to_thread(tx, description="Market")).json()
+            event = await nxt(september)
+            assert event["op"] == "upsert"
+            assert event["row"] == {**created, "amount": "12.50"}
+            assert event["totals"] == {"income": 0.0, "expenses": 12.5, "net": -12.5}
+            assert event["budgets"] == []
+
+            # Moving a row to another month removes it from the first and adds it to the second
+            await asyncio.to_thread(client.put, f"/api/v1/transactions/{created['id']}", json={"date": "2025-10-01"})
+            assert await nxt(september) == {"op": "delete", "id": created["id"], "totals": {
+                "income": 0.0, "expenses": 0.0, "net": 0.0,
+            }, "budgets": []}
+            assert (await nxt(october))["row"]["date"] == "2025-10-01"
+
+            await asyncio.to_thread(client.delete, f"/api/v1/transactions/{created['id']}")
+            assert (await nxt(october))["op"] == "delete"
+
+            await asyncio.to_thread(client.post, "/api/v1/transactions/bulk", json=[
+                {"date": "2025-09-01", "type": "income", "category": "salary", "amount": 1},
+            ])
+            assert await nxt(september) == live.RELOAD
+            assert await nxt(october) == live.RELOAD
+        finally:
+            live.unsubscribe(september)
+            live.unsubscribe(october)
+
+    _run(scenario)
+
+
+def test_writes_push_budget_status(client):
+    async def scenario():
+        september = live.subscribe("1:2025-09")
+        nxt = lambda: asyncio.wait_for(september.queue.get(), 1)
+        try:
+            await asyncio.to_thread(client.post, "/api/v1/budgets/", json={"category": "groceries", "limit": 10})
+            # The dashboard has to render the new budget's row
+            assert await nxt() == live.RELOAD
+
+            await asyncio.to_thread(client.post, "/api/v1/transactions/", json={
+                "date": "2025-09-10", "type": "expense", "category": "groceries", "amount": 12.5,
+            })
+            [groceries] = (await nxt())["budgets"]
+            assert groceries == {
+                "category": "groceries", "limit": "10.00", "spent": "12.50", "remaining": "-2.50", "over": True,
+            }
+        finally:
+            live.unsubscribe(september)
+
+    _run(scenario)
+    page = client.get("/", params={"month": "2025-09"}).text
+    assert 'data-budget="groceries"' in page and 'data-budget-field="spent"' in page
+
+
+def test_pages_open_the_event_stream(client):
+    page = client.get("/", params={"month": "2025-09"}).text
+    assert 'data-live-month="2025-09"' in page
+    assert "new EventSource" in page
@@ -0,0 +1,55 @@
+import logging
+
+import pytest
+from sqlalchemy import create_engine, event
+
+from app.core import config, metrics
+
+
+@pytest.fixture()
+def instrumented(client, engine, monkeypatch):
+    monkeypatch.setattr(metrics, "enabled", False)
+    metrics.enable(engine)
+    return client
+
+
+def test_metrics_disabled_by_default(client):
+    assert "server-timing" not in client.get("/healthz").headers
+    assert client.get("/metrics").status_code == 404
+
+
+def test_server_timing_and_prometheus_output(instrumented):
+    client = instrumented
+    client.post("/api/v1/transactions/", json={
+        "date": "2025-09-01", "type": "income", "category": "salary", "amount": 10,
+    })
+    res = client.get("/api/v1/transactions/", params={"month": "2025-09"})
+    timing = res.headers["server-timing"]
+    assert timing.startswith("db;dur=") and "app;dur=" in timing
+    assert "3 queries" in timing  # due recurring rules, month version, then the rows
+
+    body = client.get("/metrics").text
+    labels = 'method="GET",route="/api/v1/transactions/",status="200"'
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}}' in body
+    assert f'http_request_db_queries_bucket{{{labels},le="2"}}' in body
+    assert "cache_hits_total" in body
+
+
+def test_n_plus_one_is_logged(instrumented, monkeypatch, caplog):
+    monkeypatch.setattr(config, "N_PLUS_ONE_THRESHOLD", 1)
+    with caplog.at_level(logging.WARNING, logger="app.core.metrics"):
+        instrumented.post("/api/v1/transactions/", json={
+            "date": "2025-09-01", "type": "income", "category": "salary", "amount": 10,
+        })
+    assert any("Possible N+1: POST /api/v1/transactions/" in r.getMessage() for r in caplog.records)
+
+
+def test_instrument_marks_each_engine():
+    for _ in range(3):
+        # Engines come and go, e.g. through the per-account engine cache
+        engine = create_engine("sqlite://")
+        metrics.instrument(engine)
+        metrics.instrument(engine)
+        assert event.contains(engine, "before_cursor_execute", metrics._before_cursor_execute)
+        engine.dispose()
+        del engine
@@ -0,0 +1,137 @@
+from datetime import date
+
+from app.core import accounts, config, models, recurring, rollups
+
+
+def _rule(client, **extra):
+    body = {
+        "type": "income", "category": "salary", "amount": 5000, "description": "Salary",
+        "frequency": "monthly", "start_date": "2025-01-31", **extra,
+    }
+    res = client.post("/api/v1/recurring/", json=body)
+    assert res.status_code == 201, res.text
+    return res.json()
+
+
+def _dates(client, month):
+    return sorted(t["date"] for t in client.get("/api/v1/transactions/", params={"month": month}).json())
+
+
+def test_occurrences():
+    def rule(frequency, start, every=1, end=None):
+        return models.RecurringRule(frequency=frequency, every=every, start_date=start, end_date=end)
+
+    monthly = rule("monthly", date(2025, 1, 31))
+    assert list(recurring.occurrences(monthly, None, date(2025, 4, 30))) == [
+        date(2025, 1, 31), date(2025, 2, 28), date(2025, 3, 31), date(2025, 4, 30),
+    ]
+    assert list(recurring.occurrences(monthly, date(2025, 2, 28), date(2025, 3, 31))) == [date(2025, 3, 31)]
+    quarterly = rule("monthly", date(2025, 1, 15), every=3, end=date(2025, 12, 1))
+    assert [d.month for d in recurring.occurrences(quarterly, date(2025, 5, 1), date(2026, 12, 31))] == [7, 10]
+    fortnightly = rule("weekly", date(2025, 1, 6), every=2)
+    assert list(recurring.occurrences(fortnightly, date(2025, 1, 20), date(2025, 2, 3))) == [date(2025, 2, 3)]
+    every_ten_days = rule("custom", date(2025, 1, 1), every=10)
+    assert len(list(recurring.occurrences(every_ten_days, None, date(2025, 12, 31)))) == 37
+
+
+def test_occurrences_stop_at_the_last_date(client):
+    def rule(frequency, start, every=1):
+        return models.RecurringRule(frequency=frequency, every=every, start_date=start)
+
+    assert list(recurring.occurrences(rule("monthly", date(9999, 11, 30)), None, date.max)) == [
+        date(9999, 11, 30), date(9999, 12, 30),
+    ]
+    assert list(recurring.occurrences(rule("weekly", date(9999, 12, 20)), None, date.max)) == [
+        date(9999, 12, 20), date(9999, 12, 27),
+    ]
+    assert list(recurring.occurrences(rule("custom", date(9999, 12, 31)), None, date.max)) == [date(9999, 12, 31)]
+
+    _rule(client, start_date="9999-11-30")
+    _rule(client, type="expense", category="groceries", amount=20, frequency="weekly", start_date="9999-12-20")
+    res = client.post("/api/v1/recurring/materialize", params={"through": "9999-12"})
+    assert res.status_code == 200, res.text
+    assert _dates(client, "9999-12") == ["9999-12-20", "9999-12-27", "9999-12-30"]
+
+
+def test_listing_a_month_materializes_it(client, db_session):
+    salary = _rule(client)
+    _rule(client, type="expense", category="groceries", amount=20, frequency="weekly",
+          start_date="2025-03-03", end_date="2025-03-17")
+
+    assert _dates(client, "2025-03") == ["2025-03-03", "2025-03-10", "2025-03-17", "2025-03-31"]
+    # Earlier months were filled in the same pass, later ones not yet
+    assert _dates(client, "2025-02") == ["2025-02-28"]
+    assert db_session.query(models.Transaction).count() == 6
+    assert client.get("/api/v1/summary", params={"month": "2025-01"}).json()["income"] == 5000.0
+    assert rollups.check(db_session) == []
+
+    # A row deleted by hand stays deleted; listing again writes nothing
+    feb = client.get("/api/v1/transactions/", params={"month": "2025-02"}).json()[0]
+    assert client.delete(f"/api/v1/transactions/{feb['id']}").status_code == 204
+    assert _dates(client, "2025-02") == []
+    assert db_session.query(models.Transaction).count() == 5
+
+    # Changes apply to occurrences not created yet
+    client.put(f"/api/v1/recurring/{salary['id']}", json={"amount": 5500, "end_date": "2025-04-30"})
+    assert client.get("/api/v1/summary", params={"month": "2025-04"}).json()["income"] == 0.0
+    assert _dates(client, "2025-04") == ["2025-04-30"]
+    assert client.get("/api/v1/summary", params={"month": "2025-04"}).json()["income"] == 5500.0
+    assert _dates(client, "2025-05") == []
+    listed, = [r for r in client.get("/api/v1/recurring/").json() if r["id"] == salary["id"]]
+    assert listed["materialized_through"] == "2025-04-30"
+
+    assert client.delete(f"/api/v1/recurring/{salary['id']}").status_code == 204
+    assert _dates(client, "2025-04") == ["2025-04-30"]
+
+
+def test_listing_stops_at_the_horizon(client, db_session, monkeypatch):
+    _rule(client, frequency="custom", start_date="2025-01-01")
+    monkeypatch.setattr(config, "RECURRING_MONTHS_AHEAD", 1)
+    horizon = recurring.horizon()
+    assert horizon.month == (date.today().month % 12) + 1
+
+    far = f"{horizon.year + 200}-01"
+    assert client.get("/api/v1/transactions/", params={"month": far, "limit": 1}).json() == []
+    assert db_session.query(models.Transaction).count() == 0
+    assert db_session.query(models.RecurringRule.materialized_through).scalar() is None
+
+    # The horizon month itself is filled in, and nothing after it
+    client.get("/api/v1/transactions/", params={"month": horizon.strftime("%Y-%m"), "limit": 1})
+    assert db_session.query(models.RecurringRule.materialized_through).scalar() == horizon
+
+
+def test_materialize_is_one_batch_across_accounts(client, db_session):
+    _rule(client)
+    other, _ = accounts.create_account(db_session, "Other household")
+    accounts.bind(db_session, other.id)
+    salary_id = db_session.query(models.Category.id).filter_by(account_id=other.id, name="salary").scalar()
+    db_session.add(models.RecurringRule(
+        account_id=other.id, type="income", category_id=salary_id, amount_cents=100,
+        frequency="monthly", start_date=date(2025, 1, 1),
+    ))
+    db_session.commit()
+    accounts.bind(db_session, accounts.DEFAULT_ACCOUNT)
+
+    assert recurring.materialize(db_session, date(2025, 12, 31), all_accounts=True) == 24
+    assert recurring.materialize(db_session, date(2025, 12, 31), all_accounts=True) == 0
+    assert rollups.check(db_session) == []
+    assert rollups.check(accounts.bind(db_session, other.id)) == []
+
+    # Rules that were already materialized are picked up where they stopped
+    accounts.bind(db_session, accounts.DEFAULT_ACCOUNT)
+    res = client.post("/api/v1/recurring/materialize", params={"through": "2026-02"})
+    assert res.json() == {"inserted": 2}
+
+
+def test_rule_validation(client):
+    assert client.post("/api/v1/recurring/", json={
+        "type": "income", "category": "bonus", "amount": 1, "frequency": "monthly", "start_date": "2025-01-01",
+    }).status_code == 422
+    assert client.post("/api/v1/recurring/", json={
+        "type": "income", "category": "salary", "amount": 1, "frequency": "yearly", "start_date": "2025-01-01",
+    }).status_code == 422
+    rule = _rule(client, start_date="2025-06-01")
+    assert client.put(f"/api/v1/recurring/{rule['id']}", json={"end_date": "2025-01-01"}).status_code == 422
+    assert client.put("/api/v1/recurring/999", json={"amount": 1}).status_code == 404
+    salary_id = [c["id"] for c in client.get("/api/v1/categories").json() if c["name"] == "salary"][0]
+    assert client.delete(f"/api/v1/categories/{salary_id}").status_code == 409
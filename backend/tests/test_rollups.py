@@ -0,0 +1,59 @@
+from app.core import models, rollups
+
+
+def _summary(client, month):
+    return client.get("/api/v1/summary", params={"month": month}).json()
+
+
+def test_rollups_follow_writes(client, db_session):
+    tx = client.post("/api/v1/transactions/", json={
+        "date": "2025-09-12",
+        "type": "expense",
+        "category": "groceries",
+        "amount": 40,
+    }).json()
+    assert _summary(client, "2025-09")["expenses"] == 40.0
+
+    # Move the row to another month and category
+    client.put(f"/api/v1/transactions/{tx['id']}", json={"date": "2025-10-02", "category": "eating_out"})
+    assert _summary(client, "2025-09")["expenses"] == 0.0
+    assert _summary(client, "2025-10")["categories"] == {"eating_out": 40.0}
+    assert rollups.check(db_session) == []
+
+    client.delete(f"/api/v1/transactions/{tx['id']}")
+    assert _summary(client, "2025-10")["expenses"] == 0.0
+    assert db_session.query(models.MonthlyRollup).count() == 0
+
+
+def test_rebuild_repairs_drift(client, db_session):
+    client.post("/api/v1/transactions/", json={
+        "date": "2025-09-01",
+        "type": "income",
+        "category": "salary",
+        "amount": 1000,
+    })
+    db_session.query(models.MonthlyRollup).update({"count": 5})
+    db_session.commit()
+    assert len(rollups.check(db_session)) == 1
+    etag = client.get("/api/v1/summary", params={"month": "2025-09"}).headers["ETag"]
+
+    assert rollups.rebuild(db_session) == 1
+    assert rollups.check(db_session) == []
+    assert _summary(client, "2025-09")["income"] == 1000.0
+    # Responses from before the rebuild are not revalidated
+    res = client.get("/api/v1/summary", params={"month": "2025-09"}, headers={"If-None-Match": etag})
+    assert res.status_code == 200
+
+
+def test_amounts_are_stored_as_cents(client, db_session):
+    for amount in ("0.10", "0.20", "19.999"):
+        res = client.post("/api/v1/transactions/", json={
+            "date": "2025-09-03",
+            "type": "expense",
+            "category": "groceries",
+            "amount": amount,
+        })
+    assert res.json()["amount"] == "20.00"
+    assert sorted(tx.amount_cents for tx in db_session.query(models.Transaction)) == [10, 20, 2000]
+    assert db_session.query(models.MonthlyRollup.total_cents).scalar() == 2030
+    assert _summary(client, "2025-09")["expenses"] == 20.3
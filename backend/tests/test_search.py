@@ -0,0 +1,52 @@
+def test_search_ranks_and_paginates(client, add_tx):
+    add_tx(description="Weekly groceries at the market", date="2024-01-05")
+    add_tx(description="Market market market", date="2025-09-01")
+    add_tx(description="Coffee with friends")
+    add_tx(description=None)
+
+    res = client.get("/api/v1/transactions/search", params={"q": "market"})
+    assert res.status_code == 200
+    assert [r["description"] for r in res.json()] == ["Market market market", "Weekly groceries at the market"]
+
+    # Every word must match, each as a prefix; punctuation is not query syntax
+    hits = client.get("/api/v1/transactions/search", params={"q": 'groc "mark*'}).json()
+    assert [r["description"] for r in hits] == ["Weekly groceries at the market"]
+    assert client.get("/api/v1/transactions/search", params={"q": "()"}).json() == []
+
+    first = client.get("/api/v1/transactions/search", params={"q": "market", "limit": 1})
+    assert len(first.json()) == 1 and first.headers["X-Next-Offset"] == "1"
+    second = client.get("/api/v1/transactions/search", params={"q": "market", "limit": 1, "offset": 1})
+    assert "X-Next-Offset" not in second.headers
+
+
+def test_search_ranks_every_match_and_pages_without_repeats(client):
+    rows = [{"date": "2020-01-01", "type": "expense", "category": "groceries", "amount": 1,
+             "description": "rent rent rent"}]
+    rows += [
+        {"date": "2025-09-01", "type": "expense", "category": "groceries", "amount": 1,
+         "description": f"rent and assorted other household things {i}"}
+        for i in range(40)
+    ]
+    assert client.post("/api/v1/transactions/bulk", json=rows).json()["inserted"] == 41
+
+    seen, offset = [], 0
+    while offset is not None:
+        res = client.get("/api/v1/transactions/search", params={"q": "rent", "limit": 7, "offset": offset})
+        seen += [r["id"] for r in res.json()]
+        offset = res.headers.get("X-Next-Offset")
+    assert len(seen) == len(set(seen)) == 41
+    # The oldest row is the best match, so it leads the first page
+    first = client.get("/api/v1/transactions/search", params={"q": "rent", "limit": 1}).json()
+    assert first[0]["description"] == "rent rent rent"
+
+
+def test_search_follows_updates_and_deletes(client, add_tx):
+    add_tx(description="Bakery")
+    tx = client.get("/api/v1/transactions/search", params={"q": "bakery"}).json()[0]
+
+    client.put(f"/api/v1/transactions/{tx['id']}", json={"description": "Butcher"})
+    assert client.get("/api/v1/transactions/search", params={"q": "bakery"}).json() == []
+    assert len(client.get("/api/v1/transactions/search", params={"q": "butcher"}).json()) == 1
+
+    client.delete(f"/api/v1/transactions/{tx['id']}")
+    assert client.get("/api/v1/transactions/search", params={"q": "butcher"}).json() == []
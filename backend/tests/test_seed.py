@@ -0,0 +1,51 @@
+import pytest
+
+from app.core import models, rollups
+from scripts import seed
+
+
+def _index_names(db):
+    return {
+        row[0] for row in db.connection().exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger') AND tbl_name = 'transactions'"
+        )
+    }
+
+
+def test_generate_rows_is_deterministic():
+    months = ["2025-01", "2025-02", "2025-03"]
+    rows = list(seed.generate_rows(1000, months, seed=7))
+    assert len(rows) == 1000
+    assert rows == list(seed.generate_rows(1000, months, seed=7))
+    assert {row[0].strftime("%Y-%m") for row in rows} == set(months)
+
+
+def test_load_rows_keeps_rollups_and_indexes(client, db_session):
+    months = ["2025-08", "2025-09"]
+    assert seed.load_rows(db_session, seed.generate_rows(500, months), chunk_size=64) == 500
+    assert db_session.query(models.Transaction).count() == 500
+    assert rollups.check(db_session) == []
+
+    assert {index.name for index in models.Transaction.__table__.indexes} <= _index_names(db_session)
+
+    summary = client.get("/api/v1/summary", params={"month": "2025-09"}).json()
+    assert summary["income"] == 11000.0
+
+
+def test_failed_load_restores_indexes(client, db_session):
+    def rows():
+        yield from seed.generate_rows(100, ["2025-09"])
+        raise RuntimeError("source went away")
+
+    with pytest.raises(RuntimeError):
+        seed.load_rows(db_session, rows(), chunk_size=64)
+
+    names = _index_names(db_session)
+    assert {index.name for index in models.Transaction.__table__.indexes} <= names
+    assert "transactions_fts_ai" in names
+    # The committed chunk was indexed for search; the rest was rolled back
+    assert db_session.query(models.Transaction).count() == 64
+    assert rollups.check(db_session) == []
+    description = db_session.query(models.Transaction.description).first()[0]
+    hits = client.get("/api/v1/transactions/search", params={"q": description.split()[0], "limit": 500})
+    assert hits.json()
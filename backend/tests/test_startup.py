@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+from benchmarks.bench_startup import parse_importtime
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+# Generous for slow CI machines; a worker is expected to import well under a second
+IMPORT_BUDGET_MS = int(os.getenv("IMPORT_BUDGET_MS", "1500"))
+
+PROBE = """
+import sys
+import app.main
+from app.core import database
+print(database._engine is None, database._async_engine is None, "jinja2" in sys.modules, "numpy" in sys.modules)
+"""
+
+
+def _run(*args, db_url):
+    env = {**os.environ, "DATABASE_URL": db_url, "PYTHONPATH": BACKEND_DIR}
+    return subprocess.run(
+        [sys.executable, *args], cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def test_import_is_lazy(db_url):
+    assert _run("-c", PROBE, db_url=db_url).stdout.split() == ["True", "True", "False", "False"]
+
+
+def test_import_time_budget(db_url):
+    result = _run("-X", "importtime", "-c", "import app.main", db_url=db_url)
+    cumulative = dict((name.strip(), us) for us, name in parse_importtime(result.stderr))
+    assert cumulative["app.main"] / 1000 < IMPORT_BUDGET_MS
@@ -1,3 +1,6 @@
+from sqlalchemy import event
+
+
 def test_dashboard_renders(client):
     # seed one tx
     client.post("/api/v1/transactions/", json={
@@ -29,3 +32,29 @@ def test_transactions_page_renders(client):
     assert "Transactions" in html or "Income:" in html
     assert "groceries" in html or "Expenses:" in html
 
+
+def test_month_fragment_cached_until_write(client, engine):
+    client.post("/api/v1/transactions/", json={
+        "date": "2025-09-15",
+        "type": "expense",
+        "category": "groceries",
+        "amount": 12.25,
+    })
+    assert "12.25" in client.get("/", params={"month": "2025-09"}).text
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    for path in ("/", "/transactions"):
+        client.get(path, params={"month": "2025-09"})
+    client.get("/", params={"month": "2025-09"})
+    # /transactions reuses the month data loaded for the dashboard; later renders hit the fragment cache
+    assert not any("FROM transactions" in sql for sql in statements)
+
+    client.post("/api/v1/transactions/", json={
+        "date": "2025-09-16",
+        "type": "expense",
+        "category": "eating_out",
+        "amount": 7.5,
+    })
+    html = client.get("/", params={"month": "2025-09"}).text
+    assert "7.50" in html and "19.75" in html